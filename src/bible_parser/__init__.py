@@ -3,21 +3,83 @@ Bible Parser - A Python package for parsing Bible texts in various XML formats.
 
 This package provides tools to parse Bible texts in USFX, OSIS, and ZEFANIA formats
 with both direct parsing and database-backed approaches.
+
+The public names below are imported on first access, so ``import bible_parser``
+loads no parser, SQLite or XML modules until something that needs them is used.
 """
 
 __version__ = "0.1.0"
 
-from bible_parser.models import Verse, Book, Chapter, BibleReference, VerseRange
-from bible_parser.errors import (
-    BibleParserException,
-    ParseError,
-    FormatDetectionError,
-    ParserUnavailableError,
-    ReferenceFormatError,
-)
-from bible_parser.bible_parser import BibleParser
-from bible_parser.bible_repository import BibleRepository
-from bible_parser.reference_formatter import BibleReferenceFormatter
+from typing import TYPE_CHECKING, Any, List
+
+# Public name to the module defining it
+_EXPORTS = {
+    "Verse": "bible_parser.models",
+    "Book": "bible_parser.models",
+    "Chapter": "bible_parser.models",
+    "BibleReference": "bible_parser.models",
+    "VerseRange": "bible_parser.models",
+    "AlignedVerse": "bible_parser.models",
+    "BibleParserException": "bible_parser.errors",
+    "ParseError": "bible_parser.errors",
+    "FormatDetectionError": "bible_parser.errors",
+    "ParserUnavailableError": "bible_parser.errors",
+    "ReferenceFormatError": "bible_parser.errors",
+    "VersificationError": "bible_parser.errors",
+    "BibleParser": "bible_parser.bible_parser",
+    "BibleRepository": "bible_parser.bible_repository",
+    "SyncReport": "bible_parser.bible_repository",
+    "WordOccurrence": "bible_parser.concordance",
+    "MultiTranslationRepository": "bible_parser.multi_repository",
+    "TranslationView": "bible_parser.multi_repository",
+    "BibleReferenceFormatter": "bible_parser.reference_formatter",
+    "CorpusReport": "bible_parser.corpus",
+    "IngestResult": "bible_parser.corpus",
+    "ingest_corpus": "bible_parser.corpus",
+    "Instrumentation": "bible_parser.instrumentation",
+    "MetricsRecorder": "bible_parser.instrumentation",
+    "VersificationMapper": "bible_parser.versification",
+    "normalize_book_id": "bible_parser.versification",
+}
+
+if TYPE_CHECKING:
+    from bible_parser.models import (
+        Verse, Book, Chapter, BibleReference, VerseRange, AlignedVerse
+    )
+    from bible_parser.errors import (
+        BibleParserException,
+        ParseError,
+        FormatDetectionError,
+        ParserUnavailableError,
+        ReferenceFormatError,
+        VersificationError,
+    )
+    from bible_parser.bible_parser import BibleParser
+    from bible_parser.bible_repository import BibleRepository, SyncReport
+    from bible_parser.concordance import WordOccurrence
+    from bible_parser.multi_repository import MultiTranslationRepository, TranslationView
+    from bible_parser.reference_formatter import BibleReferenceFormatter
+    from bible_parser.corpus import CorpusReport, IngestResult, ingest_corpus
+    from bible_parser.instrumentation import Instrumentation, MetricsRecorder
+    from bible_parser.versification import VersificationMapper, normalize_book_id
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # __import__ rather than importlib.import_module so -X importtime reports the module
+    value = getattr(__import__(module, fromlist=[name]), name)
+    # Cache it so later lookups skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including the not yet imported public names."""
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __all__ = [
     "Verse",
@@ -25,12 +87,25 @@ __all__ = [
     "Chapter",
     "BibleReference",
     "VerseRange",
+    "AlignedVerse",
     "BibleParserException",
     "ParseError",
     "FormatDetectionError",
     "ParserUnavailableError",
     "ReferenceFormatError",
+    "VersificationError",
     "BibleParser",
     "BibleRepository",
+    "SyncReport",
+    "WordOccurrence",
+    "MultiTranslationRepository",
+    "TranslationView",
     "BibleReferenceFormatter",
+    "CorpusReport",
+    "IngestResult",
+    "ingest_corpus",
+    "Instrumentation",
+    "MetricsRecorder",
+    "VersificationMapper",
+    "normalize_book_id",
 ]
@@ -0,0 +1,7 @@
+"""Run the bible-parser command with ``python -m bible_parser``."""
+
+import sys
+
+from bible_parser.cli import main
+
+sys.exit(main())
@@ -0,0 +1,30 @@
+"""Performance benchmarks for bible_parser.
+
+The suite generates full-size synthetic Bibles in every supported format and
+times parsing, database loading, verse lookups, full-text search and reference
+parsing. Results are written as JSON so two runs can be compared::
+
+    python -m bible_parser.benchmarks run --output baseline.json
+    python -m bible_parser.benchmarks run --output current.json
+    python -m bible_parser.benchmarks compare baseline.json current.json --threshold 0.1
+"""
+
+from bible_parser.benchmarks.runner import (
+    BenchmarkResult,
+    Comparison,
+    compare_results,
+    load_results,
+    print_results,
+    run_benchmarks,
+    save_results,
+)
+
+__all__ = [
+    "BenchmarkResult",
+    "Comparison",
+    "compare_results",
+    "load_results",
+    "print_results",
+    "run_benchmarks",
+    "save_results",
+]
@@ -0,0 +1,103 @@
+"""Command-line runner for the benchmark suite."""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from bible_parser.bible_repository import BibleRepository
+from bible_parser.benchmarks.runner import (
+    OVERHEAD_CALLS,
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    print_results,
+    run_benchmarks,
+    save_results,
+)
+from bible_parser.synthetic import FORMATS
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmark CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code: 0 on success, 1 if a comparison found regressions.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bible_parser.benchmarks",
+        description="Benchmark bible_parser on synthetic Bibles.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the suite")
+    run.add_argument("--output", "-o", help="write results as JSON to this file")
+    run.add_argument(
+        "--formats", nargs="+", default=list(FORMATS), type=str.upper, choices=FORMATS,
+        help="formats to benchmark (default: all)",
+    )
+    run.add_argument(
+        "--schemas", nargs="+", default=list(BibleRepository.SCHEMAS),
+        choices=BibleRepository.SCHEMAS,
+        help="database schemas to benchmark lookups against (default: all)",
+    )
+    run.add_argument("--repeat", type=int, default=5, help="timed runs per benchmark")
+    run.add_argument("--lookups", type=int, default=1000, help="operations per lookup run")
+    run.add_argument(
+        "--overhead-calls", type=int, default=OVERHEAD_CALLS,
+        help="get_verse() calls per get_verse_overhead run",
+    )
+    run.add_argument("--books", type=int, default=66, help="books per synthetic Bible")
+    run.add_argument("--chapters", type=int, help="chapters per book (default: canonical)")
+    run.add_argument("--verses", type=int, help="verses per chapter (default: varied)")
+    run.add_argument("--seed", type=int, default=0, help="seed for generated data")
+    run.add_argument("--workdir", help="directory for temporary files")
+
+    compare = commands.add_parser("compare", help="compare two result files")
+    compare.add_argument("baseline", help="results of the reference run")
+    compare.add_argument("current", help="results of the run under test")
+    compare.add_argument(
+        "--threshold", type=float, default=0.10,
+        help="allowed slowdown per benchmark as a fraction (default: 0.10)",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        size = {"books": args.books, "chapters": args.chapters, "verses": args.verses}
+
+        def progress(result: BenchmarkResult) -> None:
+            print_results([result])
+            sys.stdout.flush()
+
+        data = run_benchmarks(
+            formats=args.formats,
+            repeat=args.repeat,
+            lookups=args.lookups,
+            overhead_calls=args.overhead_calls,
+            workdir=args.workdir,
+            seed=args.seed,
+            progress=progress,
+            schemas=args.schemas,
+            **{key: value for key, value in size.items() if value is not None},
+        )
+        if args.output:
+            save_results(data, args.output)
+        return 0
+
+    comparisons = compare_results(
+        load_results(args.baseline), load_results(args.current), threshold=args.threshold
+    )
+    for comparison in comparisons:
+        print(comparison)
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) slower than the {args.threshold:.0%} threshold")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
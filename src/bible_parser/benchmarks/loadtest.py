@@ -0,0 +1,231 @@
+"""Load test for the HTTP query service (bible_parser.server).
+
+Serves a database on a free localhost port (or targets a running server with
+--url), then replays a seeded mix of lookup, range, bulk and search requests
+from several threads over keep-alive connections and reports throughput and
+latency percentiles::
+
+    python -m bible_parser.benchmarks.loadtest bible.db --requests 20000 --concurrency 8
+    python -m bible_parser.benchmarks.loadtest bible.db --revalidate
+
+With --revalidate, clients send If-None-Match with the ETag they last received
+for each path, so repeated requests measure the 304 Not Modified path.
+"""
+
+import argparse
+import http.client
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import quote, urlsplit
+
+from bible_parser.bible_repository import BibleRepository
+from bible_parser.instrumentation import Histogram
+
+
+@dataclass
+class LoadTestResult:
+    """Outcome of a load test run.
+
+    Attributes:
+        requests: Requests sent.
+        seconds: Wall time of the run.
+        latency: Per-request latency histogram.
+        statuses: Response count by HTTP status.
+    """
+
+    requests: int = 0
+    seconds: float = 0.0
+    latency: Histogram = field(default_factory=Histogram)
+    statuses: Dict[int, int] = field(default_factory=dict)
+
+    @property
+    def requests_per_second(self) -> float:
+        """Throughput of the run."""
+        return self.requests / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        statuses = ", ".join(
+            f"{status}: {count}" for status, count in sorted(self.statuses.items())
+        )
+        return (
+            f"{self.requests} requests in {self.seconds:.2f}s "
+            f"({self.requests_per_second:,.0f} req/s)  "
+            f"p50 {self.latency.percentile(50) * 1e6:,.0f} us  "
+            f"p90 {self.latency.percentile(90) * 1e6:,.0f} us  "
+            f"p99 {self.latency.percentile(99) * 1e6:,.0f} us  "
+            f"[{statuses}]"
+        )
+
+
+def request_mix(database: str, count: int = 500, seed: int = 0) -> List[str]:
+    """Build a seeded list of request paths against a database's content.
+
+    Args:
+        database: Database the server answers from.
+        count: Number of distinct paths.
+        seed: Seed for the choice of references.
+
+    Returns:
+        Paths mixing /range (rest of a chapter), /bulk (scattered verses),
+        /lookup (references by book title), /search and /books, roughly 3:3:2:1:1.
+    """
+    rng = random.Random(seed)
+    with BibleRepository() as repository:
+        repository.initialize(database, read_only=True)
+        books = repository.get_books()
+        titles = {book.id: book.title for book in books}
+        outlines = {book.id: repository.get_book_outline(book.id) for book in books}
+        words = [
+            word
+            for verse in repository.get_verses_bulk(
+                [(book_id, 1, 1) for book_id in list(outlines)[:20]]
+            )
+            if verse is not None
+            for word in verse.text.split()
+            if word.isalpha() and len(word) > 3
+        ] or ["the"]
+
+    def reference() -> str:
+        book_id = rng.choice(list(outlines))
+        chapter = rng.choice(list(outlines[book_id]))
+        return f"{book_id}.{chapter}.{rng.randint(1, outlines[book_id][chapter])}"
+
+    paths = []
+    for index in range(count):
+        kind = index % 10
+        if kind < 3:
+            book_id, chapter, verse = reference().split(".")
+            paths.append(f"/range?book={book_id}&chapter={chapter}&start={verse}")
+        elif kind < 6:
+            paths.append("/bulk?refs=" + ",".join(reference() for _ in range(rng.randint(2, 20))))
+        elif kind < 8:
+            book_id, chapter, verse = reference().split(".")
+            paths.append("/lookup?ref=" + quote(f"{titles[book_id]} {chapter}:{verse}"))
+        elif kind < 9:
+            paths.append(f"/search?q={quote(rng.choice(words))}&limit=20")
+        else:
+            paths.append("/books")
+    return paths
+
+
+def run_load_test(
+    url: str,
+    paths: List[str],
+    requests: int = 10_000,
+    concurrency: int = 8,
+    revalidate: bool = False,
+    seed: int = 0,
+) -> LoadTestResult:
+    """Send requests to a server from concurrent keep-alive connections.
+
+    Args:
+        url: Base URL of the server (e.g., 'http://127.0.0.1:8000').
+        paths: Request paths to draw from.
+        requests: Total number of requests.
+        concurrency: Number of client threads, each with its own connection.
+        revalidate: Send If-None-Match with each path's last ETag.
+        seed: Seed for the order in which paths are drawn.
+
+    Returns:
+        A LoadTestResult.
+    """
+    parts = urlsplit(url)
+    result = LoadTestResult(requests=requests)
+    lock = threading.Lock()
+    etags: Dict[str, str] = {}
+
+    def client(worker: int, count: int) -> None:
+        rng = random.Random(seed * 1000 + worker)
+        connection = http.client.HTTPConnection(parts.hostname, parts.port)
+        latencies = []
+        statuses: Dict[int, int] = {}
+        try:
+            for _ in range(count):
+                path = rng.choice(paths)
+                headers = {}
+                if revalidate and path in etags:
+                    headers["If-None-Match"] = etags[path]
+                start = time.perf_counter()
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                latencies.append(time.perf_counter() - start)
+                statuses[response.status] = statuses.get(response.status, 0) + 1
+                etag = response.getheader("ETag")
+                if etag is not None:
+                    etags[path] = etag
+        finally:
+            connection.close()
+        with lock:
+            for latency in latencies:
+                result.latency.record(latency)
+            for status, hits in statuses.items():
+                result.statuses[status] = result.statuses.get(status, 0) + hits
+
+    shares = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(client, i, share) for i, share in enumerate(shares)]:
+            future.result()
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the load test CLI.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code: 0 if every response was 200 or 304, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bible_parser.benchmarks.loadtest",
+        description="Load test the bible_parser HTTP query service on localhost.",
+    )
+    parser.add_argument("database", help="database to serve and draw references from")
+    parser.add_argument("--url", help="test a running server instead of starting one")
+    parser.add_argument("--requests", type=int, default=10_000, help="total requests")
+    parser.add_argument("--concurrency", type=int, default=8, help="client threads")
+    parser.add_argument("--paths", type=int, default=500, help="distinct request paths")
+    parser.add_argument("--pool-size", type=int, default=4, help="server connection pool size")
+    parser.add_argument("--cache-size", type=int, default=1024, help="server response cache size")
+    parser.add_argument(
+        "--revalidate", action="store_true", help="send If-None-Match with known ETags"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for the request mix")
+    args = parser.parse_args(argv)
+
+    paths = request_mix(args.database, args.paths, args.seed)
+    if args.url:
+        result = run_load_test(
+            args.url, paths, args.requests, args.concurrency, args.revalidate, args.seed
+        )
+    else:
+        from bible_parser.server import BibleServer
+
+        with BibleServer(
+            args.database, port=0, pool_size=args.pool_size, cache_size=args.cache_size
+        ) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                result = run_load_test(
+                    server.url, paths, args.requests, args.concurrency, args.revalidate, args.seed
+                )
+            finally:
+                server.shutdown()
+                thread.join()
+    print(result)
+    return 0 if set(result.statuses) <= {200, 304} else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
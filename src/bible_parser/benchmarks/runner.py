@@ -0,0 +1,464 @@
+"""Benchmark runner, result files and regression comparison."""
+
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from bible_parser.bible_parser import BibleParser
+from bible_parser.bible_repository import BibleRepository
+from bible_parser.reference_formatter import BibleReferenceFormatter
+from bible_parser.synthetic import FORMATS, write_bible
+
+# Version of the JSON result layout
+RESULTS_VERSION = 1
+
+# Terms searched by the search_verses benchmark (all occur in synthetic text)
+SEARCH_TERMS = ("light", "mercy", "king AND israel", "spirit OR water", "glory", "faith")
+
+# Calls per run of the get_verse_overhead microbenchmark
+OVERHEAD_CALLS = 10_000
+
+# get_verse() lookups whose page reads are measured, each with a cold cache
+PAGE_SAMPLE = 100
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark.
+
+    Attributes:
+        name: Benchmark name (e.g., 'parse_books').
+        format: Source format for parser benchmarks, None otherwise.
+        operations: Operations performed per timed run (verses parsed,
+            lookups made, ...).
+        timings: Seconds taken by each timed run.
+        variant: Database schema for non-default layouts (e.g., 'clustered').
+        pages: Mean database pages read per operation with a cold cache,
+            where measured.
+    """
+
+    name: str
+    format: Optional[str]
+    operations: int
+    timings: List[float] = field(default_factory=list)
+    variant: Optional[str] = None
+    pages: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        """Unique key used to match results across runs."""
+        qualifiers = [part for part in (self.format, self.variant) if part]
+        return f"{self.name}[{','.join(qualifiers)}]" if qualifiers else self.name
+
+    @property
+    def best(self) -> float:
+        """Fastest run in seconds."""
+        return min(self.timings)
+
+    @property
+    def median(self) -> float:
+        """Median run in seconds."""
+        return statistics.median(self.timings)
+
+    @property
+    def ops_per_second(self) -> float:
+        """Operations per second of the median run."""
+        return self.operations / self.median if self.median > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the result to a JSON-serializable dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        """Create a result from a dictionary written by to_dict()."""
+        return cls(
+            name=data["name"],
+            format=data.get("format"),
+            operations=data["operations"],
+            timings=list(data["timings"]),
+            variant=data.get("variant"),
+            pages=data.get("pages"),
+        )
+
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        pages = f"  {self.pages:.1f} pages/op" if self.pages is not None else ""
+        return (
+            f"{self.key:<28} median {self.median * 1000:10.2f} ms  "
+            f"best {self.best * 1000:10.2f} ms  {self.ops_per_second:14,.0f} ops/s{pages}"
+        )
+
+
+@dataclass
+class Comparison:
+    """A benchmark compared between a baseline and a current run.
+
+    Attributes:
+        key: Benchmark key.
+        baseline: Median seconds per operation in the baseline.
+        current: Median seconds per operation in the current run.
+        threshold: Allowed slowdown as a fraction (0.10 = 10%).
+    """
+
+    key: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """Relative change in time per operation (positive is slower)."""
+        return self.current / self.baseline - 1 if self.baseline > 0 else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        """True if the slowdown exceeds the threshold."""
+        return self.change > self.threshold
+
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        status = "REGRESSION" if self.regressed else "ok"
+        return f"{self.key:<28} {self.change:+8.1%}  {status}"
+
+
+def _time_runs(
+    run: Callable[[Any], Any], repeat: int, setup: Optional[Callable[[], Any]] = None
+) -> List[float]:
+    """Time repeated calls of run, excluding the setup of each call."""
+    timings = []
+    for _ in range(repeat):
+        state = setup() if setup is not None else None
+        start = time.perf_counter()
+        run(state)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmarks(
+    formats: Sequence[str] = FORMATS,
+    repeat: int = 5,
+    lookups: int = 1000,
+    workdir: Optional[Union[str, Path]] = None,
+    seed: int = 0,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+    schemas: Sequence[str] = BibleRepository.SCHEMAS,
+    overhead_calls: int = OVERHEAD_CALLS,
+    **bible_options: int,
+) -> Dict[str, Any]:
+    """Run the benchmark suite against synthetic Bibles.
+
+    For every format, a synthetic Bible is generated and parse_books(),
+    parse_verses() and BibleRepository.initialize() are timed. Lookups
+    (get_verse, get_verses), search_verses and BibleReferenceFormatter.parse
+    are then timed against the database built from the first format, once
+    per schema, along with get_verse_overhead: the same verse fetched
+    overhead_calls times, so every page is cached and the time per call is
+    the repository's per-call overhead. Results for schemas other than
+    'standard' carry the schema as their variant, and initialize() is also
+    timed for them.
+
+    Args:
+        formats: Formats to benchmark.
+        repeat: Timed runs per benchmark.
+        lookups: Operations per timed run for the lookup benchmarks.
+        workdir: Directory for generated files (a temporary one by default).
+        seed: Seed for the synthetic Bibles and the lookup sequence.
+        progress: Optional callback invoked with each finished BenchmarkResult.
+        schemas: BibleRepository schemas to benchmark lookups against.
+        overhead_calls: get_verse() calls per run of get_verse_overhead.
+        **bible_options: Size options passed to synthetic.generate_bible()
+            (books, chapters, verses, words); full-size Bibles by default.
+
+    Returns:
+        Dictionary with 'version', 'meta' and 'results' entries, ready to be
+        written with save_results().
+    """
+    results: List[BenchmarkResult] = []
+
+    def record(result: BenchmarkResult) -> None:
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        tmp_path = Path(tmp)
+        databases = []
+        verse_counts = []
+
+        for format in formats:
+            source = write_bible(
+                tmp_path / f"bible_{format.lower()}.xml", format, seed=seed, **bible_options
+            )
+            verse_count = sum(1 for _ in BibleParser(source, format=format).verses)
+            verse_counts.append(verse_count)
+
+            # Loop variables are bound as defaults so every closure keeps its own
+            def parse_books(_: Any, source: Path = source, format: str = format) -> None:
+                _consume(BibleParser(source, format=format).books)
+
+            def parse_verses(_: Any, source: Path = source, format: str = format) -> None:
+                _consume(BibleParser(source, format=format).verses)
+
+            record(BenchmarkResult(
+                "parse_books", format, verse_count, _time_runs(parse_books, repeat),
+            ))
+            record(BenchmarkResult(
+                "parse_verses", format, verse_count, _time_runs(parse_verses, repeat),
+            ))
+
+            counter = iter(range(repeat))
+
+            def fresh_database(format: str = format, counter: Iterator[int] = counter) -> Path:
+                return tmp_path / f"{format.lower()}_{next(counter)}.db"
+
+            def initialize(database: Path, source: Path = source, format: str = format) -> None:
+                with BibleRepository(xml_path=source, format=format) as repo:
+                    repo.initialize(str(database))
+
+            record(BenchmarkResult(
+                "initialize", format, verse_count,
+                _time_runs(initialize, repeat, setup=fresh_database),
+            ))
+            databases.append(tmp_path / f"{format.lower()}_0.db")
+
+        for schema in schemas if formats else ():
+            variant = None if schema == "standard" else schema
+            if variant is None:
+                database = databases[0]
+            else:
+                source = tmp_path / f"bible_{formats[0].lower()}.xml"
+                counter = iter(range(repeat))
+
+                def fresh_schema_database(
+                    schema: str = schema, counter: Iterator[int] = counter
+                ) -> Path:
+                    return tmp_path / f"{schema}_{next(counter)}.db"
+
+                def initialize_schema(
+                    database: Path, source: Path = source, schema: str = schema
+                ) -> None:
+                    with BibleRepository(xml_path=source, format=formats[0], schema=schema) as repo:
+                        repo.initialize(str(database))
+
+                record(BenchmarkResult(
+                    "initialize", formats[0], verse_counts[0],
+                    _time_runs(initialize_schema, repeat, setup=fresh_schema_database),
+                    variant=variant,
+                ))
+                database = tmp_path / f"{schema}_0.db"
+
+            with BibleRepository() as repo:
+                repo.initialize(str(database))
+                for result in _lookup_benchmarks(repo, repeat, lookups, seed, overhead_calls):
+                    result.variant = variant
+                    record(result)
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": _environment(
+            repeat=repeat, lookups=lookups, seed=seed, schemas=list(schemas),
+            overhead_calls=overhead_calls, **bible_options
+        ),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def _consume(items: Iterable[Any]) -> None:
+    """Exhaust an iterator without keeping its items."""
+    for _ in items:
+        pass
+
+
+def _lookup_benchmarks(
+    repo: BibleRepository, repeat: int, lookups: int, seed: int, overhead_calls: int
+) -> Iterable[BenchmarkResult]:
+    """Time lookups, search and reference parsing against a loaded repository."""
+    rng = random.Random(seed)
+    chapters = repo._db.execute(
+        "SELECT b.id, v.chapter_num, MAX(v.verse_num) FROM verses v "
+        "JOIN books b ON b.key = v.book_key GROUP BY b.id, v.chapter_num"
+    ).fetchall()
+    picks = [chapters[rng.randrange(len(chapters))] for _ in range(lookups)]
+    verse_refs = [(book, chapter, rng.randint(1, last)) for book, chapter, last in picks]
+    chapter_refs = [(book, chapter) for book, chapter, _ in picks]
+    searches = max(1, lookups // 10)
+    # Verse, range and chapter references to books present in the database
+    titles = {book.id: book.title for book in repo.get_books()}
+    shapes = ("{} {}:{}", "{} {}:1-{}", "{} {}")
+    references = [
+        shapes[i % len(shapes)].format(titles[book], chapter, verse)
+        for i, (book, chapter, verse) in enumerate(verse_refs)
+    ]
+
+    def get_verse(_: Any) -> None:
+        for ref in verse_refs:
+            repo.get_verse(*ref)
+
+    def get_verse_overhead(_: Any) -> None:
+        ref = verse_refs[0]
+        for _ in range(overhead_calls):
+            repo.get_verse(*ref)
+
+    def get_verses(_: Any) -> None:
+        for ref in chapter_refs:
+            repo.get_verses(*ref)
+
+    def search_verses(_: Any) -> None:
+        for i in range(searches):
+            repo.search_verses(SEARCH_TERMS[i % len(SEARCH_TERMS)])
+
+    def reference_parse(_: Any) -> None:
+        for reference in references:
+            BibleReferenceFormatter.parse(reference, repo)
+
+    yield BenchmarkResult(
+        "get_verse", None, lookups, _time_runs(get_verse, repeat),
+        pages=_lookup_pages(repo, verse_refs[:PAGE_SAMPLE]),
+    )
+    yield BenchmarkResult(
+        "get_verse_overhead", None, overhead_calls, _time_runs(get_verse_overhead, repeat)
+    )
+    yield BenchmarkResult("get_verses", None, lookups, _time_runs(get_verses, repeat))
+    yield BenchmarkResult("search_verses", None, searches, _time_runs(search_verses, repeat))
+    yield BenchmarkResult("reference_parse", None, lookups, _time_runs(reference_parse, repeat))
+
+
+def _read_calls() -> Optional[int]:
+    """Read system calls made by this process so far, or None outside Linux."""
+    try:
+        with open("/proc/self/io") as io:
+            for line in io:
+                if line.startswith("syscr:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def _lookup_pages(
+    repo: BibleRepository, references: Sequence[Tuple[str, int, int]]
+) -> Optional[float]:
+    """Measure the database pages a get_verse() lookup reads with a cold cache.
+
+    Each reference is looked up on a newly opened read-only connection with
+    memory mapping off, so every page SQLite needs is read from the file with
+    one read call. Read calls are counted from /proc/self/io; the calls a query
+    on the already loaded schema makes (checking the file change counter as a
+    read transaction starts) are subtracted.
+
+    Args:
+        repo: The repository under test.
+        references: (book_id, chapter_num, verse_num) tuples to look up.
+
+    Returns:
+        Mean pages read per lookup, or None where /proc/self/io is unavailable.
+    """
+    if not references or _read_calls() is None:
+        return None
+    database = repo._db.execute("PRAGMA database_list").fetchone()[2]
+    pages = 0
+    for reference in references:
+        with BibleRepository() as cold:
+            cold.initialize(database, read_only=True)
+            cold._db.execute("PRAGMA mmap_size = 0")
+            cold._db.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            before = _read_calls()
+            cold._db.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            baseline = _read_calls()
+            cold.get_verse(*reference)
+            after = _read_calls()
+        pages += (after - baseline) - (baseline - before)
+    return pages / len(references)
+
+
+def _environment(**options: Any) -> Dict[str, Any]:
+    """Describe the machine and options of a run."""
+    from bible_parser import __version__
+
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "bible_parser": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "options": options,
+    }
+
+
+def save_results(data: Dict[str, Any], path: Union[str, Path]) -> None:
+    """Write benchmark results as JSON.
+
+    Args:
+        data: Results returned by run_benchmarks().
+        path: Output file path.
+    """
+    Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Union[str, Path]) -> List[BenchmarkResult]:
+    """Read benchmark results written by save_results().
+
+    Args:
+        path: Results file path.
+
+    Returns:
+        List of BenchmarkResult objects.
+    """
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [BenchmarkResult.from_dict(result) for result in data["results"]]
+
+
+def compare_results(
+    baseline: Iterable[BenchmarkResult],
+    current: Iterable[BenchmarkResult],
+    threshold: float = 0.10,
+) -> List[Comparison]:
+    """Compare two runs benchmark by benchmark.
+
+    Benchmarks are compared on median time per operation, so runs with
+    different lookup counts remain comparable. Benchmarks missing from either
+    run are skipped.
+
+    Args:
+        baseline: Results of the reference run.
+        current: Results of the run under test.
+        threshold: Allowed slowdown as a fraction (0.10 = 10%).
+
+    Returns:
+        Comparisons in the order of the current run.
+    """
+    baseline_by_key = {result.key: result for result in baseline}
+    comparisons = []
+    for result in current:
+        base = baseline_by_key.get(result.key)
+        if base is None:
+            continue
+        comparisons.append(Comparison(
+            key=result.key,
+            baseline=base.median / base.operations,
+            current=result.median / result.operations,
+            threshold=threshold,
+        ))
+    return comparisons
+
+
+def print_results(results: Iterable[BenchmarkResult], file: Any = None) -> None:
+    """Print a table of benchmark results.
+
+    Args:
+        results: Results to print.
+        file: Output stream (defaults to stdout).
+    """
+    for result in results:
+        print(result, file=file or sys.stdout)
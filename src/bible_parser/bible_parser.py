@@ -1,18 +1,35 @@
 """Main BibleParser class with automatic format detection."""
 
 import sys
+import time
+from io import BytesIO
 from pathlib import Path
-from typing import Union, Optional
+from typing import Any, BinaryIO, Dict, List, Tuple, Union, Optional
+from xml.etree.ElementTree import ParseError as XMLParseError
+
+from defusedxml import DefusedXmlException
+from defusedxml.ElementTree import DefusedXMLParser
 
 # Python 3.9+ uses collections.abc, Python 3.8 uses typing
 if sys.version_info >= (3, 9):
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 else:
-    from typing import Generator
+    from typing import Generator, Iterator
 
 from bible_parser.models import Book, Verse
 from bible_parser.parsers import UsfxParser, OsisParser, ZefaniaParser, BaseParser
+from bible_parser.parsers.base_parser import is_xml_text
 from bible_parser.errors import FormatDetectionError, ParserUnavailableError
+from bible_parser.export import ARROW_BATCH_SIZE, VERSE_COLUMNS, arrow_to_pandas, rows_to_arrow
+from bible_parser.instrumentation import Instrumentation
+from bible_parser.sources import (
+    ArchiveMember,
+    Source,
+    is_rewindable,
+    list_archive_members,
+    open_source,
+    replay_prefix,
+)
 
 
 class BibleParser:
@@ -23,39 +40,103 @@ class BibleParser:
     explicit format specification.
     
     Attributes:
-        source: The source of Bible data (file path or XML string).
+        source: The source of Bible data (file path, archive member, binary
+            file object, bytes-like buffer, iterable of byte chunks or XML
+            string).
         format: The detected or specified Bible format.
     
+    A str source is XML content if it starts with '<' (after whitespace or a
+    BOM) and a file path otherwise. Non-seekable sources such as chunk
+    iterables can be parsed only once.
+    
+    Format detection keeps the source open for the first parse. A parser that
+    may not be parsed to the end should be closed, or used as a context
+    manager, to release that handle.
+    
     Example:
-        >>> parser = BibleParser('path/to/bible.xml')
-        >>> for book in parser.books:
-        ...     print(f"{book.title}: {len(book.verses)} verses")
+        >>> with BibleParser('path/to/bible.xml') as parser:
+        ...     for book in parser.books:
+        ...         print(f"{book.title}: {len(book.verses)} verses")
     """
 
-    def __init__(self, source: Union[str, Path], format: Optional[str] = None):
+    # Root element (namespace stripped, lower case) to format
+    ROOT_FORMATS: Dict[str, str] = {
+        "usfx": "USFX",
+        "osis": "OSIS",
+        "xmlbible": "ZEFANIA",
+    }
+
+    # Bounds for format sniffing
+    SNIFF_CHUNK_SIZE = 4096
+    SNIFF_MAX_BYTES = 1024 * 1024
+    SNIFF_MAX_ELEMENTS = 64
+
+    def __init__(
+        self,
+        source: Union[Source, str],
+        format: Optional[str] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
         """Initialize the Bible parser.
         
         Args:
-            source: Either a file path or XML content string.
+            source: A file path (plain, or gzip/bz2/xz/single-Bible zip
+                compressed), an ArchiveMember, a binary file object, a bytes,
+                bytearray or memoryview buffer, an iterable of byte chunks
+                (e.g. an HTTP response body), or XML content string.
             format: Optional format specification ('USFX', 'OSIS', or 'ZEFANIA').
                    If not provided, format will be auto-detected.
+            instrumentation: Optional receiver of parse timings and counters
+                (see bible_parser.instrumentation).
         """
         self.source = source
+        self.instrumentation = instrumentation
+        self._stream: Optional[BinaryIO] = None
         self.format = format.upper() if format else self._detect_format()
         self._parser = self._get_parser()
 
     @classmethod
-    def from_string(cls, xml_content: str, format: Optional[str] = None) -> "BibleParser":
+    def from_string(
+        cls,
+        xml_content: str,
+        format: Optional[str] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ) -> "BibleParser":
         """Create a BibleParser from an XML content string.
         
         Args:
             xml_content: XML content as a string.
             format: Optional format specification.
+            instrumentation: Optional receiver of parse timings and counters.
             
         Returns:
             A new BibleParser instance.
         """
-        return cls(xml_content, format=format)
+        return cls(xml_content, format=format, instrumentation=instrumentation)
+
+    @classmethod
+    def iter_archive(
+        cls, archive: Union[str, Path], format: Optional[str] = None
+    ) -> Iterator[Tuple[str, "BibleParser"]]:
+        """Iterate over every Bible file inside a zip archive without extracting.
+        
+        Args:
+            archive: Path to the zip archive.
+            format: Optional format specification applied to every member.
+            
+        Each parser's detection handle is released when the iteration moves
+        on, so skipped members leave no open file behind. A parser kept for
+        later reopens its member when parsed.
+        
+        Yields:
+            Tuples of (member name, BibleParser for that member).
+        """
+        for name in list_archive_members(archive):
+            parser = cls(ArchiveMember(archive, name), format=format)
+            try:
+                yield name, parser
+            finally:
+                parser.close()
 
     @property
     def books(self) -> Generator[Book, None, None]:
@@ -64,7 +145,10 @@ class BibleParser:
         Yields:
             Book objects containing chapters and verses.
         """
-        yield from self._parser.parse_books()
+        if self.instrumentation is None:
+            yield from self._parser.parse_books()
+        else:
+            yield from self._metered(self._parser.parse_books(), books=True)
 
     @property
     def verses(self) -> Generator[Verse, None, None]:
@@ -73,11 +157,110 @@ class BibleParser:
         Yields:
             Verse objects.
         """
-        yield from self._parser.parse_verses()
+        if self.instrumentation is None:
+            yield from self._parser.parse_verses()
+        else:
+            yield from self._metered(self._parser.parse_verses(), books=False)
+
+    def to_arrow(self, batch_size: int = ARROW_BATCH_SIZE) -> Any:
+        """Build a pyarrow.Table of all verses straight from the parse stream.
+        
+        Verses are converted in batches as they are parsed instead of being
+        collected into a list first. Requires pyarrow.
+        
+        Args:
+            batch_size: Verses converted per batch.
+            
+        Returns:
+            A pyarrow.Table with book_id, chapter_num, verse_num and text columns.
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        rows = (
+            (verse.book_id, verse.chapter_num, verse.num, verse.text)
+            for verse in self.verses
+        )
+        return rows_to_arrow(rows, VERSE_COLUMNS, batch_size)
+
+    def to_pandas(self, batch_size: int = ARROW_BATCH_SIZE) -> Any:
+        """Build a pandas DataFrame of all verses through to_arrow().
+        
+        Args:
+            batch_size: Verses converted per batch.
+            
+        Returns:
+            A pandas.DataFrame with book_id, chapter_num, verse_num and text columns.
+            
+        Raises:
+            ImportError: If pyarrow or pandas is not installed.
+        """
+        return arrow_to_pandas(self.to_arrow(batch_size))
+
+    def _metered(self, items: Iterator, books: bool) -> Iterator:
+        """Re-yield parsed books or verses while reporting parse metrics.
+        
+        Time spent by the consumer between items is excluded, so the totals
+        reflect parsing alone.
+        
+        Args:
+            items: Iterator from parse_books() or parse_verses().
+            books: True if items are Book objects, False for Verse objects.
+            
+        Yields:
+            The items, unchanged.
+        """
+        metrics = self.instrumentation
+        tags = {"format": self.format}
+        parse_time = 0.0
+        book_count = 0
+        verse_count = 0
+        start = time.perf_counter()
+        try:
+            for item in items:
+                elapsed = time.perf_counter() - start
+                parse_time += elapsed
+                if books:
+                    book_count += 1
+                    verse_count += len(item.verses)
+                    metrics.timing("parse.book", elapsed, {"format": self.format, "book": item.id})
+                else:
+                    verse_count += 1
+                yield item
+                start = time.perf_counter()
+            parse_time += time.perf_counter() - start
+        finally:
+            if book_count:
+                metrics.increment("parse.books", book_count, tags)
+            metrics.increment("parse.verses", verse_count, tags)
+            metrics.timing("parse.total", parse_time, tags)
+            if parse_time > 0:
+                metrics.gauge("parse.verses_per_second", verse_count / parse_time, tags)
+
+    def close(self) -> None:
+        """Release the file handle kept from format detection, if unused.
+        
+        Rewindable sources (paths, archive members, buffers and seekable
+        files) can still be parsed afterwards; they are opened again.
+        """
+        self._parser.close()
+
+    def __enter__(self) -> "BibleParser":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - releases the detection handle."""
+        self.close()
 
     def _detect_format(self) -> str:
         """Auto-detect the Bible format from content.
         
+        Files are opened once in binary mode (decompressing if needed) and only
+        a bounded prefix is read. The open handle is then rewound and handed to
+        the format parser instead of opening the file again. Streams that
+        cannot be rewound get the sniffed prefix replayed in front of them.
+        
         Returns:
             The detected format ('USFX', 'OSIS', or 'ZEFANIA').
             
@@ -85,39 +268,89 @@ class BibleParser:
             FormatDetectionError: If format cannot be detected.
         """
         try:
-            # Get a sample of the content for detection
-            if isinstance(self.source, (str, Path)):
-                path = Path(self.source)
-                if path.exists() and path.is_file():
-                    # Read first 2000 characters from file
-                    with open(path, "r", encoding="utf-8") as f:
-                        sample = f.read(2000)
-                else:
-                    # Assume it's XML content string
-                    sample = str(self.source)[:2000] if isinstance(self.source, str) else ""
-            else:
-                sample = ""
-            
-            sample_lower = sample.lower()
-            
-            # Check for format markers
-            if "<usfx" in sample_lower or ("<book" in sample_lower and "<c" in sample_lower):
-                return "USFX"
-            elif "<osis" in sample_lower or "<osistext" in sample_lower:
-                return "OSIS"
-            elif "<xmlbible" in sample_lower or "<biblebook" in sample_lower:
-                return "ZEFANIA"
+            if is_xml_text(self.source):
+                # XML content string: sniff an encoded prefix
+                prefix = str(self.source)[: self.SNIFF_MAX_BYTES].encode("utf-8")
+                return self._sniff_format(BytesIO(prefix))
             
-            # Default to OSIS if no clear markers found
-            raise FormatDetectionError(
-                "Could not detect Bible format. Please specify format explicitly."
-            )
+            # Files, buffers, file objects and chunk iterables
+            stream = open_source(self.source)
+            consumed: List[bytes] = []
+            try:
+                detected = self._sniff_format(stream, consumed)
+                if is_rewindable(self.source):
+                    stream.seek(0)
+                else:
+                    stream = replay_prefix(b"".join(consumed), stream)
+            except BaseException:
+                stream.close()
+                raise
+            self._stream = stream
+            return detected
         
         except FormatDetectionError:
             raise
         except Exception as e:
             raise FormatDetectionError(f"Error detecting format: {e}")
 
+    def _sniff_format(self, stream: BinaryIO, consumed: Optional[List[bytes]] = None) -> str:
+        """Detect the format from the first elements of a binary stream.
+        
+        The stream is fed in small chunks to an incremental defusedxml parser,
+        which skips the XML declaration, comments and DOCTYPE, decodes
+        BOM-marked or UTF-16 input, and rejects entity declarations and
+        external references before anything is expanded. Sniffing stops at the first start tag that settles the
+        format, or once SNIFF_MAX_ELEMENTS distinct elements or SNIFF_MAX_BYTES bytes
+        have been seen.
+        
+        Args:
+            stream: Binary stream positioned at the start of the document.
+            consumed: Optional list that receives the chunks read from stream.
+            
+        Returns:
+            The detected format ('USFX', 'OSIS', or 'ZEFANIA').
+            
+        Raises:
+            FormatDetectionError: If format cannot be detected.
+        """
+        started: List[str] = []
+        sniffer = DefusedXMLParser(target=_StartTags(started))
+        seen = set()
+        bytes_read = 0
+        
+        try:
+            while bytes_read < self.SNIFF_MAX_BYTES and len(seen) < self.SNIFF_MAX_ELEMENTS:
+                chunk = stream.read(self.SNIFF_CHUNK_SIZE)
+                if not chunk:
+                    break
+                bytes_read += len(chunk)
+                if consumed is not None:
+                    consumed.append(chunk)
+                sniffer.feed(chunk)
+                
+                for tag in started:
+                    tag = tag.rsplit("}", 1)[-1].lower()
+                    
+                    # The root element usually decides on its own
+                    if not seen and tag in self.ROOT_FORMATS:
+                        return self.ROOT_FORMATS[tag]
+                    seen.add(tag)
+                    
+                    # Otherwise look for characteristic child elements
+                    if "osistext" in seen:
+                        return "OSIS"
+                    elif "biblebook" in seen:
+                        return "ZEFANIA"
+                    elif "book" in seen and "c" in seen:
+                        return "USFX"
+                started.clear()
+        except (XMLParseError, DefusedXmlException) as e:
+            raise FormatDetectionError(f"Error detecting format: {e}")
+        
+        raise FormatDetectionError(
+            "Could not detect Bible format. Please specify format explicitly."
+        )
+
     def _get_parser(self) -> BaseParser:
         """Get the appropriate parser for the detected/specified format.
         
@@ -140,4 +373,16 @@ class BibleParser:
                 f"Supported formats: {', '.join(parsers.keys())}"
             )
         
-        return parser_class(self.source)
+        return parser_class(
+            self.source, stream=self._stream, instrumentation=self.instrumentation
+        )
+
+
+class _StartTags:
+    """Parser target that only records start tags, building no tree."""
+
+    def __init__(self, tags: List[str]):
+        self._tags = tags
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        self._tags.append(tag)
@@ -1,18 +1,136 @@
 """Database repository for Bible data with SQLite caching."""
 
+import hashlib
 import sqlite3
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Iterable, Tuple, Union
 
 # Python 3.9+ uses collections.abc, Python 3.8 uses typing
 if sys.version_info >= (3, 9):
-    pass
+    from collections.abc import Generator
 else:
-    pass
+    from typing import Generator
 
+from bible_parser.concordance import (
+    CONCORDANCE_SCHEMA,
+    WordOccurrence,
+    normalize_term,
+    tokenize,
+)
 from bible_parser.models import Book, Verse
 from bible_parser.bible_parser import BibleParser
+from bible_parser.errors import BibleParserException
+from bible_parser.export import (
+    ARROW_BATCH_SIZE,
+    VERSE_COLUMNS,
+    Destination,
+    arrow_to_pandas,
+    export_rows,
+    rows_to_arrow,
+)
+from bible_parser.instrumentation import Instrumentation
+from bible_parser.pipeline import prefetch
+from bible_parser.profiling import QueryProfiler
+from bible_parser.sources import Source, describe_source
+from bible_parser.versification import get_mapper, normalize_scheme
+
+
+@dataclass
+class SyncReport:
+    """Summary of the changes applied by BibleRepository.sync().
+    
+    Attributes:
+        books_added: Ids of books that were not in the database.
+        books_removed: Ids of books no longer present in the source.
+        books_changed: Ids of books whose title, number or verses changed.
+        books_unchanged: Number of books skipped because their hash matched.
+        verses_inserted: Number of verse rows inserted.
+        verses_updated: Number of verse rows whose text was updated.
+        verses_deleted: Number of verse rows deleted.
+    """
+    
+    books_added: List[str] = field(default_factory=list)
+    books_removed: List[str] = field(default_factory=list)
+    books_changed: List[str] = field(default_factory=list)
+    books_unchanged: int = 0
+    verses_inserted: int = 0
+    verses_updated: int = 0
+    verses_deleted: int = 0
+    
+    @property
+    def changed(self) -> bool:
+        """True if the sync modified the database."""
+        return bool(
+            self.books_added or self.books_removed or self.books_changed
+            or self.verses_inserted or self.verses_updated or self.verses_deleted
+        )
+    
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        return (
+            f"{len(self.books_added)} books added, {len(self.books_removed)} removed, "
+            f"{len(self.books_changed)} changed, {self.books_unchanged} unchanged; "
+            f"{self.verses_inserted} verses inserted, {self.verses_updated} updated, "
+            f"{self.verses_deleted} deleted"
+        )
+
+
+def _ordered_verses(book: Book) -> List[Tuple[int, int, str]]:
+    """Get a book's verses as (chapter_num, verse_num, text) in reference order.
+    
+    Args:
+        book: A parsed book.
+        
+    Returns:
+        Verse tuples sorted by chapter and verse, keeping source order for ties.
+    """
+    return sorted(
+        ((verse.chapter_num, verse.num, verse.text) for verse in book.verses),
+        key=lambda verse: (verse[0], verse[1]),
+    )
+
+
+def _book_digest(verses: Iterable[Tuple[int, int, str]]) -> str:
+    """Compute the content digest of a book.
+    
+    Args:
+        verses: (chapter_num, verse_num, text) tuples in reading order.
+        
+    Returns:
+        Hex SHA-256 digest of the book's verses.
+    """
+    digest = hashlib.sha256()
+    for chapter_num, verse_num, text in verses:
+        digest.update(f"{chapter_num}:{verse_num}\t{text}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _iter_book_rows(
+    parser: BibleParser,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Generator[Tuple[Tuple[str, int, str, str], List[Tuple[int, int, str]]], None, None]:
+    """Parse books into database rows.
+    
+    Args:
+        parser: Parser for the source.
+        instrumentation: Optional receiver of digest timings.
+        
+    Yields:
+        Tuples of ((id, num, title, digest), verse rows), where each verse row
+        is (chapter_num, verse_num, text) in source order.
+    """
+    for book in parser.books:
+        verse_data = [(verse.chapter_num, verse.num, verse.text) for verse in book.verses]
+        # Digest of the book's verses, computed while streaming
+        if instrumentation is None:
+            digest = _book_digest(_ordered_verses(book))
+        else:
+            with instrumentation.timer("load.digest"):
+                digest = _book_digest(_ordered_verses(book))
+        yield (book.id, book.num, book.title, digest), verse_data
 
 
 class BibleRepository:
@@ -29,25 +147,124 @@ class BibleRepository:
         ...     results = repo.search_verses('love')
     """
 
+    # Parsed books buffered ahead of the writer when loading is pipelined
+    PIPELINE_DEPTH = 4
+
+    # Physical layouts of the verses table (see __init__)
+    SCHEMAS = ("standard", "clustered")
+
+    # Word positions buffered per insert while building the concordance
+    CONCORDANCE_BATCH_SIZE = 10000
+
+    # References per get_verses_bulk() query: four parameters each stays under
+    # SQLite's historical limit of 999 bound parameters
+    BULK_CHUNK_SIZE = 200
+
+    # Verse counts and reading-order positions per chapter. first_ord and
+    # last_ord are the 1-based positions of the chapter's first and last verse
+    # when all verses are read in book, chapter and verse order.
+    _CHAPTERS_SCHEMA = """
+        CREATE TABLE IF NOT EXISTS chapters (
+            book_key INTEGER,
+            chapter_num INTEGER,
+            verse_count INTEGER,
+            first_ord INTEGER,
+            last_ord INTEGER,
+            PRIMARY KEY (book_key, chapter_num)
+        )
+    """
+
+    # Scalar subquery translating a book id into its integer key
+    _BOOK_KEY = "(SELECT key FROM books WHERE id = ?)"
+
+    # Prepared statements kept per connection. The repository issues about
+    # 30 distinct statements, so every hot query stays prepared.
+    STATEMENT_CACHE_SIZE = 64
+
+    # Hot queries, built once so each call passes the same string object to
+    # the statement cache. Columns are in Verse field order, so tuple rows map
+    # with Verse(*row).
+    _VERSE_COLUMNS = "v.verse_num, v.chapter_num, v.text, b.id"
+    _GET_VERSE_SQL = f"""
+        SELECT {_VERSE_COLUMNS}
+        FROM books b
+        INNER JOIN verses v ON v.book_key = b.key
+        WHERE b.id = ? AND v.chapter_num = ? AND v.verse_num = ?
+    """
+    _GET_VERSES_SQL = f"""
+        SELECT {_VERSE_COLUMNS}
+        FROM books b
+        INNER JOIN verses v ON v.book_key = b.key
+        WHERE b.id = ? AND v.chapter_num = ?
+        ORDER BY v.verse_num
+    """
+    _SEARCH_SQL = f"""
+        SELECT {_VERSE_COLUMNS}
+        FROM verses v
+        INNER JOIN verses_fts fts ON v.id = fts.rowid
+        INNER JOIN books b ON b.key = v.book_key
+        WHERE verses_fts MATCH ?
+        LIMIT ?
+    """
+
     def __init__(
         self,
-        xml_path: Optional[str] = None,
+        xml_path: Optional[Source] = None,
         xml_string: Optional[str] = None,
         format: Optional[str] = None,
+        versification: str = "KJV",
+        pipeline: bool = True,
+        instrumentation: Optional[Instrumentation] = None,
+        profile: bool = False,
+        schema: str = "standard",
+        concordance: bool = False,
     ):
         """Initialize the Bible repository.
         
         Args:
-            xml_path: Path to XML file (mutually exclusive with xml_string).
+            xml_path: Path to XML file (plain or compressed), ArchiveMember or binary
+                file object (mutually exclusive with xml_string).
             xml_string: XML content as string (mutually exclusive with xml_path).
             format: Optional Bible format specification.
+            versification: Versification scheme the source is numbered in
+                ('KJV', 'HEBREW', 'LXX' or 'VULGATE').
+            pipeline: Parse in a background thread while the previous books
+                are inserted (see PIPELINE_DEPTH).
+            instrumentation: Optional receiver of parse, load and query
+                timings and counters (see bible_parser.instrumentation).
+            profile: Record every SQL statement's wall time, row count and
+                query plan in a QueryProfiler (see profile_report()).
+            schema: Layout of the verses table for new databases. 'standard'
+                is a rowid table with a separate (book, chapter, verse) index.
+                'clustered' is a WITHOUT ROWID table keyed by (book_key,
+                chapter_num, verse_num, id), so a verse lookup is a single
+                B-tree search with the text stored in the key's leaf; search
+                joins through a unique index on id. Existing databases keep
+                the layout they were created with.
+            concordance: Build the positional word index (see
+                bible_parser.concordance) when a new database is loaded.
+        
+        Raises:
+            Exception: If schema is not one of SCHEMAS.
         """
+        if schema not in self.SCHEMAS:
+            raise Exception(
+                f"Unknown schema '{schema}'. Supported schemas: {', '.join(self.SCHEMAS)}"
+            )
         self.xml_path = xml_path
         self.xml_string = xml_string
         self.format = format
+        self.versification = normalize_scheme(versification)
+        self.pipeline = pipeline
+        self.instrumentation = instrumentation
+        self.profiler: Optional[QueryProfiler] = QueryProfiler() if profile else None
+        self.schema = schema
+        self.concordance = concordance
         self._db: Optional[sqlite3.Connection] = None
+        # Reused by the hot query methods; returns plain tuples
+        self._cursor: Optional[sqlite3.Cursor] = None
 
-    def initialize(self, database_name: str) -> bool:
+    def initialize(self, database_name: str, read_only: bool = False) -> bool:
         """Initialize the repository and database.
         
         Creates the database if it doesn't exist, or opens it if it does.
@@ -55,13 +272,19 @@ class BibleRepository:
         
         Args:
             database_name: Name of the SQLite database file.
+            read_only: Open an existing, populated database read-only instead:
+                nothing is created, migrated or loaded, and the connection may
+                be used from any thread (one at a time), as in a connection pool.
             
         Returns:
             True if initialization was successful.
             
         Raises:
+            BibleParserException: If a read-only database was written by an
+                older version and needs migrating first.
             Exception: If initialization fails.
         """
+        start = time.perf_counter()
         try:
             # Close any existing connection
             if self._db is not None:
@@ -70,17 +293,47 @@ class BibleRepository:
             db_path = Path(database_name)
             db_exists = db_path.exists()
             
+            target = str(db_path)
+            options: Dict[str, Any] = {"cached_statements": self.STATEMENT_CACHE_SIZE}
+            if read_only:
+                if not db_exists:
+                    raise Exception(f"Database '{database_name}' does not exist")
+                target = f"{db_path.resolve().as_uri()}?mode=ro"
+                options.update(uri=True, check_same_thread=False)
+            
             # Open database connection
-            self._db = sqlite3.connect(str(db_path))
+            if self.profiler is not None:
+                self._db = self.profiler.connect(target, **options)
+            else:
+                self._db = sqlite3.connect(target, **options)
             self._db.row_factory = sqlite3.Row  # Enable column access by name
+            self._cursor = self._db.cursor()
+            self._cursor.row_factory = None
             
-            if not db_exists or not self._is_database_initialized():
+            if read_only:
+                if not self._is_database_initialized():
+                    raise Exception(f"Database '{database_name}' is empty")
+                outdated = self._outdated_layout()
+                if outdated is not None:
+                    raise BibleParserException(
+                        f"Database '{database_name}' was written by an older version "
+                        f"({outdated}); open it once read-write to migrate it, or rebuild it"
+                    )
+            elif not db_exists or not self._is_database_initialized():
                 # Create schema and populate
                 self._create_schema()
                 self._populate_database()
+            else:
+                self._migrate_schema()
             
+            if self.instrumentation is not None:
+                self.instrumentation.timing(
+                    "repository.initialize", time.perf_counter() - start
+                )
             return True
         
+        except BibleParserException:
+            raise
         except Exception as e:
             raise Exception(f"Failed to initialize Bible repository: {e}")
 
@@ -110,108 +363,631 @@ class BibleRepository:
         if self._db is None:
             raise Exception("Database not connected")
         
-        cursor = self._db.cursor()
+        self._create_schema_objects(self._db.cursor())
+        self._db.commit()
+
+    def _create_schema_objects(self, cursor: sqlite3.Cursor) -> None:
+        """Create any missing tables, indexes and triggers (without committing).
         
-        # Create books table
+        Args:
+            cursor: Cursor to execute the DDL with.
+        """
+        # Create books table. Verses and chapters reference books by the
+        # small integer key, so their rows and indexes hold one-byte integers
+        # instead of repeating the text id; queries translate ids to keys.
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS books (
-                id TEXT PRIMARY KEY,
+                key INTEGER PRIMARY KEY,
+                id TEXT NOT NULL UNIQUE,
                 num INTEGER,
-                title TEXT
+                title TEXT,
+                digest TEXT
             )
         """)
         
-        # Create verses table
+        if self.schema == "clustered":
+            # Verses stored in reference order; id (assigned on insert) breaks
+            # ties between repeated verse numbers and links the FTS index
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS verses (
+                    id INTEGER NOT NULL,
+                    book_key INTEGER,
+                    chapter_num INTEGER,
+                    verse_num INTEGER,
+                    text TEXT,
+                    PRIMARY KEY (book_key, chapter_num, verse_num, id),
+                    FOREIGN KEY (book_key) REFERENCES books (key)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_verses_id ON verses (id)")
+        else:
+            # Create verses table
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS verses (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    book_key INTEGER,
+                    chapter_num INTEGER,
+                    verse_num INTEGER,
+                    text TEXT,
+                    FOREIGN KEY (book_key) REFERENCES books (key)
+                )
+            """)
+            
+            # Create indexes for fast lookup
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_verses_lookup 
+                ON verses (book_key, chapter_num, verse_num)
+            """)
+        
+        # Navigation metadata, rebuilt whenever verses are loaded or synced
+        cursor.execute(self._CHAPTERS_SCHEMA)
+        
+        # Key/value metadata about the source and maintenance history
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS verses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                book_id TEXT,
-                chapter_num INTEGER,
-                verse_num INTEGER,
-                text TEXT,
-                FOREIGN KEY (book_id) REFERENCES books (id)
+            CREATE TABLE IF NOT EXISTS metadata (
+                key TEXT PRIMARY KEY,
+                value TEXT
             )
         """)
         
-        # Create indexes for fast lookup
+        # Create FTS5 virtual table for full-text search
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_verses_lookup 
-            ON verses (book_id, chapter_num, verse_num)
+            CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts 
+            USING fts5(text, content=verses, content_rowid=id)
         """)
         
-        # Create FTS5 virtual table for full-text search
+        self._create_fts_triggers()
+
+    def _outdated_layout(self) -> Optional[str]:
+        """Check for the layouts _migrate_schema() upgrades.
+        
+        Returns:
+            What needs migrating, or None if the database is up to date.
+        """
+        cursor = self._db.cursor()
+        cursor.execute("PRAGMA table_info(verses)")
+        if "book_id" in {row["name"] for row in cursor.fetchall()}:
+            return "verses keyed by text book ids"
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='chapters'"
+        )
+        if cursor.fetchone() is None:
+            return "no chapters table"
+        cursor.execute("PRAGMA table_info(books)")
+        if "digest" not in {row["name"] for row in cursor.fetchall()}:
+            return "no book digests"
+        cursor.execute("SELECT 1 FROM books WHERE digest IS NULL LIMIT 1")
+        if cursor.fetchone() is not None:
+            return "missing book digests"
+        return None
+
+    def _migrate_schema(self) -> None:
+        """Bring a database created by an older version up to date."""
+        cursor = self._db.cursor()
+        
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        
+        cursor.execute("SELECT value FROM metadata WHERE key = 'schema'")
+        row = cursor.fetchone()
+        self.schema = row["value"] if row else "standard"
+        
+        # Databases written before verses referenced books by integer key
+        cursor.execute("PRAGMA table_info(verses)")
+        rebuilt = "book_id" in {row["name"] for row in cursor.fetchall()}
+        if rebuilt:
+            self._migrate_book_keys()
+        
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='chapters'"
+        )
+        if cursor.fetchone() is None:
+            cursor.execute(self._CHAPTERS_SCHEMA)
+            self._refresh_chapters()
+        
+        cursor.execute("PRAGMA table_info(books)")
+        if "digest" not in {row["name"] for row in cursor.fetchall()}:
+            cursor.execute("ALTER TABLE books ADD COLUMN digest TEXT")
+        cursor.execute("SELECT id FROM books WHERE digest IS NULL")
+        for row in cursor.fetchall():
+            self._refresh_book_digest(row["id"])
+        
+        self._create_fts_triggers()
+        self._db.commit()
+        
+        if rebuilt:
+            # Return the pages freed by the old tables to the file system
+            self._db.execute("VACUUM")
+
+    def _migrate_book_keys(self) -> None:
+        """Rebuild a database that stores text book ids in every verse row.
+        
+        The tables are recreated with integer book keys and the rows copied
+        over, keeping verse ids. The FTS index is rebuilt by the insert
+        trigger. The whole rebuild runs in one transaction.
+        """
+        cursor = self._db.cursor()
+        cursor.execute("PRAGMA table_info(books)")
+        book_columns = "id, num, title"
+        if "digest" in {row["name"] for row in cursor.fetchall()}:
+            book_columns += ", digest"
+        
+        cursor.execute("BEGIN")
+        for trigger in ("verses_ai", "verses_ad", "verses_au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        for index in ("idx_verses_lookup", "idx_verses_id"):
+            cursor.execute(f"DROP INDEX IF EXISTS {index}")
+        cursor.execute("DROP TABLE IF EXISTS verses_fts")
+        cursor.execute("DROP TABLE IF EXISTS chapters")
+        # Keep the old tables' names out of the new tables' foreign keys
+        cursor.execute("PRAGMA legacy_alter_table = ON")
+        cursor.execute("ALTER TABLE books RENAME TO books_old")
+        cursor.execute("ALTER TABLE verses RENAME TO verses_old")
+        cursor.execute("PRAGMA legacy_alter_table = OFF")
+        
+        self._create_schema_objects(cursor)
+        cursor.execute(
+            f"INSERT INTO books ({book_columns}) SELECT {book_columns} FROM books_old ORDER BY num"
+        )
         cursor.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts 
-            USING fts5(book_id, chapter_num, verse_num, text, content=verses, content_rowid=id)
+            INSERT INTO verses (id, book_key, chapter_num, verse_num, text)
+            SELECT v.id, b.key, v.chapter_num, v.verse_num, v.text
+            FROM verses_old v JOIN books b ON b.id = v.book_id
+            ORDER BY v.id
+        """)
+        cursor.execute("DROP TABLE verses_old")
+        cursor.execute("DROP TABLE books_old")
+        self._refresh_chapters()
+
+    def _refresh_book_digest(self, book_id: str) -> None:
+        """Recompute a book's digest from its stored verses (without committing).
+        
+        Args:
+            book_id: Book identifier.
+        """
+        cursor = self._db.cursor()
+        cursor.execute(
+            f"""
+            SELECT chapter_num, verse_num, text FROM verses
+            WHERE book_key = {self._BOOK_KEY}
+            ORDER BY chapter_num, verse_num, id
+            """,
+            (book_id,),
+        )
+        digest = _book_digest(
+            (row["chapter_num"], row["verse_num"], row["text"]) for row in cursor
+        )
+        self._db.execute("UPDATE books SET digest = ? WHERE id = ?", (digest, book_id))
+
+    def _book_key(self, book_id: str) -> Optional[int]:
+        """Get the integer key of a stored book.
+        
+        Args:
+            book_id: Book identifier.
+            
+        Returns:
+            The book's key, or None if the book does not exist.
+        """
+        row = self._db.execute("SELECT key FROM books WHERE id = ?", (book_id,)).fetchone()
+        return row[0] if row else None
+
+    def _insert_verses(self, book_key: int, rows: List[Tuple[int, int, str]]) -> range:
+        """Insert verse rows of one book (without committing).
+        
+        Args:
+            book_key: Integer key of the book.
+            rows: (chapter_num, verse_num, text) tuples.
+            
+        Returns:
+            The ids given to the rows, in order.
+        """
+        if not rows:
+            return range(0)
+        if self.schema == "clustered":
+            # WITHOUT ROWID tables do not assign ids
+            cursor = self._db.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM verses")
+            first_id = cursor.fetchone()[0]
+            self._db.executemany(
+                "INSERT INTO verses (id, book_key, chapter_num, verse_num, text) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(verse_id, book_key) + row for verse_id, row in enumerate(rows, first_id)],
+            )
+            return range(first_id, first_id + len(rows))
+        self._db.executemany(
+            "INSERT INTO verses (book_key, chapter_num, verse_num, text) VALUES (?, ?, ?, ?)",
+            [(book_key,) + row for row in rows],
+        )
+        # AUTOINCREMENT ids of one statement are consecutive; the FTS trigger's
+        # own inserts do not change last_insert_rowid() outside the trigger
+        last_id = self._db.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return range(last_id - len(rows) + 1, last_id + 1)
+
+    def _refresh_chapters(self) -> None:
+        """Rebuild the chapters table from the stored verses (without committing)."""
+        self._db.execute("DELETE FROM chapters")
+        self._db.execute("""
+            INSERT INTO chapters (book_key, chapter_num, verse_count, first_ord, last_ord)
+            SELECT book_key, chapter_num, COUNT(*), MIN(ord), MAX(ord)
+            FROM (
+                SELECT v.book_key, v.chapter_num, ROW_NUMBER() OVER (
+                    ORDER BY b.num, v.chapter_num, v.verse_num, v.id
+                ) AS ord
+                FROM verses v JOIN books b ON b.key = v.book_key
+            )
+            GROUP BY book_key, chapter_num
         """)
+
+    def _create_fts_triggers(self) -> None:
+        """(Re)create the triggers that keep the FTS table in sync.
+        
+        verses_fts is an external-content table, so removed rows must be passed
+        to FTS5's 'delete' command with their old values; the content row is
+        already gone (or changed) when an AFTER trigger runs. Existing triggers
+        are replaced so databases created by older versions are corrected.
+        """
+        cursor = self._db.cursor()
+        
+        for trigger in ("verses_ai", "verses_ad", "verses_au"):
+            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
         
-        # Create triggers to keep FTS table in sync
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS verses_ai AFTER INSERT ON verses BEGIN
-                INSERT INTO verses_fts(rowid, book_id, chapter_num, verse_num, text)
-                VALUES (new.id, new.book_id, new.chapter_num, new.verse_num, new.text);
+            CREATE TRIGGER verses_ai AFTER INSERT ON verses BEGIN
+                INSERT INTO verses_fts(rowid, text) VALUES (new.id, new.text);
             END
         """)
         
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS verses_ad AFTER DELETE ON verses BEGIN
-                DELETE FROM verses_fts WHERE rowid = old.id;
+            CREATE TRIGGER verses_ad AFTER DELETE ON verses BEGIN
+                INSERT INTO verses_fts(verses_fts, rowid, text)
+                VALUES ('delete', old.id, old.text);
             END
         """)
         
         cursor.execute("""
-            CREATE TRIGGER IF NOT EXISTS verses_au AFTER UPDATE ON verses BEGIN
-                UPDATE verses_fts SET 
-                    book_id = new.book_id,
-                    chapter_num = new.chapter_num,
-                    verse_num = new.verse_num,
-                    text = new.text
-                WHERE rowid = new.id;
+            CREATE TRIGGER verses_au AFTER UPDATE ON verses BEGIN
+                INSERT INTO verses_fts(verses_fts, rowid, text)
+                VALUES ('delete', old.id, old.text);
+                INSERT INTO verses_fts(rowid, text) VALUES (new.id, new.text);
             END
         """)
+
+    def _create_parser(
+        self,
+        xml_path: Optional[Source],
+        xml_string: Optional[str],
+        format: Optional[str],
+    ) -> BibleParser:
+        """Create a parser for an XML source.
         
-        self._db.commit()
+        Args:
+            xml_path: XML file, archive member or binary file object.
+            xml_string: XML content (takes precedence over xml_path).
+            format: Optional Bible format specification.
+            
+        Returns:
+            A BibleParser for xml_string or xml_path.
+            
+        Raises:
+            Exception: If no XML source is given.
+        """
+        if xml_string is not None:
+            return BibleParser.from_string(
+                xml_string, format=format, instrumentation=self.instrumentation
+            )
+        elif xml_path is not None:
+            return BibleParser(xml_path, format=format, instrumentation=self.instrumentation)
+        else:
+            raise Exception("No XML source provided")
+
+    def _set_metadata(self, values: Dict[str, Any]) -> None:
+        """Store metadata entries (without committing).
+        
+        Args:
+            values: Mapping of metadata keys to values.
+        """
+        self._db.executemany(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            [(key, None if value is None else str(value)) for key, value in values.items()],
+        )
+
+    def _source_metadata(
+        self, parser: BibleParser, xml_path: Optional[Source], xml_string: Optional[str]
+    ) -> Dict[str, Any]:
+        """Describe an XML source for the metadata table."""
+        return {
+            "source": describe_source(xml_path) if xml_string is None else "<string>",
+            "format": parser.format,
+            "versification": self.versification,
+            "digest_algorithm": "sha256",
+            "schema": self.schema,
+        }
+
+    def get_metadata(self) -> Dict[str, str]:
+        """Get the repository metadata.
+        
+        Returns:
+            Dictionary of metadata entries such as 'source', 'format' and
+            'last_synced'.
+        """
+        self._ensure_db_initialized()
+        
+        cursor = self._db.cursor()
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='metadata'"
+        )
+        if cursor.fetchone() is None:
+            return {}
+        
+        cursor.execute("SELECT key, value FROM metadata")
+        return {row["key"]: row["value"] for row in cursor.fetchall()}
 
     def _populate_database(self) -> None:
         """Parse XML and populate the database."""
         if self._db is None:
             raise Exception("Database not connected")
         
-        # Create parser
-        if self.xml_string is not None:
-            parser = BibleParser.from_string(self.xml_string, format=self.format)
-        elif self.xml_path is not None:
-            parser = BibleParser(self.xml_path, format=self.format)
-        else:
-            raise Exception("No XML source provided")
+        parser = self._create_parser(self.xml_path, self.xml_string, self.format)
+        metrics = self.instrumentation
         
         cursor = self._db.cursor()
         
+        # Parsing (and hashing) runs ahead in a worker thread while this thread
+        # inserts, so load time approaches the slower of the two stages
+        book_rows = _iter_book_rows(parser, metrics)
+        if self.pipeline:
+            book_rows = prefetch(book_rows, maxsize=self.PIPELINE_DEPTH)
+        
         # Use transaction for better performance
         try:
-            for book in parser.books:
-                # Insert book
+            load_start = wait_start = time.perf_counter()
+            repeated_books = set()
+            verse_count = 0
+            for book_row, verse_data in book_rows:
+                if metrics is not None:
+                    insert_start = time.perf_counter()
+                    metrics.timing("load.wait", insert_start - wait_start)
+                
                 cursor.execute(
-                    "INSERT OR IGNORE INTO books (id, num, title) VALUES (?, ?, ?)",
-                    (book.id, book.num, book.title),
+                    "INSERT OR IGNORE INTO books (id, num, title, digest) VALUES (?, ?, ?, ?)",
+                    book_row,
                 )
+                books_inserted = cursor.rowcount
+                if books_inserted == 0:
+                    repeated_books.add(book_row[0])
+                    book_key = self._book_key(book_row[0])
+                else:
+                    book_key = cursor.lastrowid
                 
-                # Insert verses in batch
-                verse_data = [
-                    (verse.book_id, verse.chapter_num, verse.num, verse.text)
-                    for verse in book.verses
-                ]
+                self._insert_verses(book_key, verse_data)
+                verse_count += len(verse_data)
                 
-                cursor.executemany(
-                    "INSERT INTO verses (book_id, chapter_num, verse_num, text) VALUES (?, ?, ?, ?)",
-                    verse_data,
-                )
+                if metrics is not None:
+                    wait_start = time.perf_counter()
+                    metrics.timing("load.insert", wait_start - insert_start, {"book": book_row[0]})
+                    metrics.increment("load.books", books_inserted)
+                    metrics.increment("load.verses", len(verse_data))
+            
+            # A book split across several elements only has part of its
+            # verses in the streamed digest
+            for book_id in repeated_books:
+                self._refresh_book_digest(book_id)
             
+            self._refresh_chapters()
+            if self.concordance:
+                concordance_start = time.perf_counter()
+                self._build_concordance()
+                if metrics is not None:
+                    metrics.timing("load.concordance", time.perf_counter() - concordance_start)
+            self._set_metadata(self._source_metadata(parser, self.xml_path, self.xml_string))
+            commit_start = time.perf_counter()
             self._db.commit()
+            
+            if metrics is not None:
+                end = time.perf_counter()
+                metrics.timing("load.commit", end - commit_start)
+                metrics.timing("load.total", end - load_start)
+                if end > load_start:
+                    metrics.gauge("load.verses_per_second", verse_count / (end - load_start))
         
         except Exception as e:
             self._db.rollback()
             raise Exception(f"Failed to populate database: {e}")
+        finally:
+            book_rows.close()
+
+    def sync(
+        self,
+        xml_path: Optional[Source] = None,
+        xml_string: Optional[str] = None,
+        format: Optional[str] = None,
+    ) -> SyncReport:
+        """Bring the database in line with an updated XML source.
+        
+        The new source is parsed book by book. Books whose content hash matches
+        the stored book digest are skipped; for the rest, verses are diffed and only the
+        changed rows are inserted, updated or deleted. The existing FTS triggers
+        keep the search index in step, and the concordance, if built, is
+        re-indexed for the changed verses only, so nothing is rebuilt from
+        scratch. All changes are applied in a single transaction.
+        
+        Args:
+            xml_path: Updated XML file, archive member or binary file object
+                (defaults to the current source).
+            xml_string: Updated XML content (mutually exclusive with xml_path).
+            format: Optional Bible format specification.
+            
+        Returns:
+            A SyncReport describing what changed.
+            
+        Raises:
+            Exception: If the database is not initialized or the sync fails.
+        """
+        self._ensure_db_initialized()
+        
+        # The repository keeps its old source until the new one has been committed
+        if xml_path is None and xml_string is None:
+            xml_path, xml_string = self.xml_path, self.xml_string
+        if format is None:
+            format = self.format
+        
+        parser = self._create_parser(xml_path, xml_string, format)
+        report = SyncReport()
+        cursor = self._db.cursor()
+        
+        cursor.execute("SELECT key, id, num, title, digest FROM books")
+        stored_books = {
+            row["id"]: (row["key"], row["num"], row["title"], row["digest"])
+            for row in cursor.fetchall()
+        }
+        
+        # Stored text of updated and deleted verses, and ids of inserted ones
+        old_texts: Dict[int, str] = {}
+        new_ids: List[int] = []
+        
+        try:
+            # A book split across several elements is diffed as a whole, keeping
+            # the number and title of its first element as loading does
+            books: Dict[str, Book] = {}
+            for book in parser.books:
+                first = books.setdefault(book.id, book)
+                if first is not book:
+                    first.verses.extend(book.verses)
+            for book in books.values():
+                self._sync_book(book, stored_books.get(book.id), report, old_texts, new_ids)
+            
+            for book_id, stored in stored_books.items():
+                if book_id in books:
+                    continue
+                cursor.execute("SELECT id, text FROM verses WHERE book_key = ?", (stored[0],))
+                old_texts.update((row["id"], row["text"]) for row in cursor.fetchall())
+                cursor.execute("DELETE FROM verses WHERE book_key = ?", (stored[0],))
+                report.verses_deleted += cursor.rowcount
+                cursor.execute("DELETE FROM books WHERE key = ?", (stored[0],))
+                report.books_removed.append(book_id)
+            
+            if report.changed:
+                self._refresh_chapters()
+                if self.has_concordance():
+                    self._update_concordance(old_texts, new_ids)
+            
+            metadata = self._source_metadata(parser, xml_path, xml_string)
+            metadata["last_synced"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            self._set_metadata(metadata)
+            self._db.commit()
+        
+        except Exception as e:
+            self._db.rollback()
+            raise Exception(f"Failed to sync database: {e}")
+        
+        self.xml_path = xml_path
+        self.xml_string = xml_string
+        self.format = format
+        
+        return report
+
+    def _sync_book(
+        self,
+        book: Book,
+        stored: Optional[Tuple[int, int, str, str]],
+        report: SyncReport,
+        old_texts: Dict[int, str],
+        new_ids: List[int],
+    ) -> None:
+        """Apply the differences for one parsed book.
+        
+        Args:
+            book: The parsed book from the new source.
+            stored: (key, num, title, digest) of the stored book, or None if it
+                is new.
+            report: Report to record changes in.
+            old_texts: Receives the stored text of updated and deleted verses by id.
+            new_ids: Receives the ids of inserted verses.
+        """
+        cursor = self._db.cursor()
+        new_verses = _ordered_verses(book)
+        new_digest = _book_digest(new_verses)
+        
+        if stored is None:
+            cursor.execute(
+                "INSERT INTO books (id, num, title, digest) VALUES (?, ?, ?, ?)",
+                (book.id, book.num, book.title, new_digest),
+            )
+            new_ids.extend(self._insert_verses(cursor.lastrowid, new_verses))
+            report.books_added.append(book.id)
+            report.verses_inserted += len(new_verses)
+            return
+        
+        book_key, stored_num, stored_title, stored_digest = stored
+        book_changed = (stored_num, stored_title) != (book.num, book.title)
+        if book_changed or stored_digest != new_digest:
+            cursor.execute(
+                "UPDATE books SET num = ?, title = ?, digest = ? WHERE key = ?",
+                (book.num, book.title, new_digest, book_key),
+            )
+        
+        if stored_digest == new_digest:
+            if book_changed:
+                report.books_changed.append(book.id)
+            else:
+                report.books_unchanged += 1
+            return
+        
+        cursor.execute(
+            """
+            SELECT id, chapter_num, verse_num, text FROM verses
+            WHERE book_key = ?
+            ORDER BY chapter_num, verse_num, id
+            """,
+            (book_key,),
+        )
+        stored_rows = cursor.fetchall()
+        
+        # Key verses by (chapter, verse, occurrence) so duplicated numbers diff cleanly
+        stored_by_key: Dict[Tuple[int, int, int], Tuple[int, str]] = {}
+        for row in stored_rows:
+            key = (row["chapter_num"], row["verse_num"], 0)
+            while key in stored_by_key:
+                key = (key[0], key[1], key[2] + 1)
+            stored_by_key[key] = (row["id"], row["text"])
+        
+        new_by_key: Dict[Tuple[int, int, int], str] = {}
+        for chapter_num, verse_num, text in new_verses:
+            key = (chapter_num, verse_num, 0)
+            while key in new_by_key:
+                key = (key[0], key[1], key[2] + 1)
+            new_by_key[key] = text
+        
+        inserts = [
+            (key[0], key[1], text)
+            for key, text in new_by_key.items()
+            if key not in stored_by_key
+        ]
+        updates = [
+            (text, stored_by_key[key][0])
+            for key, text in new_by_key.items()
+            if key in stored_by_key and stored_by_key[key][1] != text
+        ]
+        deletes = [
+            (row_id,)
+            for key, (row_id, _) in stored_by_key.items()
+            if key not in new_by_key
+        ]
+        
+        old_texts.update(
+            (row_id, text)
+            for key, (row_id, text) in stored_by_key.items()
+            if key not in new_by_key or new_by_key[key] != text
+        )
+        
+        new_ids.extend(self._insert_verses(book_key, inserts))
+        cursor.executemany("UPDATE verses SET text = ? WHERE id = ?", updates)
+        cursor.executemany("DELETE FROM verses WHERE id = ?", deletes)
+        
+        report.books_changed.append(book.id)
+        report.verses_inserted += len(inserts)
+        report.verses_updated += len(updates)
+        report.verses_deleted += len(deletes)
 
     def get_books(self) -> List[Book]:
         """Get all books in the Bible.
@@ -233,6 +1009,71 @@ class BibleRepository:
         
         return books
 
+    def get_book_digest(self, book_id: str) -> Optional[str]:
+        """Get the content digest of a book.
+        
+        The digest is a SHA-256 hash over the book's verses in reference order,
+        so two databases hold the same text for a book exactly when the digests
+        are equal.
+        
+        Args:
+            book_id: Book identifier (e.g., 'gen', 'mat').
+            
+        Returns:
+            Hex digest, or None if the book does not exist.
+        """
+        self._ensure_db_initialized()
+        
+        cursor = self._db.cursor()
+        cursor.execute("SELECT digest FROM books WHERE id = ?", (book_id,))
+        row = cursor.fetchone()
+        return row["digest"] if row else None
+
+    def get_book_digests(self) -> Dict[str, str]:
+        """Get the content digests of all books.
+        
+        Returns:
+            Dictionary mapping book ids to hex digests, in book order.
+        """
+        self._ensure_db_initialized()
+        
+        cursor = self._db.cursor()
+        cursor.execute("SELECT id, digest FROM books ORDER BY num")
+        return {row["id"]: row["digest"] for row in cursor.fetchall()}
+
+    def get_database_digest(self) -> str:
+        """Get a single digest covering every book.
+        
+        Returns:
+            Hex SHA-256 digest of all (book id, book digest) pairs.
+        """
+        digest = hashlib.sha256()
+        for book_id, book_digest in sorted(self.get_book_digests().items()):
+            digest.update(f"{book_id}\t{book_digest}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def compare_digests(
+        self, other: Union["BibleRepository", Dict[str, str]]
+    ) -> List[str]:
+        """Find the books whose content differs from another database.
+        
+        Args:
+            other: Another initialized repository, or a book digest mapping
+                such as one returned by get_book_digests().
+            
+        Returns:
+            Ids of books that differ or exist on only one side (empty if the
+            databases hold identical text).
+        """
+        ours = self.get_book_digests()
+        theirs = other.get_book_digests() if isinstance(other, BibleRepository) else other
+        
+        return [
+            book_id
+            for book_id in list(ours) + [key for key in theirs if key not in ours]
+            if ours.get(book_id) != theirs.get(book_id)
+        ]
+
     def get_chapter_count(self, book_id: str) -> int:
         """Get the number of chapters in a book.
         
@@ -246,67 +1087,203 @@ class BibleRepository:
         
         cursor = self._db.cursor()
         cursor.execute(
-            "SELECT COUNT(DISTINCT chapter_num) as count FROM verses WHERE book_id = ?",
+            f"SELECT COUNT(*) as count FROM chapters WHERE book_key = {self._BOOK_KEY}",
             (book_id,),
         )
         
         result = cursor.fetchone()
         return result["count"] if result else 0
 
-    def get_verses(self, book_id: str, chapter_num: int) -> List[Verse]:
-        """Get all verses in a specific chapter.
+    def get_verse_count(self, book_id: str, chapter_num: Optional[int] = None) -> int:
+        """Get the number of verses in a chapter or a whole book.
         
         Args:
-            book_id: Book identifier.
-            chapter_num: Chapter number.
+            book_id: Book identifier (e.g., 'gen', 'mat').
+            chapter_num: Chapter number, or None for the whole book.
             
         Returns:
-            List of Verse objects.
+            Number of verses (0 if the book or chapter does not exist).
+        """
+        self._ensure_db_initialized()
+        
+        cursor = self._db.cursor()
+        if chapter_num is None:
+            cursor.execute(
+                "SELECT COALESCE(SUM(verse_count), 0) as count FROM chapters "
+                f"WHERE book_key = {self._BOOK_KEY}",
+                (book_id,),
+            )
+        else:
+            cursor.execute(
+                "SELECT verse_count as count FROM chapters "
+                f"WHERE book_key = {self._BOOK_KEY} AND chapter_num = ?",
+                (book_id, chapter_num),
+            )
+        
+        result = cursor.fetchone()
+        return result["count"] if result else 0
+
+    def get_book_outline(self, book_id: str) -> Dict[int, int]:
+        """Get the verse count of every chapter in a book.
+        
+        Args:
+            book_id: Book identifier (e.g., 'gen', 'mat').
+            
+        Returns:
+            Dictionary mapping chapter numbers to verse counts, in chapter
+            order (empty if the book does not exist).
         """
         self._ensure_db_initialized()
         
         cursor = self._db.cursor()
         cursor.execute(
-            """
-            SELECT book_id, chapter_num, verse_num, text 
-            FROM verses 
-            WHERE book_id = ? AND chapter_num = ?
-            ORDER BY verse_num
+            f"""
+            SELECT chapter_num, verse_count FROM chapters
+            WHERE book_key = {self._BOOK_KEY}
+            ORDER BY chapter_num
             """,
+            (book_id,),
+        )
+        return {row["chapter_num"]: row["verse_count"] for row in cursor.fetchall()}
+
+    def get_chapter_span(self, book_id: str, chapter_num: int) -> Optional[Tuple[int, int]]:
+        """Get the reading-order positions of a chapter's first and last verse.
+        
+        Positions count verses from 1 across the whole Bible in book, chapter
+        and verse order, which is useful for progress indicators and reading
+        plans.
+        
+        Args:
+            book_id: Book identifier (e.g., 'gen', 'mat').
+            chapter_num: Chapter number.
+            
+        Returns:
+            Tuple of (first, last) positions, or None if the chapter does not
+            exist.
+        """
+        self._ensure_db_initialized()
+        
+        cursor = self._db.cursor()
+        cursor.execute(
+            "SELECT first_ord, last_ord FROM chapters "
+            f"WHERE book_key = {self._BOOK_KEY} AND chapter_num = ?",
             (book_id, chapter_num),
         )
+        row = cursor.fetchone()
+        return (row["first_ord"], row["last_ord"]) if row else None
+
+    def get_verses(self, book_id: str, chapter_num: int) -> List[Verse]:
+        """Get all verses in a specific chapter.
         
-        verses = []
-        for row in cursor.fetchall():
-            verses.append(Verse.from_dict(dict(row)))
+        Args:
+            book_id: Book identifier.
+            chapter_num: Chapter number.
+            
+        Returns:
+            List of Verse objects.
+        """
+        self._ensure_db_initialized()
+        start = time.perf_counter() if self.instrumentation is not None else 0.0
         
+        rows = self._cursor.execute(self._GET_VERSES_SQL, (book_id, chapter_num)).fetchall()
+        verses = [Verse(*row) for row in rows]
+        
+        if self.instrumentation is not None:
+            self._record_query("get_verses", start, len(verses))
         return verses
 
-    def get_verse(self, book_id: str, chapter_num: int, verse_num: int) -> Optional[Verse]:
+    def get_verse(
+        self,
+        book_id: str,
+        chapter_num: int,
+        verse_num: int,
+        versification: Optional[str] = None,
+    ) -> Optional[Verse]:
         """Get a specific verse.
         
         Args:
             book_id: Book identifier.
             chapter_num: Chapter number.
             verse_num: Verse number.
+            versification: Scheme the reference is numbered in. When it differs
+                from the repository's scheme the reference is mapped first.
             
         Returns:
             Verse object if found, None otherwise.
         """
         self._ensure_db_initialized()
+        start = time.perf_counter() if self.instrumentation is not None else 0.0
         
-        cursor = self._db.cursor()
-        cursor.execute(
-            """
-            SELECT book_id, chapter_num, verse_num, text 
-            FROM verses 
-            WHERE book_id = ? AND chapter_num = ? AND verse_num = ?
-            """,
-            (book_id, chapter_num, verse_num),
-        )
+        if versification is not None:
+            book_id, chapter_num, verse_num = get_mapper(
+                versification, self.versification
+            ).map(book_id, chapter_num, verse_num)
         
-        row = cursor.fetchone()
-        return Verse.from_dict(dict(row)) if row else None
+        row = self._cursor.execute(
+            self._GET_VERSE_SQL, (book_id, chapter_num, verse_num)
+        ).fetchone()
+        
+        if self.instrumentation is not None:
+            self._record_query("get_verse", start, 1 if row else 0)
+        return Verse(*row) if row else None
+
+    def get_verses_bulk(
+        self,
+        references: Iterable[Tuple[str, int, int]],
+        versification: Optional[str] = None,
+    ) -> List[Optional[Verse]]:
+        """Get many scattered verses with one query per BULK_CHUNK_SIZE references.
+        
+        The references are joined against books and verses as a VALUES list,
+        so a passage's worth of cross-references costs one statement execution
+        instead of one per verse.
+        
+        Args:
+            references: (book_id, chapter_num, verse_num) tuples, from any
+                books and in any order.
+            versification: Scheme the references are numbered in. When it
+                differs from the repository's scheme they are mapped first.
+            
+        Returns:
+            One entry per reference in input order: the Verse, or None if it
+            does not exist.
+        """
+        self._ensure_db_initialized()
+        start = time.perf_counter() if self.instrumentation is not None else 0.0
+        
+        references = list(references)
+        if versification is not None:
+            references = get_mapper(versification, self.versification).map_many(references)
+        
+        verses: List[Optional[Verse]] = [None] * len(references)
+        for offset in range(0, len(references), self.BULK_CHUNK_SIZE):
+            chunk = references[offset:offset + self.BULK_CHUNK_SIZE]
+            values = ", ".join(["(?, ?, ?, ?)"] * len(chunk))
+            params: List[Any] = []
+            for position, reference in enumerate(chunk, offset):
+                params.append(position)
+                params.extend(reference)
+            rows = self._cursor.execute(
+                f"""
+                WITH refs (position, book_id, chapter_num, verse_num) AS (VALUES {values})
+                SELECT r.position, {self._VERSE_COLUMNS}
+                FROM refs r
+                INNER JOIN books b ON b.id = r.book_id
+                INNER JOIN verses v ON v.book_key = b.key
+                    AND v.chapter_num = r.chapter_num AND v.verse_num = r.verse_num
+                ORDER BY r.position, v.id
+                """,
+                params,
+            ).fetchall()
+            for row in rows:
+                # Keep the first of several verses sharing a number
+                if verses[row[0]] is None:
+                    verses[row[0]] = Verse(*row[1:])
+        
+        if self.instrumentation is not None:
+            found = sum(verse is not None for verse in verses)
+            self._record_query("get_verses_bulk", start, found)
+        return verses
 
     def search_verses(self, query: str, limit: int = 100) -> List[Verse]:
         """Search for verses containing the query text.
@@ -321,33 +1298,442 @@ class BibleRepository:
             List of matching Verse objects.
         """
         self._ensure_db_initialized()
+        start = time.perf_counter() if self.instrumentation is not None else 0.0
         
         # Sanitize query to prevent FTS injection
         query = query.replace('"', '""')
         
+        rows = self._cursor.execute(self._SEARCH_SQL, (query, limit)).fetchall()
+        verses = [Verse(*row) for row in rows]
+        
+        if self.instrumentation is not None:
+            self._record_query("search_verses", start, len(verses))
+        return verses
+
+    def iter_verse_rows(
+        self, start_book: Optional[str] = None, end_book: Optional[str] = None
+    ) -> Generator[Tuple[str, int, int, str], None, None]:
+        """Stream verses as (book_id, chapter_num, verse_num, text) tuples.
+        
+        Verses are read one book at a time in reading order, so memory use
+        does not depend on the size of the database.
+        
+        Args:
+            start_book: First book to include (defaults to the first book).
+            end_book: Last book to include (defaults to the last book).
+            
+        Yields:
+            Verse rows in book, chapter and verse order.
+            
+        Raises:
+            Exception: If start_book or end_book does not exist.
+        """
+        self._ensure_db_initialized()
+        
+        books = self._db.execute("SELECT key, id, num FROM books ORDER BY num").fetchall()
+        nums = {row["id"]: row["num"] for row in books}
+        for bound in (start_book, end_book):
+            if bound is not None and bound not in nums:
+                raise Exception(f"Unknown book '{bound}'")
+        first = nums[start_book] if start_book is not None else books[0]["num"] if books else 0
+        last = nums[end_book] if end_book is not None else books[-1]["num"] if books else 0
+        
+        for book in books:
+            if not first <= book["num"] <= last:
+                continue
+            cursor = self._db.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                """
+                SELECT ?, chapter_num, verse_num, text FROM verses
+                WHERE book_key = ?
+                ORDER BY chapter_num, verse_num, id
+                """,
+                (book["id"], book["key"]),
+            )
+            yield from cursor
+
+    def export(
+        self,
+        destination: Destination,
+        format: Optional[str] = None,
+        start_book: Optional[str] = None,
+        end_book: Optional[str] = None,
+    ) -> int:
+        """Stream verses to a JSON Lines, CSV or Parquet file.
+        
+        Rows have the columns book_id, chapter_num, verse_num and text. See
+        bible_parser.export for details of each format.
+        
+        Args:
+            destination: Output path or open file object.
+            format: 'jsonl', 'csv' or 'parquet' (inferred from the file
+                extension by default).
+            start_book: First book to include (defaults to the first book).
+            end_book: Last book to include (defaults to the last book).
+            
+        Returns:
+            Number of verses written.
+        """
+        return export_rows(
+            self.iter_verse_rows(start_book, end_book), VERSE_COLUMNS, destination, format
+        )
+
+    def to_arrow(
+        self,
+        start_book: Optional[str] = None,
+        end_book: Optional[str] = None,
+        batch_size: int = ARROW_BATCH_SIZE,
+    ) -> Any:
+        """Build a pyarrow.Table of verses read from SQLite in batches.
+        
+        Requires pyarrow.
+        
+        Args:
+            start_book: First book to include (defaults to the first book).
+            end_book: Last book to include (defaults to the last book).
+            batch_size: Rows converted per batch.
+            
+        Returns:
+            A pyarrow.Table with book_id, chapter_num, verse_num and text columns.
+            
+        Raises:
+            ImportError: If pyarrow is not installed.
+            Exception: If start_book or end_book does not exist.
+        """
+        return rows_to_arrow(self.iter_verse_rows(start_book, end_book), VERSE_COLUMNS, batch_size)
+
+    def to_pandas(
+        self,
+        start_book: Optional[str] = None,
+        end_book: Optional[str] = None,
+        batch_size: int = ARROW_BATCH_SIZE,
+    ) -> Any:
+        """Build a pandas DataFrame of verses through to_arrow().
+        
+        Args:
+            start_book: First book to include (defaults to the first book).
+            end_book: Last book to include (defaults to the last book).
+            batch_size: Rows converted per batch.
+            
+        Returns:
+            A pandas.DataFrame with book_id, chapter_num, verse_num and text columns.
+            
+        Raises:
+            ImportError: If pyarrow or pandas is not installed.
+            Exception: If start_book or end_book does not exist.
+        """
+        return arrow_to_pandas(self.to_arrow(start_book, end_book, batch_size))
+
+    def has_concordance(self) -> bool:
+        """Check whether the positional word index has been built.
+        
+        Returns:
+            True if get_concordance() and get_word_frequencies() are available.
+        """
+        self._ensure_db_initialized()
+        
+        cursor = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'term_positions'"
+        )
+        return cursor.fetchone() is not None
+
+    def build_concordance(self) -> int:
+        """Build (or rebuild) the positional word index of the stored verses.
+        
+        Databases loaded with concordance=True already have it; sync() keeps
+        it up to date once it exists.
+        
+        Returns:
+            Number of word occurrences indexed.
+            
+        Raises:
+            Exception: If the database is not initialized.
+        """
+        self._ensure_db_initialized()
+        
+        try:
+            count = self._build_concordance()
+            self._db.commit()
+        except Exception:
+            self._db.rollback()
+            raise
+        return count
+
+    def _build_concordance(self) -> int:
+        """Tokenize every verse into the terms and term_positions tables (without committing).
+        
+        Occurrences are first appended to a temporary table in verse order,
+        then copied sorted by term, so the clustered term_positions table is
+        written in key order instead of by random inserts.
+        
+        Returns:
+            Number of word occurrences indexed.
+        """
         cursor = self._db.cursor()
+        for statement in CONCORDANCE_SCHEMA:
+            cursor.execute(statement)
+        cursor.execute("DELETE FROM term_positions")
+        cursor.execute("DELETE FROM terms")
+        cursor.execute("DROP TABLE IF EXISTS temp.term_positions_load")
         cursor.execute(
+            "CREATE TEMP TABLE term_positions_load (term_key, verse_id, position, char_offset)"
+        )
+        
+        keys: Dict[str, int] = {}
+        # [verse_count, occurrences] per term key - 1
+        counts: List[List[int]] = []
+        batch: List[Tuple[int, int, int, int]] = []
+        total = 0
+        reader = self._db.cursor()
+        reader.row_factory = None
+        for verse_id, text in reader.execute("SELECT id, text FROM verses"):
+            seen = set()
+            for position, offset, term in tokenize(text or ""):
+                key = keys.get(term)
+                if key is None:
+                    key = keys[term] = len(keys) + 1
+                    counts.append([0, 0])
+                term_counts = counts[key - 1]
+                term_counts[1] += 1
+                if key not in seen:
+                    seen.add(key)
+                    term_counts[0] += 1
+                batch.append((key, verse_id, position, offset))
+            if len(batch) >= self.CONCORDANCE_BATCH_SIZE:
+                cursor.executemany("INSERT INTO term_positions_load VALUES (?, ?, ?, ?)", batch)
+                total += len(batch)
+                batch.clear()
+        cursor.executemany("INSERT INTO term_positions_load VALUES (?, ?, ?, ?)", batch)
+        total += len(batch)
+        
+        cursor.execute("""
+            INSERT INTO term_positions (term_key, verse_id, position, char_offset)
+            SELECT term_key, verse_id, position, char_offset FROM term_positions_load
+            ORDER BY term_key, verse_id, position
+        """)
+        cursor.execute("DROP TABLE temp.term_positions_load")
+        cursor.executemany(
+            "INSERT INTO terms (key, term, verse_count, occurrences) VALUES (?, ?, ?, ?)",
+            (
+                (key, term, counts[key - 1][0], counts[key - 1][1])
+                for term, key in keys.items()
+            ),
+        )
+        return total
+
+    def _update_concordance(self, old_texts: Dict[int, str], new_ids: List[int]) -> None:
+        """Re-index the words of changed verses (without committing).
+        
+        The positions of each old text are deleted by primary key and its words
+        taken off the term counts; then the current text of the updated and
+        inserted verses is tokenized and added back. Terms left without
+        occurrences are removed, so the tables match a full rebuild.
+        
+        Args:
+            old_texts: Indexed text of updated and deleted verses by id.
+            new_ids: Ids of inserted verses.
+        """
+        cursor = self._db.cursor()
+        keys: Dict[str, int] = {}
+        # [verse_count, occurrences] change per term key
+        deltas: Dict[int, List[int]] = {}
+        
+        def term_key(term: str) -> Optional[int]:
+            key = keys.get(term)
+            if key is None:
+                row = cursor.execute("SELECT key FROM terms WHERE term = ?", (term,)).fetchone()
+                if row is None:
+                    return None
+                key = keys[term] = row[0]
+            return key
+        
+        def count(key: int, step: int, seen: set) -> None:
+            term_deltas = deltas.setdefault(key, [0, 0])
+            term_deltas[1] += step
+            if key not in seen:
+                seen.add(key)
+                term_deltas[0] += step
+        
+        removed: List[Tuple[int, int, int]] = []
+        for verse_id, text in old_texts.items():
+            seen: set = set()
+            for position, _, term in tokenize(text or ""):
+                key = term_key(term)
+                if key is not None:
+                    removed.append((key, verse_id, position))
+                    count(key, -1, seen)
+        cursor.executemany(
+            "DELETE FROM term_positions WHERE term_key = ? AND verse_id = ? AND position = ?",
+            removed,
+        )
+        
+        added: List[Tuple[int, int, int, int]] = []
+        reader = self._db.cursor()
+        reader.row_factory = None
+        for verse_id in sorted(set(old_texts).union(new_ids)):
+            row = reader.execute("SELECT text FROM verses WHERE id = ?", (verse_id,)).fetchone()
+            if row is None:
+                continue
+            seen = set()
+            for position, offset, term in tokenize(row[0] or ""):
+                key = term_key(term)
+                if key is None:
+                    cursor.execute(
+                        "INSERT INTO terms (term, verse_count, occurrences) VALUES (?, 0, 0)",
+                        (term,),
+                    )
+                    key = keys[term] = cursor.lastrowid
+                added.append((key, verse_id, position, offset))
+                count(key, 1, seen)
+        cursor.executemany("INSERT INTO term_positions VALUES (?, ?, ?, ?)", added)
+        
+        cursor.executemany(
+            "UPDATE terms SET verse_count = verse_count + ?, occurrences = occurrences + ? "
+            "WHERE key = ?",
+            (
+                (verse_count, occurrences, key)
+                for key, (verse_count, occurrences) in deltas.items()
+                if verse_count or occurrences
+            ),
+        )
+        cursor.executemany(
+            "DELETE FROM terms WHERE key = ? AND occurrences = 0",
+            ((key,) for key, (_, occurrences) in deltas.items() if occurrences < 0),
+        )
+
+    def _ensure_concordance(self) -> None:
+        """Raise unless the positional word index has been built."""
+        if not self.has_concordance():
+            raise Exception(
+                "Concordance index not built. Load with concordance=True "
+                "or call build_concordance() first."
+            )
+
+    def get_concordance(self, word: str, limit: Optional[int] = None) -> List[WordOccurrence]:
+        """Get every occurrence of a word from the positional word index.
+        
+        The word's occurrences are one index range scan; no verse is
+        tokenized at query time.
+        
+        Args:
+            word: Word to look up (case-insensitive).
+            limit: Maximum number of occurrences (all by default).
+            
+        Returns:
+            WordOccurrence objects in verse id order (reading order for a
+            freshly loaded database), then word position.
+            
+        Raises:
+            ValueError: If word is not a single word.
+            Exception: If the concordance index has not been built.
+        """
+        self._ensure_db_initialized()
+        self._ensure_concordance()
+        start = time.perf_counter() if self.instrumentation is not None else 0.0
+        
+        cursor = self._db.cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(
+            f"""
+            SELECT p.position, p.char_offset, {self._VERSE_COLUMNS}
+            FROM terms t
+            INNER JOIN term_positions p ON p.term_key = t.key
+            INNER JOIN verses v ON v.id = p.verse_id
+            INNER JOIN books b ON b.key = v.book_key
+            WHERE t.term = ?
+            ORDER BY p.verse_id, p.position
+            LIMIT ?
+            """,
+            (normalize_term(word), -1 if limit is None else limit),
+        ).fetchall()
+        occurrences = [WordOccurrence(Verse(*row[2:]), row[0], row[1]) for row in rows]
+        
+        if self.instrumentation is not None:
+            self._record_query("get_concordance", start, len(occurrences))
+        return occurrences
+
+    def get_word_frequency(self, word: str) -> Tuple[int, int]:
+        """Get how often a word occurs.
+        
+        Args:
+            word: Word to look up (case-insensitive).
+            
+        Returns:
+            Tuple of (occurrences, verse count); (0, 0) if the word does not occur.
+            
+        Raises:
+            ValueError: If word is not a single word.
+            Exception: If the concordance index has not been built.
+        """
+        self._ensure_db_initialized()
+        self._ensure_concordance()
+        
+        row = self._db.execute(
+            "SELECT occurrences, verse_count FROM terms WHERE term = ?", (normalize_term(word),)
+        ).fetchone()
+        return (row["occurrences"], row["verse_count"]) if row else (0, 0)
+
+    def get_word_frequencies(self, limit: Optional[int] = 100) -> List[Tuple[str, int, int]]:
+        """Get the most frequent words.
+        
+        Args:
+            limit: Maximum number of words (all if None).
+            
+        Returns:
+            (term, occurrences, verse count) tuples, most frequent first.
+            
+        Raises:
+            Exception: If the concordance index has not been built.
+        """
+        self._ensure_db_initialized()
+        self._ensure_concordance()
+        
+        cursor = self._db.cursor()
+        cursor.row_factory = None
+        return cursor.execute(
             """
-            SELECT v.book_id, v.chapter_num, v.verse_num, v.text
-            FROM verses v
-            INNER JOIN verses_fts fts ON v.id = fts.rowid
-            WHERE verses_fts MATCH ?
+            SELECT term, occurrences, verse_count FROM terms
+            ORDER BY occurrences DESC
             LIMIT ?
             """,
-            (query, limit),
-        )
+            (-1 if limit is None else limit,),
+        ).fetchall()
+
+    def _record_query(self, query: str, start: float, rows: int) -> None:
+        """Report the latency and row count of a query to the instrumentation.
         
-        verses = []
-        for row in cursor.fetchall():
-            verses.append(Verse.from_dict(dict(row)))
+        Args:
+            query: Query method name (e.g., 'get_verse').
+            start: perf_counter() value taken when the query started.
+            rows: Number of rows returned.
+        """
+        self.instrumentation.timing(f"query.{query}", time.perf_counter() - start)
+        self.instrumentation.increment("query.rows", rows, {"query": query})
+
+    def profile_report(self, limit: Optional[int] = None) -> str:
+        """Get the SQL profile collected since the repository was created.
         
-        return verses
+        Args:
+            limit: Maximum number of statements to include, slowest first.
+            
+        Returns:
+            Text report with each statement's calls, rows, wall time and query
+            plan, with full scans and temporary B-trees flagged.
+            
+        Raises:
+            Exception: If the repository was not created with profile=True.
+        """
+        if self.profiler is None:
+            raise Exception("Profiling is not enabled. Create the repository with profile=True.")
+        return self.profiler.report(limit)
 
     def close(self) -> None:
         """Close the database connection."""
         if self._db is not None:
             self._db.close()
             self._db = None
+            self._cursor = None
 
     def _ensure_db_initialized(self) -> None:
         """Ensure database is initialized before use.
@@ -0,0 +1,304 @@
+"""The ``bible-parser`` command-line interface.
+
+Subcommands:
+
+* ``build`` loads a Bible file into a BibleRepository database, or a directory
+  of Bible files into a MultiTranslationRepository database using a process
+  pool. Rebuilding an existing single-translation database syncs it.
+* ``lookup`` resolves references through BibleReferenceFormatter.
+* ``search`` runs a full-text search.
+* ``export`` streams verses to JSON Lines, CSV or Parquet.
+* ``serve`` answers queries over HTTP (see bible_parser.server).
+* ``bench`` runs the benchmark suite (see ``python -m bible_parser.benchmarks``).
+
+Results are printed to stdout as a single JSON document so they can be piped
+into other tools; errors go to stderr with exit code 1. Library modules are
+imported by the subcommand that needs them, so ``--help`` and light commands
+start without loading the parsers.
+
+Example:
+    $ bible-parser build bible.xml bible.db
+    $ bible-parser lookup bible.db "John 3:16-18"
+    $ bible-parser search bible.db grace --limit 5
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, List, Optional
+
+# Values of --schema and --format; kept here so building the parser imports nothing
+_SCHEMAS = ("standard", "clustered")
+_EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+
+
+def _emit(result: Any, pretty: bool) -> None:
+    """Print a result as JSON on stdout."""
+    print(json.dumps(result, ensure_ascii=False, indent=2 if pretty else None))
+
+
+def _open_repository(database: str) -> Any:
+    """Open an existing single-translation database for querying.
+
+    Raises:
+        Exception: If the database file does not exist.
+    """
+    if not Path(database).exists():
+        raise Exception(f"Database '{database}' does not exist; create it with 'build'")
+    from bible_parser.bible_repository import BibleRepository
+
+    repository = BibleRepository()
+    repository.initialize(database)
+    return repository
+
+
+def _build(args: argparse.Namespace) -> Any:
+    """Load a Bible file or a directory of Bible files into a database."""
+    source = Path(args.source)
+    if source.is_dir():
+        from bible_parser.corpus import ingest_corpus
+
+        report = ingest_corpus(
+            source,
+            database_name=args.database,
+            workers=args.workers,
+            format=args.format,
+            versification=args.versification,
+            replace=args.replace,
+            batch_size=args.batch_size,
+        )
+        return {
+            "database": args.database,
+            "translations": [
+                {
+                    "translation_id": result.translation_id,
+                    "path": str(result.path),
+                    "format": result.format,
+                    "books": result.books,
+                    "verses": result.verses,
+                    "seconds": result.seconds,
+                    "error": result.error,
+                }
+                for result in report.results
+            ],
+            "verses": report.total_verses,
+            "seconds": report.seconds,
+            "failed": len(report.failed),
+        }
+
+    from bible_parser.bible_repository import BibleRepository
+    from bible_parser.instrumentation import MetricsRecorder
+
+    metrics = MetricsRecorder()
+    with BibleRepository(
+        xml_path=args.source,
+        format=args.format,
+        versification=args.versification or "KJV",
+        pipeline=not args.no_pipeline,
+        instrumentation=metrics,
+        schema=args.schema,
+        concordance=args.concordance,
+    ) as repository:
+        repository.initialize(args.database)
+        result = {"database": args.database, "books": len(repository.get_books())}
+        # initialize() loads the source itself into a new or empty database;
+        # a database that was already populated is synced instead
+        if "load.total" in metrics.histograms:
+            result["verses"] = metrics.counters.get("load.verses", 0)
+        else:
+            result["sync"] = asdict(repository.sync())
+            if args.concordance and not repository.has_concordance():
+                repository.build_concordance()
+        histogram = metrics.histograms.get("repository.initialize")
+        result["seconds"] = histogram.total if histogram else 0.0
+    if args.metrics:
+        result["metrics"] = metrics.summary()
+    return result
+
+
+def _lookup(args: argparse.Namespace) -> Any:
+    """Resolve references to verses."""
+    from bible_parser.reference_formatter import BibleReferenceFormatter
+
+    with _open_repository(args.database) as repository:
+        return [
+            {
+                "reference": reference,
+                "verses": [
+                    verse.to_dict()
+                    for verse in BibleReferenceFormatter.get_verses_from_reference(
+                        reference, repository, versification=args.versification
+                    )
+                ],
+            }
+            for reference in args.references
+        ]
+
+
+def _search(args: argparse.Namespace) -> Any:
+    """Run a full-text search."""
+    with _open_repository(args.database) as repository:
+        return [verse.to_dict() for verse in repository.search_verses(args.query, args.limit)]
+
+
+def _export(args: argparse.Namespace) -> Any:
+    """Stream verses to a file, or to stdout for '-'."""
+    with _open_repository(args.database) as repository:
+        if args.destination == "-":
+            # The export itself is the output, so no summary is printed
+            repository.export(
+                sys.stdout, args.format or "jsonl", args.start_book, args.end_book
+            )
+            return None
+        count = repository.export(args.destination, args.format, args.start_book, args.end_book)
+        return {"destination": args.destination, "verses": count}
+
+
+def _serve(args: argparse.Namespace) -> Any:
+    """Serve a database over HTTP until interrupted."""
+    from bible_parser.server import BibleServer
+
+    with BibleServer(
+        args.database,
+        host=args.host,
+        port=args.port,
+        pool_size=args.pool_size,
+        cache_size=args.cache_size,
+        log_requests=not args.quiet,
+    ) as server:
+        print(f"Serving {args.database} on {server.url}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser of the bible-parser command.
+
+    Returns:
+        The configured ArgumentParser.
+    """
+    parser = argparse.ArgumentParser(
+        prog="bible-parser",
+        description="Build, query and export Bible databases.",
+    )
+    parser.add_argument("--pretty", action="store_true", help="indent the JSON output")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build = commands.add_parser(
+        "build", help="load a Bible file (or a directory of them) into a database"
+    )
+    build.add_argument("source", help="Bible XML file, or a directory of Bible files")
+    build.add_argument("database", help="SQLite database to create or sync")
+    build.add_argument("--format", type=str.upper, help="source format (default: detect)")
+    build.add_argument("--versification", help="scheme the source is numbered in (default: KJV)")
+    build.add_argument(
+        "--schema", choices=_SCHEMAS, default="standard",
+        help="verses table layout for a new database (default: standard)",
+    )
+    build.add_argument(
+        "--no-pipeline", action="store_true",
+        help="parse and insert in one thread instead of overlapping them",
+    )
+    build.add_argument(
+        "--workers", type=int,
+        help="worker processes for a directory of files (default: CPU count)",
+    )
+    build.add_argument(
+        "--batch-size", type=int, default=2000,
+        help="verses per batch sent from a worker to the writer (default: 2000)",
+    )
+    build.add_argument(
+        "--replace", action="store_true", help="replace translations that are already loaded"
+    )
+    build.add_argument(
+        "--concordance", action="store_true",
+        help="also build the positional word index (see bible_parser.concordance)",
+    )
+    build.add_argument("--metrics", action="store_true", help="include load metrics")
+    build.set_defaults(handler=_build)
+
+    lookup = commands.add_parser("lookup", help="get the verses of one or more references")
+    lookup.add_argument("database", help="database created with 'build'")
+    lookup.add_argument("references", nargs="+", help="references such as 'John 3:16-18'")
+    lookup.add_argument("--versification", help="scheme the references are numbered in")
+    lookup.set_defaults(handler=_lookup)
+
+    search = commands.add_parser("search", help="full-text search")
+    search.add_argument("database", help="database created with 'build'")
+    search.add_argument("query", help="FTS5 query")
+    search.add_argument("--limit", type=int, default=100, help="maximum results (default: 100)")
+    search.set_defaults(handler=_search)
+
+    export = commands.add_parser("export", help="stream verses to JSON Lines, CSV or Parquet")
+    export.add_argument("database", help="database created with 'build'")
+    export.add_argument("destination", help="output file, or '-' for stdout")
+    export.add_argument(
+        "--format", choices=_EXPORT_FORMATS, help="output format (default: from the extension)"
+    )
+    export.add_argument("--start-book", help="first book to export")
+    export.add_argument("--end-book", help="last book to export")
+    export.set_defaults(handler=_export)
+
+    serve = commands.add_parser("serve", help="answer verse queries over HTTP")
+    serve.add_argument("database", help="database created with 'build'")
+    serve.add_argument("--host", default="127.0.0.1", help="interface (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8000, help="port (default: 8000)")
+    serve.add_argument(
+        "--pool-size", type=int, default=4, help="read-only connections (default: 4)"
+    )
+    serve.add_argument(
+        "--cache-size", type=int, default=1024, help="cached responses (default: 1024)"
+    )
+    serve.add_argument("--quiet", action="store_true", help="do not log requests")
+    serve.set_defaults(handler=_serve)
+
+    # Listed for --help only; main() hands what follows 'bench' to the runner
+    commands.add_parser("bench", help="run the benchmark suite", add_help=False)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the bible-parser command.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code: 0 on success, 1 on errors or failed translations.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    # Global options take no values, so the first positional is the subcommand
+    command = next((i for i, arg in enumerate(argv) if not arg.startswith("-")), None)
+    if command is not None and argv[command] == "bench":
+        # Check the global options (answering --help) and let the runner parse
+        # its own, including --help
+        build_parser().parse_args(argv[:command + 1])
+        from bible_parser.benchmarks.__main__ import main as bench_main
+
+        return bench_main(argv[command + 1:])
+
+    args = build_parser().parse_args(argv)
+    try:
+        result = args.handler(args)
+        if result is not None:
+            _emit(result, args.pretty)
+    except BrokenPipeError:
+        # The reader (e.g. head) went away; silence the flush at interpreter exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except Exception as e:
+        print(f"bible-parser: error: {e}", file=sys.stderr)
+        return 1
+    return 1 if isinstance(result, dict) and result.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
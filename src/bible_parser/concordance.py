@@ -0,0 +1,132 @@
+"""Positional word index for concordance and word-frequency queries.
+
+A repository created with ``concordance=True`` (or after calling
+``build_concordance()``) stores every word of every verse in two tables:
+
+* ``terms`` - one row per distinct lower-cased word with the number of verses
+  containing it and its total number of occurrences.
+* ``term_positions`` - one row per occurrence: term, verse id, token position
+  within the verse and character offset in the verse text, clustered by term so
+  a word's occurrences are a single index range scan.
+
+Words are runs of letters and digits, matching the default tokenizer of the
+FTS5 search index except that diacritics are kept. Character offsets let a
+concordance line be cut out of the verse text without tokenizing it again.
+
+Example:
+    >>> with BibleRepository(xml_path='bible.xml', concordance=True) as repo:
+    ...     repo.initialize('bible.db')
+    ...     for occurrence in repo.get_concordance('grace', limit=5):
+    ...         print(occurrence.reference, occurrence.snippet())
+    ...     print(repo.get_word_frequencies(limit=10))
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterator, Tuple
+
+from bible_parser.models import Verse
+
+# A word: letters and digits (underscore is a word character for \w, not here)
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+CONCORDANCE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS terms (
+        key INTEGER PRIMARY KEY,
+        term TEXT NOT NULL UNIQUE,
+        verse_count INTEGER NOT NULL,
+        occurrences INTEGER NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_terms_occurrences ON terms (occurrences, term, verse_count)",
+    """
+    CREATE TABLE IF NOT EXISTS term_positions (
+        term_key INTEGER NOT NULL,
+        verse_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        char_offset INTEGER NOT NULL,
+        PRIMARY KEY (term_key, verse_id, position)
+    ) WITHOUT ROWID
+    """,
+)
+
+
+def tokenize(text: str) -> Iterator[Tuple[int, int, str]]:
+    """Split verse text into indexed words.
+
+    Args:
+        text: Verse text.
+
+    Yields:
+        (position, char_offset, term) per word: the 0-based token position,
+        the offset of its first character and the lower-cased word.
+    """
+    for position, match in enumerate(TOKEN_PATTERN.finditer(text)):
+        yield position, match.start(), match.group().lower()
+
+
+def normalize_term(word: str) -> str:
+    """Normalize a word the way tokenize() does.
+
+    Args:
+        word: Word to look up.
+
+    Returns:
+        The lower-cased word.
+
+    Raises:
+        ValueError: If word is not a single word.
+    """
+    terms = [term for _, _, term in tokenize(word)]
+    if len(terms) != 1:
+        raise ValueError(f"Expected a single word, got '{word}'")
+    return terms[0]
+
+
+@dataclass
+class WordOccurrence:
+    """One occurrence of a word in a verse.
+
+    Attributes:
+        verse: The verse containing the word.
+        position: 0-based position of the word among the verse's words.
+        offset: Offset of the word's first character in verse.text.
+    """
+
+    verse: Verse
+    position: int
+    offset: int
+
+    @property
+    def word(self) -> str:
+        """The word as written in the verse."""
+        match = TOKEN_PATTERN.match(self.verse.text, self.offset)
+        return match.group() if match else ""
+
+    @property
+    def reference(self) -> str:
+        """Reference of the verse in book.chapter.verse form."""
+        return f"{self.verse.book_id}.{self.verse.chapter_num}.{self.verse.num}"
+
+    def snippet(self, width: int = 30) -> str:
+        """Keyword-in-context line with the word in brackets.
+
+        Args:
+            width: Maximum characters of context on each side.
+
+        Returns:
+            The word with up to width characters before and after it, marked
+            with '...' where the verse text was cut.
+        """
+        text = self.verse.text
+        end = self.offset + len(self.word)
+        start = max(0, self.offset - width)
+        stop = min(len(text), end + width)
+        return (
+            ("..." if start > 0 else "")
+            + text[start:self.offset]
+            + f"[{text[self.offset:end]}]"
+            + text[end:stop]
+            + ("..." if stop < len(text) else "")
+        )
@@ -0,0 +1,512 @@
+"""Bulk ingestion of a directory of Bible translations.
+
+Files are parsed in a process pool. With a shared database, workers stream
+book and verse batches through one bounded queue to a single writer, the only
+process that touches SQLite. When the queue is full, workers block until the
+writer catches up, so memory stays bounded however fast parsing is. The writer
+stages each translation's batches in temporary tables and writes the whole
+translation in one transaction once it is complete, so an interrupted run
+leaves only fully loaded translations behind. With one database per
+translation, every worker writes its own file and no queue is needed.
+
+A file that fails to parse or load is recorded in the report and the rest of
+the batch carries on.
+"""
+
+import functools
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+# Python 3.9+ uses collections.abc, Python 3.8 uses typing
+if sys.version_info >= (3, 9):
+    from collections.abc import Iterator
+else:
+    from typing import Iterator
+
+from bible_parser.bible_parser import BibleParser
+from bible_parser.bible_repository import BibleRepository
+from bible_parser.multi_repository import MultiTranslationRepository
+
+# File names picked up when walking a corpus directory. Zip archives are left
+# out: one may hold several Bibles (see BibleParser.iter_archive), and a job
+# reads one Bible per file; single-Bible zips can still be listed explicitly.
+DEFAULT_PATTERNS = ("*.xml", "*.xml.gz", "*.xml.bz2", "*.xml.xz")
+
+_COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz", ".zip")
+
+# Queue shared with the worker processes (set by _init_worker)
+_worker_queue: Any = None
+
+# Message exchanged between workers and the writer
+_Message = Tuple[Any, ...]
+
+
+@dataclass
+class IngestResult:
+    """Outcome of ingesting one file.
+
+    Attributes:
+        path: The source file.
+        translation_id: Key the translation was loaded under.
+        format: Detected (or given) Bible format, if parsing started.
+        books: Number of books loaded.
+        verses: Number of verses loaded.
+        bytes: Size of the source file in bytes.
+        seconds: Time from the start of parsing until the translation was
+            written, including time spent waiting on the writer.
+        error: Error message if the file failed, None otherwise.
+    """
+
+    path: Path
+    translation_id: str
+    format: Optional[str] = None
+    books: int = 0
+    verses: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the file was loaded."""
+        return self.error is None
+
+    @property
+    def verses_per_second(self) -> float:
+        """Throughput of this file."""
+        return self.verses / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        if not self.ok:
+            return f"{self.path.name} ({self.translation_id}): FAILED - {self.error}"
+        return (
+            f"{self.path.name} ({self.translation_id}, {self.format}): "
+            f"{self.verses} verses in {self.seconds:.2f}s "
+            f"({self.verses_per_second:,.0f} verses/s)"
+        )
+
+
+@dataclass
+class CorpusReport:
+    """Summary of a corpus ingestion run.
+
+    Attributes:
+        results: Per-file results in the order files were found.
+        seconds: Wall-clock time of the whole run.
+    """
+
+    results: List[IngestResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> List[IngestResult]:
+        """Results of the files that were loaded."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> List[IngestResult]:
+        """Results of the files that failed."""
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def total_verses(self) -> int:
+        """Number of verses loaded across all files."""
+        return sum(result.verses for result in self.results)
+
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        rate = self.total_verses / self.seconds if self.seconds > 0 else 0.0
+        lines = [str(result) for result in self.results]
+        lines.append(
+            f"{len(self.succeeded)} loaded, {len(self.failed)} failed; "
+            f"{self.total_verses} verses in {self.seconds:.2f}s ({rate:,.0f} verses/s)"
+        )
+        return "\n".join(lines)
+
+
+def find_bible_files(
+    directory: Union[str, Path],
+    patterns: Iterable[str] = DEFAULT_PATTERNS,
+    recursive: bool = True,
+) -> List[Path]:
+    """Find Bible files in a directory.
+
+    Args:
+        directory: Directory to search.
+        patterns: Glob patterns of files to include.
+        recursive: Also search subdirectories.
+
+    Returns:
+        Sorted list of matching file paths.
+    """
+    root = Path(directory)
+    found: Set[Path] = set()
+    for pattern in patterns:
+        matches = root.rglob(pattern) if recursive else root.glob(pattern)
+        found.update(path for path in matches if path.is_file())
+    return sorted(found)
+
+
+def translation_id_for(path: Union[str, Path]) -> str:
+    """Derive a translation key from a file name.
+
+    Args:
+        path: Path of a Bible file (e.g., 'bibles/KJV.xml.gz').
+
+    Returns:
+        The lower-case name without '.xml' and compression suffixes (e.g., 'kjv').
+    """
+    name = Path(path).name.lower()
+    for suffix in _COMPRESSION_SUFFIXES:
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+            break
+    if name.endswith(".xml"):
+        name = name[: -len(".xml")]
+    return name
+
+
+def ingest_corpus(
+    source: Union[str, Path, Iterable[Union[str, Path]]],
+    database_name: Optional[str] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    workers: Optional[int] = None,
+    format: Optional[str] = None,
+    versification: Optional[str] = None,
+    replace: bool = False,
+    batch_size: int = 2000,
+    queue_size: int = 64,
+    translation_id: Callable[[Path], str] = translation_id_for,
+    progress: Optional[Callable[[IngestResult], None]] = None,
+) -> CorpusReport:
+    """Parse and load a directory (or list) of Bible files in parallel.
+
+    Exactly one of database_name and output_dir must be given.
+
+    Args:
+        source: Directory to walk (see find_bible_files) or explicit file paths.
+        database_name: Shared MultiTranslationRepository database to load every
+            translation into.
+        output_dir: Directory receiving one BibleRepository database per
+            translation, named '<translation_id>.db'.
+        workers: Number of worker processes (defaults to the CPU count). 0
+            parses in the calling process, which is useful for debugging.
+        format: Optional format applied to every file (auto-detected otherwise).
+        versification: Scheme the files are numbered in (defaults to KJV).
+        replace: Replace translations that are already loaded.
+        batch_size: Verses per batch sent from a worker to the writer.
+        queue_size: Maximum number of batches waiting for the writer.
+        translation_id: Function mapping a file path to its translation key.
+        progress: Optional callback invoked with each IngestResult as soon as
+            the file finishes.
+
+    Returns:
+        A CorpusReport with one result per file.
+
+    Raises:
+        Exception: If not exactly one of database_name and output_dir is given.
+    """
+    if (database_name is None) == (output_dir is None):
+        raise Exception("Specify exactly one of database_name or output_dir")
+
+    if isinstance(source, (str, Path)):
+        paths = find_bible_files(source)
+    else:
+        paths = [Path(path) for path in source]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    start = time.perf_counter()
+    report = CorpusReport(
+        results=[
+            IngestResult(path=path, translation_id=translation_id(path), bytes=_file_size(path))
+            for path in paths
+        ]
+    )
+
+    seen = set()
+    for result in report.results:
+        if result.translation_id in seen:
+            result.error = f"Duplicate translation id '{result.translation_id}'"
+        seen.add(result.translation_id)
+
+    if database_name is not None:
+        _ingest_shared(
+            report.results, database_name, workers, format, versification,
+            replace, batch_size, queue_size, progress,
+        )
+    elif output_dir is not None:
+        _ingest_separate(
+            report.results, Path(output_dir), workers, format, versification,
+            replace, progress,
+        )
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def _file_size(path: Path) -> int:
+    """Get a file's size, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _iter_messages(
+    path: Path, translation_id: str, format: Optional[str], batch_size: int
+) -> Iterator[_Message]:
+    """Parse one file into messages for the writer.
+
+    Yields ('start', id, format), then ('books', id, rows) and
+    ('verses', id, rows) batches, and finally ('done', id, seconds) or
+    ('error', id, message, seconds).
+    """
+    start = time.perf_counter()
+    try:
+        with BibleParser(path, format=format) as parser:
+            yield ("start", translation_id, parser.format)
+
+            batch: List[Tuple[str, int, int, str]] = []
+            for book in parser.books:
+                yield ("books", translation_id, [(book.id, book.num, book.title)])
+                for verse in book.verses:
+                    batch.append((verse.book_id, verse.chapter_num, verse.num, verse.text))
+                    if len(batch) >= batch_size:
+                        yield ("verses", translation_id, batch)
+                        batch = []
+            if batch:
+                yield ("verses", translation_id, batch)
+
+        yield ("done", translation_id, time.perf_counter() - start)
+    except Exception as e:
+        yield ("error", translation_id, str(e), time.perf_counter() - start)
+
+
+def _init_worker(shared_queue: Any) -> None:
+    """Keep the shared queue in a worker process."""
+    global _worker_queue
+    _worker_queue = shared_queue
+
+
+def _produce(path: Path, translation_id: str, format: Optional[str], batch_size: int) -> None:
+    """Worker task: parse a file and push its messages onto the shared queue."""
+    for message in _iter_messages(path, translation_id, format, batch_size):
+        # Blocks while the queue is full: back-pressure from the writer
+        _worker_queue.put(message)
+
+
+class _Writer:
+    """Applies worker messages to a shared MultiTranslationRepository."""
+
+    def __init__(
+        self,
+        repo: MultiTranslationRepository,
+        results: Dict[str, IngestResult],
+        versification: Optional[str],
+        replace: bool,
+        progress: Optional[Callable[[IngestResult], None]],
+    ):
+        self.repo = repo
+        self.results = results
+        self.scheme = versification or repo.versification
+        self.replace = replace
+        self.progress = progress
+        self.pending = set(results)
+
+    def handle(self, message: _Message) -> None:
+        """Apply one message; failures only affect that translation."""
+        kind, translation_id = message[0], message[1]
+        result = self.results[translation_id]
+        if translation_id not in self.pending:
+            return
+
+        try:
+            if kind == "start":
+                result.format = message[2]
+                self.repo.stage_translation(
+                    translation_id, result.format, versification=self.scheme
+                )
+            elif kind == "books":
+                self.repo.stage_books(translation_id, message[2])
+                result.books += len(message[2])
+            elif kind == "verses":
+                result.verses += self.repo.stage_verses(translation_id, message[2])
+            elif kind == "done":
+                self.repo.commit_translation(translation_id, replace=self.replace)
+                result.seconds = message[2]
+                self._finish(result)
+            elif kind == "error":
+                self.fail(translation_id, message[2], message[3])
+        except Exception as e:
+            self.fail(translation_id, str(e))
+
+    def fail(self, translation_id: str, error: str, seconds: float = 0.0) -> None:
+        """Record a failure and drop whatever was staged for the translation."""
+        if translation_id not in self.pending:
+            return
+        result = self.results[translation_id]
+        result.error = error
+        result.seconds = seconds
+        result.books = result.verses = 0
+        self.repo.discard_translation(translation_id)
+        self._finish(result)
+
+    def _finish(self, result: IngestResult) -> None:
+        """Mark a translation as finished and report it."""
+        self.pending.discard(result.translation_id)
+        if self.progress is not None:
+            self.progress(result)
+
+
+def _ingest_shared(
+    results: List[IngestResult],
+    database_name: str,
+    workers: int,
+    format: Optional[str],
+    versification: Optional[str],
+    replace: bool,
+    batch_size: int,
+    queue_size: int,
+    progress: Optional[Callable[[IngestResult], None]],
+) -> None:
+    """Load files into one database through a single writer."""
+    with MultiTranslationRepository() as repo:
+        repo.initialize(database_name)
+
+        todo = {}
+        for result in results:
+            if result.error is not None:
+                continue
+            # A replaced translation is deleted when its successor is committed
+            if repo.has_translation(result.translation_id) and not replace:
+                result.error = f"Translation '{result.translation_id}' is already loaded"
+                continue
+            todo[result.translation_id] = result
+
+        writer = _Writer(repo, todo, versification, replace, progress)
+
+        if workers == 0:
+            for result in todo.values():
+                for message in _iter_messages(result.path, result.translation_id, format, batch_size):
+                    writer.handle(message)
+            return
+
+        context = multiprocessing.get_context()
+        shared_queue = context.Queue(maxsize=queue_size)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(shared_queue,),
+        ) as pool:
+            futures: Dict[Future, str] = {
+                pool.submit(_produce, result.path, translation_id, format, batch_size): translation_id
+                for translation_id, result in todo.items()
+            }
+
+            while writer.pending:
+                try:
+                    writer.handle(shared_queue.get(timeout=0.1))
+                except queue.Empty:
+                    # A worker that died cannot report its own failure
+                    for future, translation_id in futures.items():
+                        if future.done() and future.exception() is not None:
+                            writer.fail(translation_id, str(future.exception()))
+
+            # Discard batches of translations the writer already gave up on,
+            # so their workers are not left blocked on a full queue
+            while not all(future.done() for future in futures):
+                try:
+                    shared_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+
+def _load_separate(
+    path: Path,
+    database_name: str,
+    format: Optional[str],
+    versification: Optional[str],
+) -> Tuple[Optional[str], int, int, float]:
+    """Worker task: build one translation's database.
+
+    Returns:
+        Tuple of (format, books, verses, seconds).
+    """
+    start = time.perf_counter()
+    with BibleRepository(
+        xml_path=path, format=format, versification=versification or "KJV"
+    ) as repo:
+        repo.initialize(database_name)
+        books = repo.get_books()
+        verses = sum(repo.get_verse_count(book.id) for book in books)
+        detected = repo.get_metadata().get("format")
+    return detected, len(books), verses, time.perf_counter() - start
+
+
+def _ingest_separate(
+    results: List[IngestResult],
+    output_dir: Path,
+    workers: int,
+    format: Optional[str],
+    versification: Optional[str],
+    replace: bool,
+    progress: Optional[Callable[[IngestResult], None]],
+) -> None:
+    """Load every file into its own database, one worker per file."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Each database is built under a temporary name and moved over the old one
+    # only once it is complete, so a failed replacement keeps the old database
+    todo = []
+    for result in results:
+        if result.error is not None:
+            continue
+        database = output_dir / f"{result.translation_id}.db"
+        if database.exists() and not replace:
+            result.error = f"Database '{database}' already exists"
+            continue
+        partial = str(database.with_name(f"{database.name}.partial"))
+        Path(partial).unlink(missing_ok=True)
+        todo.append((result, partial))
+
+    def record(result: IngestResult, partial: str, task: Callable[[], Tuple[Any, ...]]) -> None:
+        try:
+            result.format, result.books, result.verses, result.seconds = task()
+            os.replace(partial, partial[: -len(".partial")])
+        except Exception as e:
+            result.error = str(e)
+            Path(partial).unlink(missing_ok=True)
+        if progress is not None:
+            progress(result)
+
+    if workers == 0:
+        for result, partial in todo:
+            record(
+                result,
+                partial,
+                functools.partial(_load_separate, result.path, partial, format, versification),
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_load_separate, result.path, partial, format, versification): (
+                result,
+                partial,
+            )
+            for result, partial in todo
+        }
+        for future in as_completed(futures):
+            result, partial = futures[future]
+            record(result, partial, future.result)
@@ -41,3 +41,9 @@ class ReferenceFormatError(BibleParserException):
     """
 
     pass
+
+
+class VersificationError(BibleParserException):
+    """Raised when a versification scheme is unknown or a reference cannot be mapped."""
+
+    pass
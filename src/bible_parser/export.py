@@ -0,0 +1,252 @@
+"""Streaming export of verses to JSON Lines, CSV and Parquet.
+
+Repositories read verses one book at a time and rows are written as they
+arrive, so memory use stays flat however many books or translations are
+exported. Parquet output needs the optional pyarrow dependency
+(``pip install 'bible-xml-parser[arrow]'``) and is written with one row group
+per book.
+
+The same rows can be collected into a pyarrow.Table (``to_arrow()``) or a
+pandas DataFrame (``to_pandas()``, ``pip install 'bible-xml-parser[pandas]'``).
+Rows are converted in batches of ARROW_BATCH_SIZE, so no list of Verse objects
+or per-row dictionaries is built along the way.
+
+Example:
+    >>> with BibleRepository() as repo:
+    ...     repo.initialize('bible.db')
+    ...     repo.export('gospels.parquet', start_book='mat', end_book='jhn')
+"""
+
+import csv
+import json
+from itertools import groupby, islice
+from pathlib import Path
+from typing import IO, Any, Iterable, Optional, Sequence, Tuple, Union
+
+EXPORT_FORMATS = ("jsonl", "csv", "parquet")
+
+# Columns of the rows streamed by BibleRepository.iter_verse_rows()
+VERSE_COLUMNS = ("book_id", "chapter_num", "verse_num", "text")
+
+# Rows converted into Arrow arrays at a time by rows_to_arrow()
+ARROW_BATCH_SIZE = 8192
+
+# Format implied by each file extension
+_SUFFIXES = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".parquet": "parquet"}
+
+Row = Tuple[Any, ...]
+Destination = Union[str, Path, IO[Any]]
+
+
+def export_format(destination: Destination) -> str:
+    """Infer the export format from a destination's file extension.
+
+    Args:
+        destination: Output path, or a file object with a ``name``.
+
+    Returns:
+        One of EXPORT_FORMATS.
+
+    Raises:
+        ValueError: If the extension is not recognized.
+    """
+    suffix = Path(str(getattr(destination, "name", destination))).suffix.lower()
+    if suffix not in _SUFFIXES:
+        raise ValueError(
+            f"Cannot infer the export format of '{destination}'. "
+            f"Pass format= one of: {', '.join(EXPORT_FORMATS)}"
+        )
+    return _SUFFIXES[suffix]
+
+
+def export_rows(
+    rows: Iterable[Row],
+    columns: Sequence[str],
+    destination: Destination,
+    format: Optional[str] = None,
+) -> int:
+    """Write a stream of rows to a file.
+
+    Args:
+        rows: Row tuples, grouped by book (as repositories yield them). A
+            generator is closed once writing ends, even if it fails.
+        columns: Column names, one per tuple field; must include 'book_id'.
+        destination: Output path, or an open file object (text mode for
+            JSONL and CSV, binary mode for Parquet).
+        format: 'jsonl', 'csv' or 'parquet' (inferred from the file
+            extension by default).
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If the format is not supported.
+        ImportError: If Parquet is requested and pyarrow is not installed.
+    """
+    format = (format or export_format(destination)).lower()
+    if format not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{format}'. Supported formats: {', '.join(EXPORT_FORMATS)}"
+        )
+
+    try:
+        if format == "parquet":
+            return _write_parquet(rows, columns, destination)
+
+        writer = _write_jsonl if format == "jsonl" else _write_csv
+        if isinstance(destination, (str, Path)):
+            with open(destination, "w", encoding="utf-8", newline="") as file:
+                return writer(rows, columns, file)
+        return writer(rows, columns, destination)
+    finally:
+        # A write that fails mid-stream leaves a row generator suspended on
+        # its cursor; close it now, while the connection is still open
+        close = getattr(rows, "close", None)
+        if close is not None:
+            close()
+
+
+def _write_jsonl(rows: Iterable[Row], columns: Sequence[str], file: IO[str]) -> int:
+    """Write one JSON object per row."""
+    count = 0
+    for row in rows:
+        file.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def _write_csv(rows: Iterable[Row], columns: Sequence[str], file: IO[str]) -> int:
+    """Write a header line and one CSV record per row."""
+    writer = csv.writer(file)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _write_parquet(rows: Iterable[Row], columns: Sequence[str], destination: Destination) -> int:
+    """Write rows to Parquet, one row group per book."""
+    _, parquet = require_pyarrow("Parquet export")
+    schema = arrow_schema(columns)
+    # Rows belong to the same book while every column up to book_id repeats
+    book_key = columns.index("book_id") + 1
+    count = 0
+    where = str(destination) if isinstance(destination, Path) else destination
+    with parquet.ParquetWriter(where, schema) as writer:
+        for _, book_rows in groupby(rows, key=lambda row: row[:book_key]):
+            batch = list(book_rows)
+            writer.write_table(arrow_table(batch, schema))
+            count += len(batch)
+    return count
+
+
+def require_pyarrow(feature: str) -> Tuple[Any, Any]:
+    """Import pyarrow and pyarrow.parquet for an optional feature.
+
+    Args:
+        feature: Name of the feature, used in the error message.
+
+    Returns:
+        Tuple of the (pyarrow, pyarrow.parquet) modules.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires pyarrow (pip install 'bible-xml-parser[arrow]')"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def arrow_schema(columns: Sequence[str]) -> Any:
+    """Build the Arrow schema of verse rows.
+
+    Args:
+        columns: Column names; names ending in '_num' are 32-bit integers,
+            the rest strings.
+
+    Returns:
+        A pyarrow.Schema.
+    """
+    pyarrow, _ = require_pyarrow("Arrow export")
+    return pyarrow.schema([
+        (name, pyarrow.int32() if name.endswith("_num") else pyarrow.string())
+        for name in columns
+    ])
+
+
+def arrow_table(rows: Sequence[Row], schema: Any) -> Any:
+    """Convert a batch of row tuples into a pyarrow.Table.
+
+    Args:
+        rows: Row tuples in schema column order.
+        schema: Schema from arrow_schema().
+
+    Returns:
+        A pyarrow.Table with one column per schema field.
+    """
+    pyarrow, _ = require_pyarrow("Arrow export")
+    values = list(zip(*rows)) if rows else [()] * len(schema)
+    return pyarrow.Table.from_arrays(
+        [pyarrow.array(column, type=field.type) for column, field in zip(values, schema)],
+        schema=schema,
+    )
+
+
+def rows_to_arrow(
+    rows: Iterable[Row], columns: Sequence[str], batch_size: int = ARROW_BATCH_SIZE
+) -> Any:
+    """Collect a stream of rows into a pyarrow.Table, one batch at a time.
+
+    Args:
+        rows: Row tuples.
+        columns: Column names, one per tuple field.
+        batch_size: Rows converted per batch; each becomes one chunk of the
+            table's columns.
+
+    Returns:
+        A pyarrow.Table with the schema from arrow_schema().
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+    """
+    pyarrow, _ = require_pyarrow("Arrow conversion")
+    schema = arrow_schema(columns)
+    rows = iter(rows)
+    tables = []
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        tables.append(arrow_table(batch, schema))
+    if not tables:
+        return arrow_table([], schema)
+    return pyarrow.concat_tables(tables)
+
+
+def arrow_to_pandas(table: Any) -> Any:
+    """Convert a pyarrow.Table to a pandas DataFrame.
+
+    Args:
+        table: Table from rows_to_arrow().
+
+    Returns:
+        A pandas.DataFrame.
+
+    Raises:
+        ImportError: If pandas is not installed.
+    """
+    try:
+        import pandas  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "DataFrame conversion requires pandas (pip install 'bible-xml-parser[pandas]')"
+        ) from e
+    return table.to_pandas()
@@ -0,0 +1,291 @@
+"""Instrumentation hooks for timings and counters.
+
+BaseParser, BibleParser and BibleRepository accept an ``instrumentation``
+argument. When it is None (the default) no clock is read and no hook is called.
+Otherwise the following metrics are emitted:
+
+==============================  =======  ===========================================
+Name                            Kind     Meaning
+==============================  =======  ===========================================
+parse.read                      timing   Time spent reading (and decompressing) the
+                                         source, once per parse
+parse.bytes                     counter  Bytes read from the source
+parse.book                      timing   Time to parse one book (tags: format, book)
+parse.books / parse.verses      counter  Books and verses parsed (tag: format)
+parse.total                     timing   Parse time, excluding time spent by the
+                                         consumer between books (tag: format)
+parse.verses_per_second         gauge    Parse throughput (tag: format)
+load.wait                       timing   Time the database writer waited for the next
+                                         parsed book
+load.digest                     timing   Time to hash one book's verses
+load.insert                     timing   Time to insert one book's rows, including
+                                         FTS index maintenance done by triggers
+load.books / load.verses        counter  Rows inserted into books and verses
+load.concordance                timing   Time to build the positional word index
+load.commit                     timing   Time to commit the load transaction
+load.total                      timing   Time to populate the database
+load.verses_per_second          gauge    Load throughput
+repository.initialize           timing   Time taken by initialize()
+query.get_verse                 timing   Latency of get_verse()
+query.get_verses                timing   Latency of get_verses()
+query.get_verses_bulk           timing   Latency of get_verses_bulk()
+query.search_verses             timing   Latency of search_verses()
+query.get_concordance           timing   Latency of get_concordance()
+query.rows                      counter  Rows returned (tag: query)
+server.request                  timing   Time to answer an HTTP request (tag:
+                                         endpoint; see bible_parser.server)
+server.not_modified             counter  Requests answered 304 from If-None-Match
+==============================  =======  ===========================================
+
+Caches report ``cache.hit`` and ``cache.miss`` counters tagged with the cache name.
+
+Example:
+    >>> metrics = MetricsRecorder()
+    >>> with BibleRepository(xml_path='bible.xml', instrumentation=metrics) as repo:
+    ...     repo.initialize('bible.db')
+    ...     repo.get_verse('gen', 1, 1)
+    >>> print(metrics.report())
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+Tags = Optional[Dict[str, str]]
+
+# Histogram bucket upper bounds in seconds: 1 microsecond doubling up to ~67 s
+DEFAULT_BUCKETS: Tuple[float, ...] = tuple(1e-6 * 2 ** i for i in range(27))
+
+
+class Instrumentation:
+    """Receiver of the metrics emitted while parsing, loading and querying.
+
+    The methods of this base class do nothing. Subclass it and override
+    timing(), increment() and gauge() to forward metrics to a monitoring
+    system (StatsD, Prometheus, logging, ...). Hooks may be called from the
+    background thread that parses while a repository loads, so
+    implementations must be thread-safe.
+    """
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        """Record a duration.
+
+        Args:
+            name: Metric name (e.g., 'query.get_verse').
+            seconds: Duration in seconds.
+            tags: Optional dimensions such as {'book': 'gen'}.
+        """
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        """Add to a counter.
+
+        Args:
+            name: Metric name (e.g., 'load.verses').
+            value: Amount to add.
+            tags: Optional dimensions such as {'format': 'OSIS'}.
+        """
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        """Record the current value of a measurement.
+
+        Args:
+            name: Metric name (e.g., 'parse.verses_per_second').
+            value: Measured value.
+            tags: Optional dimensions.
+        """
+
+    @contextmanager
+    def timer(self, name: str, tags: Tags = None) -> Iterator[None]:
+        """Time the body of a with block and report it through timing().
+
+        Args:
+            name: Metric name.
+            tags: Optional dimensions.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timing(name, time.perf_counter() - start, tags)
+
+
+class Histogram:
+    """Latency distribution over fixed exponential buckets.
+
+    Attributes:
+        bounds: Upper bound of each bucket in seconds; larger values fall into
+            a final overflow bucket.
+        counts: Number of samples per bucket (len(bounds) + 1 entries).
+        count: Number of samples.
+        total: Sum of all samples.
+        min: Smallest sample (0.0 when empty).
+        max: Largest sample (0.0 when empty).
+    """
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize an empty histogram.
+
+        Args:
+            bounds: Increasing bucket upper bounds in seconds.
+        """
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a sample."""
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        """Average sample (0.0 when empty)."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate a percentile.
+
+        Args:
+            q: Percentile between 0 and 100.
+
+        Returns:
+            Upper bound of the bucket holding the q-th percentile sample,
+            clamped to the observed min and max (0.0 when empty).
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = self.bounds[index] if index < len(self.bounds) else self.max
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the distribution as a dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class MetricsRecorder(Instrumentation):
+    """In-memory metrics sink.
+
+    Timings are aggregated into a Histogram per name, counters are summed per
+    name and gauges keep their last value. Timing totals are also kept per
+    distinct tag set so they can be broken down (e.g., parse time per book).
+
+    Attributes:
+        counters: Counter totals by name.
+        gauges: Last gauge values by name.
+        histograms: Timing histograms by name.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize an empty recorder.
+
+        Args:
+            buckets: Bucket upper bounds for new histograms.
+        """
+        self._buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self._tagged: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {}
+
+    def timing(self, name: str, seconds: float, tags: Tags = None) -> None:
+        """Add a duration to the histogram of name."""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(self._buckets)
+            histogram.record(seconds)
+            if tags:
+                totals = self._tagged.setdefault(name, {})
+                key = tuple(sorted(tags.items()))
+                totals[key] = totals.get(key, 0.0) + seconds
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        """Add value to the counter of name."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        """Store the latest value of name."""
+        with self._lock:
+            self.gauges[name] = value
+
+    def breakdown(self, name: str, tag: str) -> Dict[str, float]:
+        """Get total seconds of a timing split by one tag.
+
+        Args:
+            name: Timing name (e.g., 'parse.book').
+            tag: Tag to group by (e.g., 'book').
+
+        Returns:
+            Dictionary mapping tag values to total seconds, in first-seen order.
+        """
+        result: Dict[str, float] = {}
+        with self._lock:
+            for key, seconds in self._tagged.get(name, {}).items():
+                value = dict(key).get(tag)
+                if value is not None:
+                    result[value] = result.get(value, 0.0) + seconds
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Get all metrics as a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary with 'counters', 'gauges' and 'timings' (histogram
+            summaries) entries.
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "timings": {name: h.to_dict() for name, h in self.histograms.items()},
+            }
+
+    def report(self) -> str:
+        """Format all metrics as a human-readable table."""
+        summary = self.summary()
+        lines: List[str] = []
+        for name, stats in sorted(summary["timings"].items()):
+            lines.append(
+                f"{name:<28} n={stats['count']:<7} total {stats['total'] * 1000:10.2f} ms  "
+                f"p50 {stats['p50'] * 1e6:10.1f} us  p99 {stats['p99'] * 1e6:10.1f} us"
+            )
+        for name, value in sorted(summary["counters"].items()):
+            lines.append(f"{name:<28} {value:,}")
+        for name, value in sorted(summary["gauges"].items()):
+            lines.append(f"{name:<28} {value:,.1f}")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.histograms.clear()
+            self._tagged.clear()
@@ -130,6 +130,38 @@ class Book:
         return f"{self.title} ({self.id}) - {len(self.chapters)} chapters, {len(self.verses)} verses"
 
 
+@dataclass
+class AlignedVerse:
+    """Represents one row of a verse grid aligned across translations.
+    
+    The row is keyed by a reference in the shared alignment scheme. Each
+    requested translation maps to its Verse (in the translation's own
+    numbering), or None when the translation has no verse at that position.
+    Several verses of one translation at the same position are merged into
+    one Verse with their texts joined.
+    
+    Attributes:
+        book_id: The book identifier of the aligned reference.
+        chapter_num: The chapter number of the aligned reference.
+        verse_num: The verse number of the aligned reference.
+        verses: Mapping of translation id to Verse, or None for a gap.
+    
+    Examples:
+        >>> row = AlignedVerse(book_id='gen', chapter_num=1, verse_num=1,
+        ...                    verses={'kjv': kjv_verse, 'web': None})
+    """
+    
+    book_id: str
+    chapter_num: int
+    verse_num: int
+    verses: Dict[str, Optional[Verse]] = field(default_factory=dict)
+    
+    def __str__(self) -> str:
+        """Return a human-readable string representation."""
+        present = sum(1 for verse in self.verses.values() if verse is not None)
+        return f"{self.book_id} {self.chapter_num}:{self.verse_num} ({present}/{len(self.verses)} translations)"
+
+
 @dataclass
 class VerseRange:
     """Represents a range of verses within a chapter.
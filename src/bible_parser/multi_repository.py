@@ -0,0 +1,1212 @@
+"""Database repository holding several Bible translations in one SQLite schema."""
+
+import heapq
+import sqlite3
+import sys
+from dataclasses import replace as replace_fields
+from pathlib import Path
+from typing import Optional, List, Any, Dict, Iterable, Tuple
+
+# Python 3.9+ uses collections.abc, Python 3.8 uses typing
+if sys.version_info >= (3, 9):
+    from collections.abc import Generator, Iterator
+else:
+    from typing import Generator, Iterator
+
+from bible_parser.models import AlignedVerse, Book, Verse
+from bible_parser.bible_parser import BibleParser
+from bible_parser.export import VERSE_COLUMNS, Destination, export_rows
+from bible_parser.sources import Source
+from bible_parser.versification import get_mapper, normalize_book_id, normalize_scheme
+
+
+class MultiTranslationRepository:
+    """Repository for accessing many Bible translations from a single database.
+
+    Every book and verse row is keyed by a ``translation_id``, so any number of
+    translations share one connection, one file and one FTS5 index. Verses of
+    the same reference can be fetched across translations in a single query and
+    full-text search can be scoped to one or several translations.
+
+    Translations may use different versification schemes and book ids. While
+    loading, each verse is mapped in batch into the repository's reference
+    scheme (KJV by default) with normalized book ids, so cross-translation
+    queries compare the same passage rather than the same numbers.
+
+    Writers that receive several translations interleaved (such as
+    ingest_corpus) stage each one with stage_translation(), stage_books() and
+    stage_verses(), then write it with commit_translation() in a transaction
+    of its own, so no commit ever contains part of another translation.
+
+    Example:
+        >>> with MultiTranslationRepository() as repo:
+        ...     repo.initialize('bibles.db')
+        ...     repo.add_translation('kjv', xml_path='kjv.xml')
+        ...     repo.add_translation('web', xml_path='web.xml')
+        ...     parallel = repo.get_parallel('gen', 1, 1)
+        ...     results = repo.search_verses('love', translation_ids=['kjv'])
+    """
+
+    # Rebuilds chapter rows from verses; {where} limits it to some book keys
+    _FILL_CHAPTERS = """
+        INSERT INTO chapters (book_key, chapter_num, verse_count)
+        SELECT book_key, chapter_num, COUNT(*) FROM verses
+        {where}
+        GROUP BY book_key, chapter_num
+    """
+
+    def __init__(self, versification: str = "KJV") -> None:
+        """Initialize the multi-translation repository.
+
+        Args:
+            versification: Reference scheme used to align translations
+                ('KJV', 'HEBREW', 'LXX' or 'VULGATE').
+        """
+        self.versification = normalize_scheme(versification)
+        self._db: Optional[sqlite3.Connection] = None
+        # Book keys of translations being loaded by add_translation()
+        self._book_keys: Dict[str, Dict[str, int]] = {}
+        # (title, format, versification) of staged translations
+        self._staged: Dict[str, Tuple[Optional[str], str, str]] = {}
+
+    def initialize(self, database_name: str) -> bool:
+        """Open (or create) the shared database.
+
+        Unlike BibleRepository, no XML is parsed here; translations are loaded
+        explicitly with add_translation().
+
+        Args:
+            database_name: Name of the SQLite database file.
+
+        Returns:
+            True if initialization was successful.
+
+        Raises:
+            Exception: If initialization fails.
+        """
+        try:
+            if self._db is not None:
+                self._db.close()
+            self._staged.clear()
+
+            self._db = sqlite3.connect(str(Path(database_name)))
+            self._db.row_factory = sqlite3.Row
+            self._migrate_schema()
+            self._create_schema()
+            return True
+
+        except Exception as e:
+            raise Exception(f"Failed to initialize multi-translation repository: {e}")
+
+    def _create_schema(self) -> None:
+        """Create the shared database schema."""
+        if self._db is None:
+            raise Exception("Database not connected")
+
+        cursor = self._db.cursor()
+        self._create_schema_objects(cursor)
+
+        # Databases written before the chapters table existed
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM verses) AND NOT EXISTS (SELECT 1 FROM chapters)"
+        )
+        if cursor.fetchone()[0]:
+            cursor.execute(self._FILL_CHAPTERS.format(where=""))
+        self._db.commit()
+
+    def _create_schema_objects(self, cursor: sqlite3.Cursor) -> None:
+        """Create any missing tables, indexes and triggers (without committing).
+
+        Args:
+            cursor: Cursor to execute the DDL with.
+        """
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS translations (
+                id TEXT PRIMARY KEY,
+                title TEXT,
+                format TEXT,
+                versification TEXT
+            )
+        """)
+
+        # Each (translation, book) pair gets a small integer key. Verses
+        # reference only that key, so verse rows and the lookup index hold
+        # one integer where they used to repeat two text ids.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS books (
+                key INTEGER PRIMARY KEY,
+                translation_id TEXT NOT NULL,
+                id TEXT NOT NULL,
+                num INTEGER,
+                title TEXT,
+                UNIQUE (translation_id, id),
+                FOREIGN KEY (translation_id) REFERENCES translations (id)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS verses (
+                id INTEGER PRIMARY KEY,
+                book_key INTEGER,
+                chapter_num INTEGER,
+                verse_num INTEGER,
+                text TEXT,
+                FOREIGN KEY (book_key) REFERENCES books (key)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_verses_lookup
+            ON verses (book_key, chapter_num, verse_num)
+        """)
+
+        # Precomputed alignment: every verse row keyed by its chapter and verse
+        # in the repository's scheme. Mapping never moves a verse to another
+        # book, so the verse's book key identifies both translation and book,
+        # and each translation's part of a passage is one indexed range scan.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS verse_alignment (
+                verse_id INTEGER PRIMARY KEY,
+                book_key INTEGER,
+                chapter_num INTEGER,
+                verse_num INTEGER,
+                FOREIGN KEY (verse_id) REFERENCES verses (id)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_alignment_lookup
+            ON verse_alignment (book_key, chapter_num, verse_num)
+        """)
+
+        # One row per chapter, built when a translation is loaded, so chapter
+        # counts are an index range read instead of a distinct scan of verses.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS chapters (
+                book_key INTEGER,
+                chapter_num INTEGER,
+                verse_count INTEGER,
+                PRIMARY KEY (book_key, chapter_num),
+                FOREIGN KEY (book_key) REFERENCES books (key)
+            )
+        """)
+
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts
+            USING fts5(text, content=verses, content_rowid=id)
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS verses_ai AFTER INSERT ON verses BEGIN
+                INSERT INTO verses_fts(rowid, text) VALUES (new.id, new.text);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS verses_ad AFTER DELETE ON verses BEGIN
+                INSERT INTO verses_fts(verses_fts, rowid, text)
+                VALUES ('delete', old.id, old.text);
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS verses_au AFTER UPDATE ON verses BEGIN
+                INSERT INTO verses_fts(verses_fts, rowid, text)
+                VALUES ('delete', old.id, old.text);
+                INSERT INTO verses_fts(rowid, text) VALUES (new.id, new.text);
+            END
+        """)
+
+    def _migrate_schema(self) -> None:
+        """Rebuild a database that stores text ids in every verse row.
+
+        Databases written by older versions keyed verses, and the alignment
+        of every verse, by translation_id and book_id. Their books and verses
+        are copied into the integer-keyed tables, keeping verse ids, and the
+        FTS index is rebuilt by the insert trigger; alignment rows are copied
+        with the book key of their verse. The rebuild runs in one transaction.
+        """
+        cursor = self._db.cursor()
+        cursor.execute("PRAGMA table_info(verses)")
+        text_verses = "book_id" in {row["name"] for row in cursor.fetchall()}
+        cursor.execute("PRAGMA table_info(verse_alignment)")
+        text_alignment = "translation_id" in {row["name"] for row in cursor.fetchall()}
+        if not (text_verses or text_alignment):
+            return
+
+        cursor.execute("BEGIN")
+        # Old tables are renamed without rewriting the foreign keys that
+        # reference them, so new tables keep pointing at the new verses table
+        cursor.execute("PRAGMA legacy_alter_table = ON")
+        if text_alignment:
+            cursor.execute("DROP INDEX IF EXISTS idx_alignment_lookup")
+            cursor.execute("ALTER TABLE verse_alignment RENAME TO verse_alignment_old")
+        if text_verses:
+            for trigger in ("verses_ai", "verses_ad", "verses_au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            cursor.execute("DROP INDEX IF EXISTS idx_verses_lookup")
+            cursor.execute("DROP TABLE IF EXISTS verses_fts")
+            cursor.execute("ALTER TABLE books RENAME TO books_old")
+            cursor.execute("ALTER TABLE verses RENAME TO verses_old")
+        cursor.execute("PRAGMA legacy_alter_table = OFF")
+
+        self._create_schema_objects(cursor)
+        if text_verses:
+            cursor.execute("""
+                INSERT INTO books (translation_id, id, num, title)
+                SELECT translation_id, id, num, title FROM books_old ORDER BY rowid
+            """)
+            cursor.execute("""
+                INSERT INTO verses (id, book_key, chapter_num, verse_num, text)
+                SELECT v.id, b.key, v.chapter_num, v.verse_num, v.text
+                FROM verses_old v
+                JOIN books b ON b.translation_id = v.translation_id AND b.id = v.book_id
+                ORDER BY v.id
+            """)
+            cursor.execute("DROP TABLE verses_old")
+            cursor.execute("DROP TABLE books_old")
+        if text_alignment:
+            cursor.execute("""
+                INSERT INTO verse_alignment (verse_id, book_key, chapter_num, verse_num)
+                SELECT a.verse_id, v.book_key, a.chapter_num, a.verse_num
+                FROM verse_alignment_old a JOIN verses v ON v.id = a.verse_id
+                ORDER BY a.verse_id
+            """)
+            cursor.execute("DROP TABLE verse_alignment_old")
+        self._db.commit()
+
+        # Return the pages freed by the old tables to the file system
+        self._db.execute("VACUUM")
+
+    def add_translation(
+        self,
+        translation_id: str,
+        xml_path: Optional[Source] = None,
+        xml_string: Optional[str] = None,
+        format: Optional[str] = None,
+        title: Optional[str] = None,
+        replace: bool = False,
+        versification: Optional[str] = None,
+    ) -> int:
+        """Parse a translation and load it into the shared database.
+
+        Args:
+            translation_id: Key for the translation (e.g., 'kjv', 'web').
+            xml_path: Path to XML file (plain or compressed), ArchiveMember or binary
+                file object (mutually exclusive with xml_string).
+            xml_string: XML content as string (mutually exclusive with xml_path).
+            format: Optional Bible format specification.
+            title: Optional human-readable translation title.
+            replace: Replace the translation if it is already loaded.
+            versification: Scheme the translation is numbered in (defaults to
+                the repository's scheme).
+
+        Returns:
+            Number of verses loaded.
+
+        A replaced translation is deleted in the same transaction that loads
+        its successor, so it is kept if the new load fails.
+
+        Raises:
+            Exception: If the translation exists and replace is False, or if
+                loading fails.
+        """
+        self._ensure_db_initialized()
+        scheme = normalize_scheme(versification or self.versification)
+
+        exists = self.has_translation(translation_id)
+        if exists and not replace:
+            raise Exception(f"Translation '{translation_id}' is already loaded")
+
+        if xml_string is not None:
+            parser = BibleParser.from_string(xml_string, format=format)
+        elif xml_path is not None:
+            parser = BibleParser(xml_path, format=format)
+        else:
+            raise Exception("No XML source provided")
+
+        verse_count = 0
+
+        try:
+            if exists:
+                self._delete_translation(translation_id)
+            self._start_translation(translation_id, title, parser.format, scheme)
+
+            for book in parser.books:
+                self._insert_books(translation_id, [(book.id, book.num, book.title)])
+                verse_count += self._insert_verses(
+                    translation_id,
+                    [
+                        (verse.book_id, verse.chapter_num, verse.num, verse.text)
+                        for verse in book.verses
+                    ],
+                )
+
+            self._finish_translation(translation_id, scheme)
+
+        except Exception as e:
+            self._db.rollback()
+            raise Exception(f"Failed to load translation '{translation_id}': {e}")
+        finally:
+            self._book_keys.pop(translation_id, None)
+            parser.close()
+
+        return verse_count
+
+    def _start_translation(
+        self, translation_id: str, title: Optional[str], format: str, versification: str
+    ) -> None:
+        """Register a translation before its books and verses are inserted.
+
+        Args:
+            translation_id: Key of the translation.
+            title: Optional human-readable title (defaults to the key).
+            format: Detected source format.
+            versification: Scheme the translation is numbered in.
+        """
+        self._db.execute(
+            "INSERT INTO translations (id, title, format, versification) VALUES (?, ?, ?, ?)",
+            (translation_id, title or translation_id, format, versification),
+        )
+        self._book_keys[translation_id] = {}
+
+    def _insert_books(self, translation_id: str, books: Iterable[Tuple[str, int, str]]) -> None:
+        """Insert book rows for a translation and cache their keys.
+
+        Args:
+            translation_id: Key of the translation.
+            books: (book_id, num, title) tuples.
+        """
+        rows = [(translation_id, book_id, num, title) for book_id, num, title in books]
+        self._db.executemany(
+            "INSERT OR IGNORE INTO books (translation_id, id, num, title) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        placeholders = ", ".join("?" for _ in rows)
+        cursor = self._db.execute(
+            f"SELECT id, key FROM books WHERE translation_id = ? AND id IN ({placeholders})",
+            (translation_id, *(row[1] for row in rows)),
+        )
+        self._book_keys[translation_id].update((row["id"], row["key"]) for row in cursor)
+
+    def _insert_verses(
+        self, translation_id: str, verses: List[Tuple[str, int, int, str]]
+    ) -> int:
+        """Insert a batch of verse rows for a translation.
+
+        The books of the verses must have been inserted with _insert_books().
+
+        Args:
+            translation_id: Key of the translation.
+            verses: (book_id, chapter_num, verse_num, text) tuples.
+
+        Returns:
+            Number of verses inserted.
+        """
+        book_keys = self._book_keys[translation_id]
+        self._db.executemany(
+            "INSERT INTO verses (book_key, chapter_num, verse_num, text) VALUES (?, ?, ?, ?)",
+            [(book_keys[book_id], *verse) for book_id, *verse in verses],
+        )
+        return len(verses)
+
+    def _finish_translation(self, translation_id: str, versification: str) -> None:
+        """Build the alignment of a fully inserted translation and commit.
+
+        Args:
+            translation_id: Key of the translation.
+            versification: Scheme the translation is numbered in.
+        """
+        self._build_alignment(translation_id, versification)
+        self._build_chapters(translation_id)
+        self._db.commit()
+
+    def stage_translation(
+        self,
+        translation_id: str,
+        format: str,
+        title: Optional[str] = None,
+        versification: Optional[str] = None,
+    ) -> None:
+        """Start staging a translation to be written by commit_translation().
+
+        Staged books and verses are kept in temporary tables of this
+        connection, outside the database file, so commits of other
+        translations never write them.
+
+        Args:
+            translation_id: Key for the translation.
+            format: Source format of the translation.
+            title: Optional human-readable translation title.
+            versification: Scheme the translation is numbered in (defaults to
+                the repository's scheme).
+
+        Raises:
+            Exception: If the translation is already being staged.
+        """
+        self._ensure_db_initialized()
+        if translation_id in self._staged:
+            raise Exception(f"Translation '{translation_id}' is already staged")
+
+        cursor = self._db.cursor()
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS staged_books (
+                translation_id TEXT NOT NULL,
+                id TEXT NOT NULL,
+                num INTEGER,
+                title TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE TEMP TABLE IF NOT EXISTS staged_verses (
+                translation_id TEXT NOT NULL,
+                book_id TEXT NOT NULL,
+                chapter_num INTEGER,
+                verse_num INTEGER,
+                text TEXT
+            )
+        """)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS temp.idx_staged_verses ON staged_verses (translation_id)"
+        )
+        self._staged[translation_id] = (
+            title, format, normalize_scheme(versification or self.versification)
+        )
+
+    def stage_books(self, translation_id: str, books: Iterable[Tuple[str, int, str]]) -> None:
+        """Stage book rows of a translation started with stage_translation().
+
+        Args:
+            translation_id: Key of the translation.
+            books: (book_id, num, title) tuples.
+        """
+        self._ensure_staged(translation_id)
+        self._db.executemany(
+            "INSERT INTO temp.staged_books (translation_id, id, num, title) VALUES (?, ?, ?, ?)",
+            [(translation_id, book_id, num, title) for book_id, num, title in books],
+        )
+
+    def stage_verses(
+        self, translation_id: str, verses: List[Tuple[str, int, int, str]]
+    ) -> int:
+        """Stage a batch of verse rows of a translation.
+
+        Args:
+            translation_id: Key of the translation.
+            verses: (book_id, chapter_num, verse_num, text) tuples.
+
+        Returns:
+            Number of verses staged.
+        """
+        self._ensure_staged(translation_id)
+        self._db.executemany(
+            "INSERT INTO temp.staged_verses (translation_id, book_id, chapter_num, verse_num, text) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(translation_id, *verse) for verse in verses],
+        )
+        return len(verses)
+
+    def commit_translation(self, translation_id: str, replace: bool = False) -> int:
+        """Write a staged translation in one transaction of its own.
+
+        Rows staged for other translations stay staged. If the write fails,
+        nothing of the translation is kept and its staged rows are discarded.
+
+        Args:
+            translation_id: Key of the translation.
+            replace: Replace the translation if it is already loaded, in the
+                same transaction.
+
+        Returns:
+            Number of verses written.
+
+        Raises:
+            Exception: If the translation is loaded and replace is False, or
+                if writing fails.
+        """
+        self._ensure_staged(translation_id)
+        title, format, scheme = self._staged[translation_id]
+
+        cursor = self._db.cursor()
+        # Staging may have an open transaction; the savepoint undoes only this write
+        cursor.execute("SAVEPOINT commit_translation")
+        try:
+            if self.has_translation(translation_id):
+                if not replace:
+                    raise Exception(f"Translation '{translation_id}' is already loaded")
+                self._delete_translation(translation_id)
+            self._start_translation(translation_id, title, format, scheme)
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO books (translation_id, id, num, title)
+                SELECT translation_id, id, num, title FROM temp.staged_books
+                WHERE translation_id = ?
+                ORDER BY rowid
+                """,
+                (translation_id,),
+            )
+            cursor.execute(
+                """
+                INSERT INTO verses (book_key, chapter_num, verse_num, text)
+                SELECT b.key, s.chapter_num, s.verse_num, s.text
+                FROM temp.staged_verses s
+                INNER JOIN books b ON b.translation_id = s.translation_id AND b.id = s.book_id
+                WHERE s.translation_id = ?
+                ORDER BY s.rowid
+                """,
+                (translation_id,),
+            )
+            verse_count = cursor.rowcount
+            self._build_alignment(translation_id, scheme)
+            self._build_chapters(translation_id)
+            cursor.execute("RELEASE commit_translation")
+        except Exception as e:
+            cursor.execute("ROLLBACK TO commit_translation")
+            cursor.execute("RELEASE commit_translation")
+            self.discard_translation(translation_id)
+            raise Exception(f"Failed to load translation '{translation_id}': {e}")
+        finally:
+            self._book_keys.pop(translation_id, None)
+
+        self.discard_translation(translation_id)
+        return verse_count
+
+    def discard_translation(self, translation_id: str) -> None:
+        """Drop the staged rows of a translation without writing them.
+
+        Args:
+            translation_id: Key of the translation.
+        """
+        self._ensure_db_initialized()
+        if self._staged.pop(translation_id, None) is None:
+            return
+        cursor = self._db.cursor()
+        cursor.execute("DELETE FROM temp.staged_books WHERE translation_id = ?", (translation_id,))
+        cursor.execute("DELETE FROM temp.staged_verses WHERE translation_id = ?", (translation_id,))
+        self._db.commit()
+
+    def _ensure_staged(self, translation_id: str) -> None:
+        """Ensure a translation was started with stage_translation().
+
+        Raises:
+            Exception: If it was not.
+        """
+        self._ensure_db_initialized()
+        if translation_id not in self._staged:
+            raise Exception(f"Translation '{translation_id}' is not staged")
+
+    def remove_translation(self, translation_id: str) -> None:
+        """Delete a translation and all of its books and verses.
+
+        Args:
+            translation_id: Key of the translation to remove.
+        """
+        self._ensure_db_initialized()
+        self._delete_translation(translation_id)
+        self._db.commit()
+
+    def _delete_translation(self, translation_id: str) -> None:
+        """Delete a translation's rows without committing.
+
+        Args:
+            translation_id: Key of the translation to remove.
+        """
+        cursor = self._db.cursor()
+        for table in ("verse_alignment", "chapters", "verses"):
+            cursor.execute(
+                f"DELETE FROM {table} "
+                "WHERE book_key IN (SELECT key FROM books WHERE translation_id = ?)",
+                (translation_id,),
+            )
+        cursor.execute("DELETE FROM books WHERE translation_id = ?", (translation_id,))
+        cursor.execute("DELETE FROM translations WHERE id = ?", (translation_id,))
+
+    def _build_alignment(self, translation_id: str, versification: str) -> None:
+        """Populate the alignment table for a freshly loaded translation.
+
+        Verse references are mapped in one batch from the translation's scheme
+        into the repository's scheme.
+
+        Args:
+            translation_id: Key of the translation.
+            versification: Scheme the translation is numbered in.
+        """
+        mapper = get_mapper(versification, self.versification)
+
+        cursor = self._db.cursor()
+        cursor.execute(
+            """
+            SELECT v.id, v.book_key, b.id AS book_id, v.chapter_num, v.verse_num
+            FROM books b
+            INNER JOIN verses v ON v.book_key = b.key
+            WHERE b.translation_id = ?
+            """,
+            (translation_id,),
+        )
+        rows = cursor.fetchall()
+
+        mapped = mapper.map_many(
+            (normalize_book_id(row["book_id"]), row["chapter_num"], row["verse_num"])
+            for row in rows
+        )
+
+        cursor.executemany(
+            "INSERT INTO verse_alignment (verse_id, book_key, chapter_num, verse_num) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (row["id"], row["book_key"], chapter_num, verse_num)
+                for row, (_, chapter_num, verse_num) in zip(rows, mapped)
+            ],
+        )
+
+    def _build_chapters(self, translation_id: str) -> None:
+        """Populate the chapters table for a freshly loaded translation.
+
+        Args:
+            translation_id: Key of the translation.
+        """
+        self._db.execute(
+            self._FILL_CHAPTERS.format(
+                where="WHERE book_key IN (SELECT key FROM books WHERE translation_id = ?)"
+            ),
+            (translation_id,),
+        )
+
+    def has_translation(self, translation_id: str) -> bool:
+        """Check whether a translation is loaded.
+
+        Args:
+            translation_id: Key of the translation.
+
+        Returns:
+            True if the translation exists in the database.
+        """
+        self._ensure_db_initialized()
+
+        cursor = self._db.cursor()
+        cursor.execute("SELECT 1 FROM translations WHERE id = ?", (translation_id,))
+        return cursor.fetchone() is not None
+
+    def get_translations(self) -> List[str]:
+        """Get the keys of all loaded translations.
+
+        Returns:
+            List of translation ids in load order.
+        """
+        self._ensure_db_initialized()
+
+        cursor = self._db.cursor()
+        cursor.execute("SELECT id FROM translations ORDER BY rowid")
+        return [row["id"] for row in cursor.fetchall()]
+
+    def get_books(self, translation_id: str) -> List[Book]:
+        """Get all books of a translation.
+
+        Args:
+            translation_id: Key of the translation.
+
+        Returns:
+            List of Book objects (without chapters/verses).
+        """
+        self._ensure_db_initialized()
+
+        cursor = self._db.cursor()
+        cursor.execute(
+            "SELECT id, num, title FROM books WHERE translation_id = ? ORDER BY num",
+            (translation_id,),
+        )
+
+        return [Book.from_dict(dict(row)) for row in cursor.fetchall()]
+
+    def get_chapter_count(self, translation_id: str, book_id: str) -> int:
+        """Get the number of chapters in a book of a translation.
+
+        Args:
+            translation_id: Key of the translation.
+            book_id: Book identifier (e.g., 'gen', 'mat').
+
+        Returns:
+            Number of chapters in the book.
+        """
+        self._ensure_db_initialized()
+
+        cursor = self._db.cursor()
+        cursor.execute(
+            """
+            SELECT COUNT(*) as count FROM chapters
+            WHERE book_key = (SELECT key FROM books WHERE translation_id = ? AND id = ?)
+            """,
+            (translation_id, book_id),
+        )
+
+        result = cursor.fetchone()
+        return result["count"] if result else 0
+
+    def get_verses(self, translation_id: str, book_id: str, chapter_num: int) -> List[Verse]:
+        """Get all verses in a chapter of a translation.
+
+        Args:
+            translation_id: Key of the translation.
+            book_id: Book identifier.
+            chapter_num: Chapter number.
+
+        Returns:
+            List of Verse objects.
+        """
+        self._ensure_db_initialized()
+
+        cursor = self._db.cursor()
+        cursor.execute(
+            """
+            SELECT b.id AS book_id, v.chapter_num, v.verse_num, v.text
+            FROM books b
+            INNER JOIN verses v ON v.book_key = b.key
+            WHERE b.translation_id = ? AND b.id = ? AND v.chapter_num = ?
+            ORDER BY v.verse_num
+            """,
+            (translation_id, book_id, chapter_num),
+        )
+
+        return [Verse.from_dict(dict(row)) for row in cursor.fetchall()]
+
+    def get_verse(
+        self, translation_id: str, book_id: str, chapter_num: int, verse_num: int
+    ) -> Optional[Verse]:
+        """Get a specific verse of a translation.
+
+        Args:
+            translation_id: Key of the translation.
+            book_id: Book identifier.
+            chapter_num: Chapter number.
+            verse_num: Verse number.
+
+        Returns:
+            Verse object if found, None otherwise.
+        """
+        self._ensure_db_initialized()
+
+        cursor = self._db.cursor()
+        cursor.execute(
+            """
+            SELECT b.id AS book_id, v.chapter_num, v.verse_num, v.text
+            FROM books b
+            INNER JOIN verses v ON v.book_key = b.key
+            WHERE b.translation_id = ? AND b.id = ? AND v.chapter_num = ? AND v.verse_num = ?
+            """,
+            (translation_id, book_id, chapter_num, verse_num),
+        )
+
+        row = cursor.fetchone()
+        return Verse.from_dict(dict(row)) if row else None
+
+    def get_parallel(
+        self,
+        book_id: str,
+        chapter_num: int,
+        verse_num: int,
+        translation_ids: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Optional[Verse]]:
+        """Get one verse across several translations in a single query.
+
+        The reference is given in the repository's versification scheme; each
+        translation returns the verse it numbers that passage with.
+
+        Args:
+            book_id: Book identifier (any supported format, e.g. 'ps' or 'psa').
+            chapter_num: Chapter number.
+            verse_num: Verse number.
+            translation_ids: Translations to include (defaults to all loaded).
+
+        Returns:
+            Dictionary mapping each translation id to its Verse, or None when
+            the translation does not contain the verse. A translation with
+            several verses at the reference gets them merged (see
+            iter_aligned_verses).
+        """
+        self._ensure_db_initialized()
+
+        ids = self._resolve_translation_ids(translation_ids)
+        if not ids:
+            return {}
+
+        parallel: Dict[str, Optional[Verse]] = {translation_id: None for translation_id in ids}
+        keys = self._aligned_book_keys(normalize_book_id(book_id), ids)
+        if not keys:
+            return parallel
+
+        placeholders = ", ".join("?" for _ in keys)
+        cursor = self._db.cursor()
+        cursor.execute(
+            f"""
+            SELECT a.book_key, b.id AS book_id, v.chapter_num, v.verse_num, v.text
+            FROM verse_alignment a
+            INNER JOIN verses v ON v.id = a.verse_id
+            INNER JOIN books b ON b.key = a.book_key
+            WHERE a.book_key IN ({placeholders}) AND a.chapter_num = ? AND a.verse_num = ?
+            ORDER BY a.verse_id
+            """,
+            (*keys, chapter_num, verse_num),
+        )
+
+        for row in cursor.fetchall():
+            translation_id = keys[row["book_key"]]
+            parallel[translation_id] = _merge_verse(
+                parallel[translation_id], Verse.from_dict(dict(row))
+            )
+
+        return parallel
+
+    def iter_aligned_verses(
+        self,
+        book_id: str,
+        chapter_num: Optional[int] = None,
+        translation_ids: Optional[Iterable[str]] = None,
+        end_chapter_num: Optional[int] = None,
+    ) -> Generator[AlignedVerse, None, None]:
+        """Stream an aligned verse grid across translations.
+
+        Rows come from one query over the alignment table and are yielded as
+        soon as each reference is complete, so whole-book exports do not hold
+        the book in memory.
+
+        Args:
+            book_id: Book identifier (any supported format).
+            chapter_num: First chapter to include (defaults to chapter 1 if
+                end_chapter_num is given, otherwise to the whole book).
+            translation_ids: Translations to include (defaults to all loaded).
+            end_chapter_num: Last chapter to include (defaults to chapter_num).
+
+        Versification mapping can number two verses of a translation with
+        one reference (e.g. where the reference scheme joins two verses).
+        Such verses are merged into one Verse that keeps the first verse's
+        numbering and joins the texts in order, so no text is dropped.
+
+        Yields:
+            AlignedVerse rows in reference order. Translations without a verse
+            at a position are present with a None value.
+        """
+        self._ensure_db_initialized()
+
+        ids = self._resolve_translation_ids(translation_ids)
+        if not ids:
+            return
+
+        book_id = normalize_book_id(book_id)
+        keys = self._aligned_book_keys(book_id, ids)
+        chapter_clause = ""
+        chapter_params: List[int] = []
+        if chapter_num is not None or end_chapter_num is not None:
+            first_chapter = 1 if chapter_num is None else chapter_num
+            chapter_clause = "AND a.chapter_num BETWEEN ? AND ?"
+            chapter_params = [
+                first_chapter,
+                first_chapter if end_chapter_num is None else end_chapter_num,
+            ]
+
+        def translation_rows(book_key: int) -> Iterator[Tuple[str, sqlite3.Row]]:
+            cursor = self._db.cursor()
+            cursor.execute(
+                f"""
+                SELECT a.chapter_num AS key_chapter, a.verse_num AS key_verse, a.verse_id,
+                       b.id AS book_id, v.chapter_num, v.verse_num, v.text
+                FROM verse_alignment a
+                INNER JOIN verses v ON v.id = a.verse_id
+                INNER JOIN books b ON b.key = a.book_key
+                WHERE a.book_key = ? {chapter_clause}
+                ORDER BY a.chapter_num, a.verse_num, a.verse_id
+                """,
+                (book_key, *chapter_params),
+            )
+            for row in cursor:
+                yield keys[book_key], row
+
+        # Each translation's rows come in index order; merge them by reference
+        rows = heapq.merge(
+            *(translation_rows(book_key) for book_key in keys),
+            key=lambda item: (item[1]["key_chapter"], item[1]["key_verse"], item[1]["verse_id"]),
+        )
+
+        current: Optional[AlignedVerse] = None
+        for translation_id, row in rows:
+            key = (row["key_chapter"], row["key_verse"])
+            if current is None or key != (current.chapter_num, current.verse_num):
+                if current is not None:
+                    yield current
+                current = AlignedVerse(
+                    book_id=book_id,
+                    chapter_num=key[0],
+                    verse_num=key[1],
+                    verses={translation_id: None for translation_id in ids},
+                )
+            current.verses[translation_id] = _merge_verse(
+                current.verses[translation_id], Verse.from_dict(dict(row))
+            )
+
+        if current is not None:
+            yield current
+
+    def get_aligned_verses(
+        self,
+        book_id: str,
+        chapter_num: Optional[int] = None,
+        translation_ids: Optional[Iterable[str]] = None,
+        end_chapter_num: Optional[int] = None,
+    ) -> List[AlignedVerse]:
+        """Get an aligned verse grid across translations.
+
+        Args:
+            book_id: Book identifier.
+            chapter_num: First chapter to include (defaults to chapter 1 if
+                end_chapter_num is given, otherwise to the whole book).
+            translation_ids: Translations to include (defaults to all loaded).
+            end_chapter_num: Last chapter to include (defaults to chapter_num).
+
+        Returns:
+            List of AlignedVerse rows in reference order.
+        """
+        return list(
+            self.iter_aligned_verses(book_id, chapter_num, translation_ids, end_chapter_num)
+        )
+
+    def search_verses(
+        self,
+        query: str,
+        translation_ids: Optional[Iterable[str]] = None,
+        limit: int = 100,
+    ) -> Dict[str, List[Verse]]:
+        """Search for verses containing the query text.
+
+        Uses the shared SQLite FTS5 index, scoped to the requested translations.
+        Each translation is queried with its own limit, so translations loaded
+        first cannot crowd out the others.
+
+        Args:
+            query: Search query string.
+            translation_ids: Translations to search (defaults to all loaded).
+            limit: Maximum number of results per translation.
+
+        Returns:
+            Dictionary mapping translation ids to their matching Verse objects.
+        """
+        self._ensure_db_initialized()
+
+        ids = self._resolve_translation_ids(translation_ids)
+        if not ids:
+            return {}
+
+        # Sanitize query to prevent FTS injection
+        query = query.replace('"', '""')
+
+        results: Dict[str, List[Verse]] = {}
+        cursor = self._db.cursor()
+        for translation_id in ids:
+            cursor.execute(
+                """
+                SELECT b.id AS book_id, v.chapter_num, v.verse_num, v.text
+                FROM verses_fts fts
+                INNER JOIN verses v ON v.id = fts.rowid
+                INNER JOIN books b ON b.key = v.book_key
+                WHERE verses_fts MATCH ? AND b.translation_id = ?
+                ORDER BY v.id
+                LIMIT ?
+                """,
+                (query, translation_id, limit),
+            )
+            results[translation_id] = [Verse.from_dict(dict(row)) for row in cursor.fetchall()]
+
+        return results
+
+    def iter_verse_rows(
+        self, translation_ids: Optional[Iterable[str]] = None
+    ) -> Generator[Tuple[str, str, int, int, str], None, None]:
+        """Stream verses as (translation_id, book_id, chapter_num, verse_num, text).
+
+        Verses are read one book at a time, so memory use does not depend on
+        the number or size of the translations.
+
+        Args:
+            translation_ids: Translations to include (defaults to all loaded).
+
+        Yields:
+            Verse rows by translation, then in book, chapter and verse order.
+        """
+        self._ensure_db_initialized()
+
+        for translation_id in self._resolve_translation_ids(translation_ids):
+            books = self._db.execute(
+                "SELECT key, id FROM books WHERE translation_id = ? ORDER BY num",
+                (translation_id,),
+            ).fetchall()
+            for book in books:
+                cursor = self._db.cursor()
+                cursor.row_factory = None
+                cursor.execute(
+                    """
+                    SELECT ?, ?, chapter_num, verse_num, text FROM verses
+                    WHERE book_key = ?
+                    ORDER BY chapter_num, verse_num, id
+                    """,
+                    (translation_id, book["id"], book["key"]),
+                )
+                yield from cursor
+
+    def export(
+        self,
+        destination: Destination,
+        format: Optional[str] = None,
+        translation_ids: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Stream verses of several translations to a JSON Lines, CSV or Parquet file.
+
+        Rows have the columns translation_id, book_id, chapter_num, verse_num
+        and text. See bible_parser.export for details of each format.
+
+        Args:
+            destination: Output path or open file object.
+            format: 'jsonl', 'csv' or 'parquet' (inferred from the file
+                extension by default).
+            translation_ids: Translations to include (defaults to all loaded).
+
+        Returns:
+            Number of verses written.
+        """
+        return export_rows(
+            self.iter_verse_rows(translation_ids),
+            ("translation_id",) + VERSE_COLUMNS,
+            destination,
+            format,
+        )
+
+    def translation(self, translation_id: str) -> "TranslationView":
+        """Get a single-translation view of this repository.
+
+        The view exposes the same query methods as BibleRepository, so it can be
+        passed to BibleReferenceFormatter.
+
+        Args:
+            translation_id: Key of the translation.
+
+        Returns:
+            A TranslationView bound to the translation.
+        """
+        return TranslationView(self, translation_id)
+
+    def _aligned_book_keys(self, book_id: str, translation_ids: List[str]) -> Dict[int, str]:
+        """Find the books of some translations that align with a book.
+
+        Args:
+            book_id: Normalized book identifier.
+            translation_ids: Translations to include.
+
+        Returns:
+            Translation id by book key, for every book whose id normalizes to book_id.
+        """
+        placeholders = ", ".join("?" for _ in translation_ids)
+        rows = self._db.execute(
+            f"SELECT key, translation_id, id FROM books WHERE translation_id IN ({placeholders}) "
+            "ORDER BY key",
+            translation_ids,
+        ).fetchall()
+        return {
+            key: translation_id
+            for key, translation_id, book in rows
+            if normalize_book_id(book) == book_id
+        }
+
+    def _resolve_translation_ids(self, translation_ids: Optional[Iterable[str]]) -> List[str]:
+        """Normalize a translation filter to a concrete list of ids.
+
+        Args:
+            translation_ids: Requested translation ids, or None for all.
+
+        Returns:
+            List of translation ids.
+        """
+        if translation_ids is None:
+            return self.get_translations()
+        if isinstance(translation_ids, str):
+            return [translation_ids]
+        return list(dict.fromkeys(translation_ids))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _ensure_db_initialized(self) -> None:
+        """Ensure database is initialized before use.
+
+        Raises:
+            Exception: If database is not initialized.
+        """
+        if self._db is None:
+            raise Exception("Database not initialized. Call initialize() first.")
+
+    def __enter__(self) -> "MultiTranslationRepository":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit - closes database connection."""
+        self.close()
+
+
+class TranslationView:
+    """Read-only view of one translation inside a MultiTranslationRepository.
+
+    Mirrors the query interface of BibleRepository (get_books, get_verses,
+    get_verse, get_chapter_count, search_verses) so existing helpers such as
+    BibleReferenceFormatter work unchanged.
+
+    Example:
+        >>> kjv = repo.translation('kjv')
+        >>> verses = BibleReferenceFormatter.get_verses_from_reference('John 3:16', kjv)
+    """
+
+    def __init__(self, repository: MultiTranslationRepository, translation_id: str):
+        """Initialize the view.
+
+        Args:
+            repository: The multi-translation repository to read from.
+            translation_id: Key of the translation.
+        """
+        self.repository = repository
+        self.translation_id = translation_id
+
+    def get_books(self) -> List[Book]:
+        """Get all books in the translation."""
+        return self.repository.get_books(self.translation_id)
+
+    def get_chapter_count(self, book_id: str) -> int:
+        """Get the number of chapters in a book."""
+        return self.repository.get_chapter_count(self.translation_id, book_id)
+
+    def get_verses(self, book_id: str, chapter_num: int) -> List[Verse]:
+        """Get all verses in a specific chapter."""
+        return self.repository.get_verses(self.translation_id, book_id, chapter_num)
+
+    def get_verse(self, book_id: str, chapter_num: int, verse_num: int) -> Optional[Verse]:
+        """Get a specific verse."""
+        return self.repository.get_verse(self.translation_id, book_id, chapter_num, verse_num)
+
+    def search_verses(self, query: str, limit: int = 100) -> List[Verse]:
+        """Search for verses in the translation."""
+        results = self.repository.search_verses(query, [self.translation_id], limit)
+        return results.get(self.translation_id, [])
+
+
+def _merge_verse(current: Optional[Verse], verse: Verse) -> Verse:
+    """Add a verse aligned to a reference that may already hold one.
+
+    Args:
+        current: Verse already aligned to the reference, if any.
+        verse: Next verse of the same translation, in verse order.
+
+    Returns:
+        verse if the reference was empty, otherwise current with the text of
+        verse appended.
+    """
+    if current is None:
+        return verse
+    return replace_fields(current, text=f"{current.text} {verse.text}")
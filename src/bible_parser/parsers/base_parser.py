@@ -1,18 +1,24 @@
 """Base parser class for all Bible format parsers."""
 
 import sys
+import time
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import Union
+from contextlib import contextmanager
+from io import BytesIO
+from typing import Any, BinaryIO, List, Optional, Tuple, Union
 
 # Python 3.9+ uses collections.abc, Python 3.8 uses typing
 if sys.version_info >= (3, 9):
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterator
 else:
-    from typing import Generator
+    from typing import Generator, Iterator
+
+from defusedxml.ElementTree import iterparse
 
 from bible_parser.models import Book, Verse
 from bible_parser.errors import ParseError
+from bible_parser.instrumentation import Instrumentation
+from bible_parser.sources import Source, open_source
 
 
 class BaseParser(ABC):
@@ -23,16 +29,33 @@ class BaseParser(ABC):
     for parsing.
     
     Attributes:
-        source: The source of Bible data (file path or XML string).
+        source: The source of Bible data (file path, archive member, binary
+            file object, bytes-like buffer, iterable of byte chunks or XML
+            string).
     """
 
-    def __init__(self, source: Union[str, Path]):
+    def __init__(
+        self,
+        source: Union[Source, str],
+        stream: Optional[BinaryIO] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
         """Initialize the parser with a data source.
         
         Args:
-            source: Either a file path (str/Path) or XML content string.
+            source: A file path (str/Path, plain or gzip/bz2/xz/zip compressed),
+                an ArchiveMember, a binary file object, a bytes-like buffer, an
+                iterable of byte chunks, or XML content string (a str starting
+                with '<').
+            stream: Optional already-open binary handle on the source,
+                positioned at the start of the document. It is used (then
+                closed) by the first parse instead of opening the source again.
+            instrumentation: Optional receiver of read timings and byte
+                counts (see bible_parser.instrumentation).
         """
         self.source = source
+        self._stream = stream
+        self.instrumentation = instrumentation
 
     @abstractmethod
     def parse_books(self) -> Generator[Book, None, None]:
@@ -75,30 +98,122 @@ class BaseParser(ABC):
         """
         pass
 
-    def get_content(self) -> str:
-        """Get the XML content from the source.
+    def close(self) -> None:
+        """Close the pre-opened stream if it was never parsed."""
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    @contextmanager
+    def open_stream(self) -> Iterator[BinaryIO]:
+        """Open the source as a binary stream for incremental parsing.
         
-        Returns:
-            The XML content as a string.
+        The XML parser reads the stream in chunks and handles the encoding
+        (including BOMs and UTF-16) itself, so the document is never decoded
+        into one string. Compressed sources are decompressed on the fly.
+        
+        Yields:
+            A binary file-like object positioned at the start of the document.
             
         Raises:
-            ParseError: If the content cannot be read.
+            ParseError: If the source cannot be opened.
         """
+        stream = self._stream
+        self._stream = None
+        
         try:
-            # Check if source is a Path object or string path
-            if isinstance(self.source, (Path, str)):
-                path = Path(self.source)
-                # Check if it's an existing file
-                if path.exists() and path.is_file():
-                    return path.read_text(encoding="utf-8")
-                # Otherwise, treat as XML content string
-                elif isinstance(self.source, str):
-                    return self.source
-                else:
-                    raise ParseError(f"Source is not a valid file: {self.source}")
-            else:
-                raise ParseError(f"Unsupported source type: {type(self.source)}")
+            if stream is None and is_xml_text(self.source):
+                stream = BytesIO(str(self.source).encode("utf-8"))
+            elif stream is None:
+                stream = open_source(self.source)
+        except ParseError:
+            raise
         except Exception as e:
-            if isinstance(e, ParseError):
-                raise
-            raise ParseError(f"Failed to read content: {e}")
+            raise ParseError(f"Failed to open source: {e}")
+        
+        metered = None
+        if self.instrumentation is not None:
+            stream = metered = _MeteredStream(stream)
+        
+        try:
+            yield stream
+        finally:
+            stream.close()
+            if metered is not None:
+                self.instrumentation.timing("parse.read", metered.seconds)
+                self.instrumentation.increment("parse.bytes", metered.bytes_read)
+
+    def iter_events(self, stream: BinaryIO) -> Iterator[Tuple[str, Any, Optional[str]]]:
+        """Stream start/end events, each with the character data preceding it.
+        
+        iterparse attaches character data to the tree lazily: an element's
+        text is complete only once its first child or end tag has been read,
+        and its tail only once the next tag has been read. Reading them at the
+        element's own event silently misses text that straddles a read chunk.
+        Here each event carries the text that precedes it in document order,
+        taken from the previous element once the parser has moved past it.
+        Elements are cleared after their tail has been read.
+        
+        Args:
+            stream: Binary stream of the document.
+            
+        Yields:
+            Tuples of (event, element, preceding text or None).
+        """
+        pending = None
+        pending_attr = "text"
+        for event, elem in iterparse(stream, events=("start", "end")):
+            text = None
+            if pending is not None:
+                text = getattr(pending, pending_attr)
+                if pending_attr == "tail":
+                    pending.clear()
+            yield event, elem, text
+            pending = elem
+            pending_attr = "text" if event == "start" else "tail"
+
+
+class _MeteredStream:
+    """Binary stream wrapper that times reads and counts the bytes returned."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self.seconds = 0.0
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        start = time.perf_counter()
+        data = self._stream.read(size)
+        self.seconds += time.perf_counter() - start
+        self.bytes_read += len(data)
+        return data
+
+    def close(self) -> None:
+        self._stream.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+def is_xml_text(source: object) -> bool:
+    """Check whether a source string is XML content rather than a file path.
+    
+    Args:
+        source: The source to check.
+        
+    Returns:
+        True if source is a string whose first non-space character is '<'.
+    """
+    return isinstance(source, str) and source.lstrip("\ufeff \t\r\n").startswith("<")
+
+
+def join_text(parts: List[str]) -> str:
+    """Join collected character data into verse text with normalized spacing.
+    
+    Args:
+        parts: Text fragments in document order.
+        
+    Returns:
+        The fragments concatenated, with runs of whitespace collapsed.
+    """
+    return " ".join("".join(parts).split())
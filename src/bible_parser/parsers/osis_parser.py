@@ -2,7 +2,6 @@
 
 import sys
 from typing import Optional
-from io import BytesIO
 
 # Python 3.9+ uses collections.abc, Python 3.8 uses typing
 if sys.version_info >= (3, 9):
@@ -10,10 +9,8 @@ if sys.version_info >= (3, 9):
 else:
     from typing import Generator
 
-from defusedxml.ElementTree import iterparse
-
 from bible_parser.models import Book, Chapter, Verse
-from bible_parser.parsers.base_parser import BaseParser
+from bible_parser.parsers.base_parser import BaseParser, join_text
 from bible_parser.errors import ParseError
 
 
@@ -51,6 +48,18 @@ class OsisParser(BaseParser):
             return book_id, chapter_num, verse_num
         return "", 1, 1
 
+    def _add_verse(self, books_dict: dict, verse_data: dict, text_parts: list) -> None:
+        """Build a verse from its collected text and add it to its book."""
+        verse = Verse(
+            num=verse_data["verse_num"],
+            chapter_num=verse_data["chapter_num"],
+            text=join_text(text_parts),
+            book_id=verse_data["book_id"],
+        )
+
+        if verse_data["book_id"] in books_dict:
+            books_dict[verse_data["book_id"]].verses.append(verse)
+
     def parse_books(self) -> Generator[Book, None, None]:
         """Parse OSIS content and yield Book objects.
 
@@ -60,9 +69,6 @@ class OsisParser(BaseParser):
         Raises:
             ParseError: If parsing fails.
         """
-        content = self.get_content()
-        content_bytes = content.encode("utf-8")
-
         books_dict = {}  # Store books by ID
         current_book_id: Optional[str] = None
         current_verse_data: Optional[dict] = None  # Store verse being built
@@ -71,111 +77,83 @@ class OsisParser(BaseParser):
         inside_book_title = False
 
         try:
-            for event, elem in iterparse(BytesIO(content_bytes), events=("start", "end")):
-                tag = elem.tag.split("}")[-1]  # Remove namespace
-
-                if event == "start":
-                    if tag == "div" and elem.get("type") == "book":
-                        # Start of a book
-                        osis_id = elem.get("osisID", "")
-                        if osis_id:
-                            current_book_id = osis_id.lower()
-                            if current_book_id not in books_dict:
-                                # Create book with default title (will be updated if <title> element found)
-                                books_dict[current_book_id] = Book(
-                                    id=current_book_id,
-                                    num=len(books_dict) + 1,
-                                    title=current_book_id.capitalize(),
-                                )
-
-                    elif tag == "title" and current_book_id and current_book_id in books_dict:
-                        # Mark that we're inside a title element
-                        inside_book_title = True
-
-                    elif tag == "verse":
-                        # Check for sID (start of verse with sID/eID pattern)
-                        sid = elem.get("sID")
-                        if sid and current_book_id:
-                            # Extract osisID from sID or use osisID attribute
-                            osis_id = elem.get("osisID", "")
-                            if not osis_id:
-                                # Parse from sID (format: Book.Chapter.Verse.seID.xxxxx)
-                                osis_id = ".".join(sid.split(".")[:3])
-
-                            book_id, chapter_num, verse_num = self._parse_osis_id(
-                                osis_id)
-
-                            # Start collecting text for this verse
-                            current_verse_data = {
-                                "book_id": book_id or current_book_id,
-                                "chapter_num": chapter_num,
-                                "verse_num": verse_num,
-                            }
-                            verse_text_parts = []
+            with self.open_stream() as stream:
+                for event, elem, text in self.iter_events(stream):
+                    # Character data preceding this event, outside notes
+                    if text and current_verse_data and not inside_note:
+                        verse_text_parts.append(text)
 
-                        # Check for eID (end of verse with sID/eID pattern)
-                        elif elem.get("eID") and current_verse_data:
-                            # Verse is complete, create it
-                            verse_text = " ".join(verse_text_parts).strip()
-                            verse = Verse(
-                                num=current_verse_data["verse_num"],
-                                chapter_num=current_verse_data["chapter_num"],
-                                text=verse_text,
-                                book_id=current_verse_data["book_id"],
-                            )
-
-                            # Add to book
-                            if current_verse_data["book_id"] in books_dict:
-                                books_dict[current_verse_data["book_id"]].verses.append(
-                                    verse)
+                    tag = elem.tag.split("}")[-1]  # Remove namespace
 
+                    if event == "start":
+                        if tag == "div" and elem.get("type") == "book":
+                            # Start of a book
+                            osis_id = elem.get("osisID", "")
+                            if osis_id:
+                                current_book_id = osis_id.lower()
+                                if current_book_id not in books_dict:
+                                    # Create book with default title (will be updated if <title> element found)
+                                    books_dict[current_book_id] = Book(
+                                        id=current_book_id,
+                                        num=len(books_dict) + 1,
+                                        title=current_book_id.capitalize(),
+                                    )
+
+                        elif tag == "title" and current_book_id and current_book_id in books_dict:
+                            # Mark that we're inside a title element
+                            inside_book_title = True
+
+                        elif tag == "verse":
+                            sid = elem.get("sID")
+
+                            # Check for eID (end of verse with sID/eID pattern)
+                            if elem.get("eID") and current_verse_data:
+                                self._add_verse(books_dict, current_verse_data, verse_text_parts)
+                                current_verse_data = None
+                                verse_text_parts = []
+
+                            # sID milestone, or old-style container verse with
+                            # osisID (completed at its end tag)
+                            elif (sid or elem.get("osisID")) and current_book_id:
+                                # Extract osisID from sID or use osisID attribute
+                                osis_id = elem.get("osisID", "")
+                                if not osis_id:
+                                    # Parse from sID (format: Book.Chapter.Verse.seID.xxxxx)
+                                    osis_id = ".".join(sid.split(".")[:3])
+
+                                book_id, chapter_num, verse_num = self._parse_osis_id(
+                                    osis_id)
+
+                                # Start collecting text for this verse
+                                current_verse_data = {
+                                    "book_id": book_id or current_book_id,
+                                    "chapter_num": chapter_num,
+                                    "verse_num": verse_num,
+                                    "container": not sid,
+                                }
+                                verse_text_parts = []
+
+                        elif tag == "note":
+                            inside_note = True
+
+                    elif event == "end":
+                        # Update book title when we finish parsing a title element
+                        if tag == "title" and inside_book_title and current_book_id:
+                            if elem.text and current_book_id in books_dict:
+                                books_dict[current_book_id].title = elem.text
+                            inside_book_title = False
+
+                        elif (
+                            tag == "verse"
+                            and current_verse_data
+                            and current_verse_data["container"]
+                        ):
+                            self._add_verse(books_dict, current_verse_data, verse_text_parts)
                             current_verse_data = None
                             verse_text_parts = []
 
-                        # Handle old-style OSIS (osisID without sID/eID)
-                        elif elem.get("osisID") and not sid and current_book_id:
-                            osis_id = elem.get("osisID", "")
-                            book_id, chapter_num, verse_num = self._parse_osis_id(
-                                osis_id)
-
-                            # Get text content from the element and its children
-                            verse_text = "".join(elem.itertext()).strip()
-
-                            verse = Verse(
-                                num=verse_num,
-                                chapter_num=chapter_num,
-                                text=verse_text,
-                                book_id=book_id or current_book_id,
-                            )
-
-                            if (book_id or current_book_id) in books_dict:
-                                books_dict[book_id or current_book_id].verses.append(
-                                    verse)
-
-                    elif tag == "note":
-                        inside_note = True
-
-                    # Collect text if we're inside a verse (sID/eID pattern)
-                    if current_verse_data and not inside_note and tag != "verse":
-                        if elem.text:
-                            verse_text_parts.append(elem.text)
-
-                elif event == "end":
-                    # Update book title when we finish parsing a title element
-                    if tag == "title" and inside_book_title and current_book_id:
-                        if elem.text and current_book_id in books_dict:
-                            books_dict[current_book_id].title = elem.text
-                        inside_book_title = False
-
-                    # Collect tail text if we're inside a verse
-                    if current_verse_data and not inside_note:
-                        if elem.tail:
-                            verse_text_parts.append(elem.tail)
-
-                    if tag == "note":
-                        inside_note = False
-
-                    elem.clear()
+                        elif tag == "note":
+                            inside_note = False
 
             # Organize verses into chapters and yield books
             for book in books_dict.values():
@@ -9,13 +9,8 @@ if sys.version_info >= (3, 9):
 else:
     from typing import Generator
 
-try:
-    from defusedxml.ElementTree import iterparse, ParseError as XMLParseError
-except ImportError:
-    from xml.etree.ElementTree import iterparse, ParseError as XMLParseError
-
 from bible_parser.models import Book, Chapter, Verse
-from bible_parser.parsers.base_parser import BaseParser
+from bible_parser.parsers.base_parser import BaseParser, join_text
 from bible_parser.errors import ParseError
 
 
@@ -135,6 +130,15 @@ class UsfxParser(BaseParser):
         except ValueError:
             return 0
 
+    def _make_verse(self, verse_data: dict, text_parts: list) -> Verse:
+        """Build a verse from its collected data and text fragments."""
+        return Verse(
+            num=verse_data["num"],
+            chapter_num=verse_data["chapter_num"],
+            text=join_text(text_parts),
+            book_id=verse_data["book_id"],
+        )
+
     def parse_books(self) -> Generator[Book, None, None]:
         """Parse USFX content and yield Book objects.
         
@@ -146,12 +150,6 @@ class UsfxParser(BaseParser):
         Raises:
             ParseError: If parsing fails.
         """
-        content = self.get_content()
-        
-        # Use BytesIO for iterparse
-        from io import BytesIO
-        content_bytes = content.encode("utf-8")
-        
         current_book: Optional[Book] = None
         current_chapter: Optional[Chapter] = None
         current_verse_data: Optional[dict] = None  # Store verse being built
@@ -160,135 +158,124 @@ class UsfxParser(BaseParser):
         inside_xref = False
         
         try:
-            # Use iterparse for streaming parsing
-            for event, elem in iterparse(BytesIO(content_bytes), events=("start", "end")):
-                # Remove namespace from tag if present
-                tag = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+            with self.open_stream() as stream:
+                for event, elem, text in self.iter_events(stream):
+                    # Character data preceding this event, outside notes
+                    if text and current_verse_data and not inside_footnote and not inside_xref:
+                        verse_text_parts.append(text)
+                    
+                    # Remove namespace from tag if present
+                    tag = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
                 
-                if event == "start":
-                    if tag == "book":
-                        # Start of a new book
-                        book_id = elem.get("id", "").lower()
-                        if not book_id:
-                            continue
+                    if event == "start":
+                        if tag in ("c", "v") and current_verse_data and verse_text_parts:
+                            # Milestone verse left open without <ve/>
+                            if current_chapter is not None:
+                                current_chapter.verses.append(
+                                    self._make_verse(current_verse_data, verse_text_parts)
+                                )
+                            current_verse_data = None
+                            verse_text_parts = []
+
+                        if tag == "book":
+                            # Start of a new book
+                            book_id = elem.get("id", "").lower()
+                            if not book_id:
+                                continue
                         
-                        book_num = self._get_book_num(book_id)
-                        book_name = self._get_book_name(book_id.upper())
+                            book_num = self._get_book_num(book_id)
+                            book_name = self._get_book_name(book_id.upper())
                         
-                        current_book = Book(
-                            id=book_id,
-                            num=book_num,
-                            title=book_name,
-                        )
+                            current_book = Book(
+                                id=book_id,
+                                num=book_num,
+                                title=book_name,
+                            )
                     
-                    elif tag == "c" and current_book is not None:
-                        # Start of a new chapter
-                        chapter_num_str = elem.get("id", "1")
-                        chapter_num = int(chapter_num_str) if chapter_num_str.isdigit() else 1
+                        elif tag == "c" and current_book is not None:
+                            # Start of a new chapter
+                            chapter_num_str = elem.get("id", "1")
+                            chapter_num = int(chapter_num_str) if chapter_num_str.isdigit() else 1
                         
-                        # If we have a previous chapter, add it to the book
-                        if current_chapter is not None and chapter_num != current_chapter.num:
-                            current_book.chapters.append(current_chapter)
-                            current_chapter = None
+                            # If we have a previous chapter, add it to the book
+                            if current_chapter is not None and chapter_num != current_chapter.num:
+                                current_book.chapters.append(current_chapter)
+                                current_chapter = None
                         
-                        current_chapter = Chapter(num=chapter_num)
+                            current_chapter = Chapter(num=chapter_num)
                     
-                    elif tag == "v" and current_book is not None and current_chapter is not None:
-                        # Start of a new verse
-                        verse_num_str = elem.get("id", "1")
-                        verse_num = int(verse_num_str) if verse_num_str.isdigit() else 1
+                        elif tag == "v" and current_book is not None and current_chapter is not None:
+                            # Start of a new verse
+                            verse_num_str = elem.get("id", "1")
+                            verse_num = int(verse_num_str) if verse_num_str.isdigit() else 1
                         
-                        # Start collecting text for this verse
-                        current_verse_data = {
-                            "num": verse_num,
-                            "chapter_num": current_chapter.num,
-                            "book_id": current_book.id,
-                        }
-                        verse_text_parts = []
+                            # Start collecting text for this verse
+                            current_verse_data = {
+                                "num": verse_num,
+                                "chapter_num": current_chapter.num,
+                                "book_id": current_book.id,
+                            }
+                            verse_text_parts = []
                     
-                    elif tag == "ve" and current_verse_data is not None:
-                        # End of verse marker - create the verse
-                        verse_text = " ".join(verse_text_parts).strip()
-                        verse = Verse(
-                            num=current_verse_data["num"],
-                            chapter_num=current_verse_data["chapter_num"],
-                            text=verse_text,
-                            book_id=current_verse_data["book_id"],
-                        )
-                        
-                        if current_chapter is not None:
-                            current_chapter.verses.append(verse)
+                        elif tag == "ve" and current_verse_data is not None:
+                            # End of verse marker (new-style USFX: <v id="1"/>text<ve/>)
+                            if current_chapter is not None:
+                                current_chapter.verses.append(
+                                    self._make_verse(current_verse_data, verse_text_parts)
+                                )
                         
-                        current_verse_data = None
-                        verse_text_parts = []
-                    
-                    elif tag == "f":
-                        # Footnote start - skip content
-                        inside_footnote = True
+                            current_verse_data = None
+                            verse_text_parts = []
                     
-                    elif tag == "x":
-                        # Cross-reference start - skip content
-                        inside_xref = True
+                        elif tag == "f":
+                            # Footnote start - skip content
+                            inside_footnote = True
                     
-                    # Collect text if we're inside a verse
-                    if current_verse_data and not inside_footnote and not inside_xref and tag not in ["v", "ve"]:
-                        if elem.text:
-                            verse_text_parts.append(elem.text)
+                        elif tag == "x":
+                            # Cross-reference start - skip content
+                            inside_xref = True
                 
-                elif event == "end":
-                    # Handle old-style USFX where <v> contains text and closes with </v>
-                    if tag == "v" and current_verse_data is not None and current_chapter is not None:
-                        # Check if this is old-style (has text content)
-                        # If verse_text_parts is empty, this might be old-style
-                        if not verse_text_parts and elem.text:
-                            # Old-style USFX: <v id="1">text</v>
-                            verse_text = elem.text.strip()
-                        else:
-                            # New-style USFX: <v id="1"/>text<ve/>
-                            verse_text = " ".join(verse_text_parts).strip()
-                        
-                        # Only create verse if we have text (old-style) or if we haven't seen <ve/> yet
-                        if verse_text and not verse_text_parts:
-                            # Old-style - create verse now
-                            verse = Verse(
-                                num=current_verse_data["num"],
-                                chapter_num=current_verse_data["chapter_num"],
-                                text=verse_text,
-                                book_id=current_verse_data["book_id"],
+                    elif event == "end":
+                        # Old-style USFX: <v id="1">text</v>. A milestone <v/>
+                        # has no text yet and waits for <ve/>.
+                        if (
+                            tag == "v"
+                            and current_verse_data is not None
+                            and current_chapter is not None
+                            and verse_text_parts
+                        ):
+                            current_chapter.verses.append(
+                                self._make_verse(current_verse_data, verse_text_parts)
                             )
-                            
-                            if current_chapter is not None:
-                                current_chapter.verses.append(verse)
-                            
                             current_verse_data = None
                             verse_text_parts = []
                     
-                    # Collect tail text if we're inside a verse
-                    if current_verse_data and not inside_footnote and not inside_xref:
-                        if elem.tail:
-                            verse_text_parts.append(elem.tail)
-                    
-                    if tag == "book" and current_book is not None:
-                        # End of book - add last chapter if exists
-                        if current_chapter is not None:
-                            current_book.chapters.append(current_chapter)
+                        elif tag == "book" and current_book is not None:
+                            # Milestone verse left open without <ve/>
+                            if current_verse_data and verse_text_parts and current_chapter is not None:
+                                current_chapter.verses.append(
+                                    self._make_verse(current_verse_data, verse_text_parts)
+                                )
+                            current_verse_data = None
+                            verse_text_parts = []
+
+                            # End of book - add last chapter if exists
+                            if current_chapter is not None:
+                                current_book.chapters.append(current_chapter)
                         
-                        # Flatten verses for easy access
-                        for chapter in current_book.chapters:
-                            current_book.verses.extend(chapter.verses)
+                            # Flatten verses for easy access
+                            for chapter in current_book.chapters:
+                                current_book.verses.extend(chapter.verses)
                         
-                        yield current_book
-                        current_book = None
-                        current_chapter = None
-                    
-                    elif tag == "f":
-                        inside_footnote = False
+                            yield current_book
+                            current_book = None
+                            current_chapter = None
                     
-                    elif tag == "x":
-                        inside_xref = False
+                        elif tag == "f":
+                            inside_footnote = False
                     
-                    # Clear element to free memory
-                    elem.clear()
+                        elif tag == "x":
+                            inside_xref = False
         
         except Exception as e:
             raise ParseError(f"Error parsing USFX books: {e}")
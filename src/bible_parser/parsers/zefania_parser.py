@@ -2,7 +2,6 @@
 
 import sys
 from typing import Optional
-from io import BytesIO
 
 # Python 3.9+ uses collections.abc, Python 3.8 uses typing
 if sys.version_info >= (3, 9):
@@ -10,10 +9,8 @@ if sys.version_info >= (3, 9):
 else:
     from typing import Generator
 
-from defusedxml.ElementTree import iterparse
-
 from bible_parser.models import Book, Chapter, Verse
-from bible_parser.parsers.base_parser import BaseParser
+from bible_parser.parsers.base_parser import BaseParser, join_text
 from bible_parser.errors import ParseError
 
 
@@ -21,8 +18,13 @@ class ZefaniaParser(BaseParser):
     """Parser for Zefania XML Bible Markup Language format.
     
     Zefania XML is a simple XML format used by various Bible software applications.
+    Verse text includes styled and Strong's-tagged words but not the content of
+    study notes or cross-references, wherever they appear in the verse.
     """
 
+    # Elements inside VERS whose content is not verse text
+    EXCLUDED_TAGS = frozenset({"NOTE", "XREF"})
+
     def check_format(self, content: str) -> bool:
         """Check if content is in Zefania format.
         
@@ -43,81 +45,88 @@ class ZefaniaParser(BaseParser):
         Raises:
             ParseError: If parsing fails.
         """
-        content = self.get_content()
-        content_bytes = content.encode("utf-8")
-        
         current_book: Optional[Book] = None
         current_chapter: Optional[Chapter] = None
         current_verse: Optional[Verse] = None
+        verse_text_parts = []  # Collect text for current verse
+        excluded_depth = 0  # Open NOTE/XREF elements inside the verse
         
         try:
-            for event, elem in iterparse(BytesIO(content_bytes), events=("start", "end")):
-                tag = elem.tag.upper()  # Zefania can use mixed case
+            with self.open_stream() as stream:
+                for event, elem, text in self.iter_events(stream):
+                    # Character data preceding this event, outside notes
+                    if text and current_verse is not None and not excluded_depth:
+                        verse_text_parts.append(text)
+                    
+                    # Zefania can use mixed case; remove namespace if present
+                    tag = elem.tag.rsplit("}", 1)[-1].upper()
                 
-                if event == "start":
-                    if tag == "BIBLEBOOK":
-                        # Start of a book
-                        book_num_str = elem.get("bnumber", "0")
-                        book_num = int(book_num_str) if book_num_str.isdigit() else 0
-                        book_name = elem.get("bname", f"Book{book_num}")
-                        book_id = elem.get("bsname", book_name.lower())
+                    if event == "start":
+                        if tag == "BIBLEBOOK":
+                            # Start of a book
+                            book_num_str = elem.get("bnumber", "0")
+                            book_num = int(book_num_str) if book_num_str.isdigit() else 0
+                            book_name = elem.get("bname", f"Book{book_num}")
+                            book_id = elem.get("bsname", book_name.lower())
                         
-                        current_book = Book(
-                            id=book_id.lower(),
-                            num=book_num,
-                            title=book_name,
-                        )
+                            current_book = Book(
+                                id=book_id.lower(),
+                                num=book_num,
+                                title=book_name,
+                            )
                     
-                    elif tag == "CHAPTER" and current_book is not None:
-                        # Start of a chapter
-                        chapter_num_str = elem.get("cnumber", "1")
-                        chapter_num = int(chapter_num_str) if chapter_num_str.isdigit() else 1
+                        elif tag == "CHAPTER" and current_book is not None:
+                            # Start of a chapter
+                            chapter_num_str = elem.get("cnumber", "1")
+                            chapter_num = int(chapter_num_str) if chapter_num_str.isdigit() else 1
                         
-                        current_chapter = Chapter(num=chapter_num)
+                            current_chapter = Chapter(num=chapter_num)
                     
-                    elif tag == "VERS" and current_book is not None and current_chapter is not None:
-                        # Start of a verse
-                        verse_num_str = elem.get("vnumber", "1")
-                        verse_num = int(verse_num_str) if verse_num_str.isdigit() else 1
-                        
-                        # Text is in the element's text content
-                        verse_text = elem.text or ""
+                        elif tag == "VERS" and current_book is not None and current_chapter is not None:
+                            # Start of a verse
+                            verse_num_str = elem.get("vnumber", "1")
+                            verse_num = int(verse_num_str) if verse_num_str.isdigit() else 1
                         
-                        current_verse = Verse(
-                            num=verse_num,
-                            chapter_num=current_chapter.num,
-                            text=verse_text.strip(),
-                            book_id=current_book.id,
-                        )
+                            current_verse = Verse(
+                                num=verse_num,
+                                chapter_num=current_chapter.num,
+                                text="",
+                                book_id=current_book.id,
+                            )
+                            verse_text_parts = []
+                            excluded_depth = 0
+                    
+                        elif tag in self.EXCLUDED_TAGS and current_verse is not None:
+                            excluded_depth += 1
                 
-                elif event == "end":
-                    if tag == "BIBLEBOOK" and current_book is not None:
-                        # End of book - add last chapter if exists
-                        if current_chapter is not None:
-                            current_book.chapters.append(current_chapter)
+                    elif event == "end":
+                        if tag == "BIBLEBOOK" and current_book is not None:
+                            # End of book - add last chapter if exists
+                            if current_chapter is not None:
+                                current_book.chapters.append(current_chapter)
                         
-                        # Flatten verses
-                        for chapter in current_book.chapters:
-                            current_book.verses.extend(chapter.verses)
+                            # Flatten verses
+                            for chapter in current_book.chapters:
+                                current_book.verses.extend(chapter.verses)
                         
-                        yield current_book
-                        current_book = None
-                        current_chapter = None
+                            yield current_book
+                            current_book = None
+                            current_chapter = None
                     
-                    elif tag == "CHAPTER" and current_chapter is not None and current_book is not None:
-                        # End of chapter
-                        current_book.chapters.append(current_chapter)
-                        current_chapter = None
+                        elif tag == "CHAPTER" and current_chapter is not None and current_book is not None:
+                            # End of chapter
+                            current_book.chapters.append(current_chapter)
+                            current_chapter = None
                     
-                    elif tag == "VERS" and current_verse is not None and current_chapter is not None:
-                        # End of verse - get text if not already set
-                        if not current_verse.text and elem.text:
-                            current_verse.text = elem.text.strip()
-                        
-                        current_chapter.verses.append(current_verse)
-                        current_verse = None
+                        elif tag == "VERS" and current_verse is not None and current_chapter is not None:
+                            # End of verse
+                            current_verse.text = join_text(verse_text_parts)
+                            current_chapter.verses.append(current_verse)
+                            current_verse = None
+                            verse_text_parts = []
                     
-                    elem.clear()
+                        elif tag in self.EXCLUDED_TAGS and excluded_depth:
+                            excluded_depth -= 1
         
         except Exception as e:
             raise ParseError(f"Error parsing Zefania books: {e}")
@@ -0,0 +1,87 @@
+"""Background producer for overlapping parsing with database writes."""
+
+import queue
+import sys
+import threading
+from typing import Any, Iterable, TypeVar
+
+# Python 3.9+ uses collections.abc, Python 3.8 uses typing
+if sys.version_info >= (3, 9):
+    from collections.abc import Iterator
+else:
+    from typing import Iterator
+
+T = TypeVar("T")
+
+# How often a blocked producer checks whether the consumer has gone away
+_POLL_SECONDS = 0.1
+
+_DONE = object()
+
+
+class _Failure:
+    """Exception raised by the producer, handed over to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetch(items: Iterable[T], maxsize: int = 4) -> Iterator[T]:
+    """Iterate in a background thread while the caller consumes the results.
+
+    The producer thread runs ahead of the consumer by at most maxsize items and
+    blocks when the queue is full, so memory stays bounded. SQLite releases
+    the GIL while it executes statements, which lets the producer parse the
+    next items while the consumer's inserts and FTS indexing run.
+
+    Exceptions raised by the producer are re-raised in the consumer. If the
+    consumer stops early (break, exception or close()), the producer is
+    stopped and joined before this generator finishes.
+
+    Args:
+        items: Iterable to run in the background (e.g., parsed book rows).
+        maxsize: Maximum number of items waiting to be consumed.
+
+    Yields:
+        The items, in order.
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_Failure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    thread = threading.Thread(target=produce, name="bible-parser-prefetch", daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,346 @@
+"""SQL statement profiling and query plan diagnostics.
+
+A repository opened with ``profile=True`` records, for every distinct SQL
+statement, how often it ran, its wall time (execution plus fetching) and the
+rows it returned or changed. The first time a statement is seen its
+EXPLAIN QUERY PLAN is captured and checked for full table scans, full index
+scans and temporary B-trees.
+
+A sqlite3 trace callback counts every statement program SQLite starts and
+attributes it to the statement being executed, so work done on its behalf
+(trigger programs such as FTS index maintenance on insert, the implicit BEGIN)
+shows up as runs in excess of calls.
+
+Example:
+    >>> with BibleRepository(xml_path='bible.xml', profile=True) as repo:
+    ...     repo.initialize('bible.db')
+    ...     repo.get_chapter_count('gen')
+    ...     print(repo.profiler.report())
+"""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Statements whose plans are not worth reporting
+_UNPLANNED = ("BEGIN", "COMMIT", "ROLLBACK", "CREATE", "DROP", "ALTER", "PRAGMA", "EXPLAIN")
+
+# System tables that are always scanned and always tiny
+_SYSTEM_TABLES = ("sqlite_master", "sqlite_schema", "sqlite_temp_master")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so the same statement always gets the same key.
+
+    Args:
+        sql: SQL text.
+
+    Returns:
+        The SQL on one line with single spaces.
+    """
+    return " ".join(sql.split())
+
+
+@dataclass
+class StatementStats:
+    """Profile of one distinct SQL statement.
+
+    Attributes:
+        sql: Normalized SQL text.
+        calls: Executions requested by the caller (one per parameter set for
+            executemany).
+        runs: Statement programs SQLite started while this statement was
+            executing, as seen by the trace callback; includes trigger programs.
+        total_time: Wall time in seconds spent executing and fetching.
+        max_time: Slowest single execute or fetch, in seconds.
+        rows: Rows returned (queries) or changed (DML).
+        plan: EXPLAIN QUERY PLAN detail lines.
+    """
+
+    sql: str
+    calls: int = 0
+    runs: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    rows: int = 0
+    plan: List[str] = field(default_factory=list)
+
+    @property
+    def mean_time(self) -> float:
+        """Average wall time per call in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def warnings(self) -> List[str]:
+        """Plan steps that read a whole table or index or build a temporary B-tree."""
+        return [step for step in self.plan if plan_warning(step)]
+
+    @property
+    def full_scan(self) -> bool:
+        """True if the plan scans a whole table without an index."""
+        return any(plan_warning(step) == "full table scan" for step in self.plan)
+
+    def add(self, seconds: float, rows: int = 0) -> None:
+        """Add the time and rows of one execute or fetch."""
+        self.total_time += seconds
+        if seconds > self.max_time:
+            self.max_time = seconds
+        self.rows += rows
+
+
+def plan_warning(step: str) -> Optional[str]:
+    """Classify an EXPLAIN QUERY PLAN detail line.
+
+    Args:
+        step: Detail text such as 'SCAN verses' or
+            'SEARCH verses USING INDEX idx_verses_lookup (book_key=?)'.
+
+    Returns:
+        'full table scan', 'full index scan' or 'temporary b-tree' for steps
+        worth attention, None for index searches, virtual tables and scans of
+        system tables.
+    """
+    words = step.split()
+    if step.startswith("USE TEMP B-TREE"):
+        return "temporary b-tree"
+    if len(words) < 2 or words[0] != "SCAN":
+        return None
+    if "VIRTUAL TABLE" in step or words[1] in _SYSTEM_TABLES:
+        return None
+    if "USING" in words:
+        return "full index scan"
+    return "full table scan"
+
+
+class QueryProfiler:
+    """Collects per-statement timings, row counts and query plans.
+
+    Attributes:
+        statements: StatementStats by normalized SQL, in first-seen order.
+        explain: Capture EXPLAIN QUERY PLAN for each new statement.
+    """
+
+    def __init__(self, explain: bool = True):
+        """Initialize an empty profiler.
+
+        Args:
+            explain: Capture EXPLAIN QUERY PLAN for each new statement.
+        """
+        self.explain = explain
+        self.statements: Dict[str, StatementStats] = {}
+        # The statement each thread is executing; read-only connections are shared
+        self._local = threading.local()
+
+    def connect(self, database: str, **kwargs: Any) -> "ProfiledConnection":
+        """Open a SQLite connection whose statements are recorded by this profiler.
+
+        Args:
+            database: Database path.
+            **kwargs: Further arguments for sqlite3.connect().
+
+        Returns:
+            A connection that reports to this profiler.
+        """
+        connection = sqlite3.connect(database, factory=ProfiledConnection, **kwargs)
+        connection.profiler = self
+        connection.set_trace_callback(self._trace)
+        return connection
+
+    def statement(
+        self, connection: sqlite3.Connection, sql: str, parameters: Any = ()
+    ) -> StatementStats:
+        """Get the stats of a statement, creating them (and its plan) on first use.
+
+        Args:
+            connection: Connection the statement runs on.
+            sql: SQL text.
+            parameters: Parameters of the call, used to explain the statement.
+
+        Returns:
+            The statement's StatementStats.
+        """
+        key = normalize_sql(sql)
+        stats = self.statements.get(key)
+        if stats is None:
+            stats = self.statements.setdefault(key, StatementStats(key))
+            if self.explain and not key.upper().startswith(_UNPLANNED):
+                stats.plan = explain_query_plan(connection, sql, parameters)
+        return stats
+
+    def _trace(self, sql: str) -> None:
+        """Trace callback: count a statement program started by SQLite."""
+        current = getattr(self._local, "current", None)
+        if current is not None:
+            current.runs += 1
+
+    def full_scans(self) -> List[StatementStats]:
+        """Get the statements whose plans scan a whole table without an index."""
+        return [stats for stats in self.statements.values() if stats.full_scan]
+
+    def slowest(self, count: int = 10) -> List[StatementStats]:
+        """Get the statements with the most total wall time.
+
+        Args:
+            count: Maximum number of statements.
+
+        Returns:
+            StatementStats sorted by total time, slowest first.
+        """
+        return sorted(self.statements.values(), key=lambda s: s.total_time, reverse=True)[:count]
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """Format the profile as text, slowest statements first.
+
+        Args:
+            limit: Maximum number of statements to include (all by default).
+
+        Returns:
+            One block per statement with its calls, runs, rows, times, plan and
+            warnings.
+        """
+        statements = self.slowest(limit if limit is not None else len(self.statements))
+        lines = []
+        for stats in statements:
+            lines.append(
+                f"{stats.total_time * 1000:10.2f} ms  calls {stats.calls:<7} runs {stats.runs:<7} "
+                f"rows {stats.rows:<7} mean {stats.mean_time * 1e6:9.1f} us  "
+                f"max {stats.max_time * 1e6:9.1f} us"
+            )
+            lines.append(f"    {stats.sql}")
+            for step in stats.plan:
+                warning = plan_warning(step)
+                lines.append(f"      {step}" + (f"  <-- {warning}" if warning else ""))
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Discard all recorded statements."""
+        self.statements.clear()
+
+
+def explain_query_plan(
+    connection: sqlite3.Connection, sql: str, parameters: Any = ()
+) -> List[str]:
+    """Get the EXPLAIN QUERY PLAN detail lines of a statement.
+
+    Args:
+        connection: Connection to explain on.
+        sql: SQL text.
+        parameters: Parameters for the statement's placeholders.
+
+    Returns:
+        Detail lines in plan order (empty if the statement cannot be explained).
+    """
+    try:
+        cursor = sqlite3.Connection.cursor(connection, sqlite3.Cursor)
+        cursor.row_factory = None
+        rows = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+    except sqlite3.Error:
+        return []
+    return [row[3] for row in rows]
+
+
+def _counted(stats: StatementStats, parameters: Iterator[Any]) -> Iterator[Any]:
+    """Pass parameter sets through, counting each as a call of the statement."""
+    for row in parameters:
+        stats.calls += 1
+        yield row
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor that reports executes and fetches to its connection's profiler."""
+
+    _stats: Optional[StatementStats] = None
+
+    def _run(self, stats: StatementStats, method: Any, *args: Any) -> "ProfiledCursor":
+        local = self.connection.profiler._local
+        local.current = stats
+        start = time.perf_counter()
+        try:
+            method(self, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            local.current = None
+        self._stats = stats
+        # Queries count rows as they are fetched, DML reports rows changed
+        stats.add(elapsed, max(self.rowcount, 0))
+        return self
+
+    def execute(self, sql: str, parameters: Any = ()) -> "ProfiledCursor":
+        stats = self.connection.profiler.statement(self.connection, sql, parameters)
+        stats.calls += 1
+        return self._run(stats, sqlite3.Cursor.execute, sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> "ProfiledCursor":
+        # Peek at the first parameter set to explain the statement, without copying the rest
+        parameters = iter(seq_of_parameters)
+        first = next(parameters, None)
+        if first is not None:
+            parameters = chain((first,), parameters)
+        stats = self.connection.profiler.statement(
+            self.connection, sql, () if first is None else first
+        )
+        return self._run(stats, sqlite3.Cursor.executemany, sql, _counted(stats, parameters))
+
+    def _fetched(self, start: float, rows: int) -> None:
+        if self._stats is not None:
+            self._stats.add(time.perf_counter() - start, rows)
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(start, row is not None)
+        return row
+
+    def fetchmany(self, size: int = -1) -> List[Any]:
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size < 0 else size)
+        self._fetched(start, len(rows))
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(start, len(rows))
+        return rows
+
+    def __next__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._fetched(start, 0)
+            raise
+        self._fetched(start, 1)
+        return row
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection whose cursors report to a QueryProfiler.
+
+    Create it with QueryProfiler.connect().
+    """
+
+    profiler: QueryProfiler
+
+    def cursor(self, factory: Any = ProfiledCursor) -> Any:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> Any:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> Any:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def commit(self) -> None:
+        stats = self.profiler.statement(self, "COMMIT")
+        stats.calls += 1
+        self.profiler._local.current = stats
+        start = time.perf_counter()
+        try:
+            super().commit()
+        finally:
+            self.profiler._local.current = None
+            stats.add(time.perf_counter() - start)
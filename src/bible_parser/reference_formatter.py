@@ -9,6 +9,7 @@ from typing import List, Optional, TYPE_CHECKING
 
 from bible_parser.models import BibleReference, VerseRange, Verse
 from bible_parser.errors import ReferenceFormatError
+from bible_parser.versification import get_mapper
 
 if TYPE_CHECKING:
     from bible_parser.bible_repository import BibleRepository
@@ -793,9 +794,101 @@ class BibleReferenceFormatter:
         
         return query
     
+    @staticmethod
+    def map_reference(
+        ref: BibleReference, source: str, target: str
+    ) -> BibleReference:
+        """Convert a parsed reference from one versification scheme to another.
+        
+        Each verse is mapped in constant time through the precompiled tables in
+        bible_parser.versification. Ranges whose end lands in another chapter
+        become multi-chapter ranges, and additional verse ranges are split at
+        chapter boundaries. Chapter-only references are mapped by their first
+        verse.
+        
+        Args:
+            ref: The parsed reference.
+            source: Scheme the reference is numbered in (e.g., 'KJV').
+            target: Scheme to convert into (e.g., 'LXX').
+            
+        Returns:
+            A new BibleReference in the target scheme.
+            
+        Raises:
+            VersificationError: If either scheme is not supported.
+            
+        Examples:
+            >>> ref = BibleReference(book_id='psa', chapter_num=23, is_chapter_only=True)
+            >>> BibleReferenceFormatter.map_reference(ref, 'KJV', 'LXX').chapter_num
+            22
+        """
+        mapper = get_mapper(source, target)
+        if mapper.is_identity:
+            return ref
+        
+        book_id = ref.book_id
+        
+        if ref.is_chapter_only:
+            _, chapter_num, _ = mapper.map(book_id, ref.chapter_num, 1)
+            end_chapter_num = None
+            if ref.end_chapter_num:
+                _, end_chapter_num, _ = mapper.map(book_id, ref.end_chapter_num, 1)
+            return BibleReference(
+                book_id=book_id,
+                chapter_num=chapter_num,
+                end_chapter_num=end_chapter_num,
+                is_chapter_only=True,
+            )
+        
+        _, chapter_num, verse_num = mapper.map(book_id, ref.chapter_num, ref.verse_num or 1)
+        if ref.verse_num is None:
+            verse_num = None
+        
+        end_chapter_num = None
+        end_verse_num = None
+        if ref.end_verse_num:
+            _, mapped_end_chapter, end_verse_num = mapper.map(
+                book_id, ref.end_chapter_num or ref.chapter_num, ref.end_verse_num
+            )
+            if ref.end_chapter_num or mapped_end_chapter != chapter_num:
+                end_chapter_num = mapped_end_chapter
+        
+        additional_verses = []
+        for verse_range in ref.additional_verses:
+            range_chapter = verse_range.chapter_num or ref.chapter_num
+            start = verse_range.start_verse or 1
+            end = verse_range.end_verse or start
+            
+            # Map verse by verse and regroup contiguous runs per chapter
+            runs: List[List[int]] = []
+            for verse in range(start, end + 1):
+                _, mapped_chapter, mapped_verse = mapper.map(book_id, range_chapter, verse)
+                if runs and runs[-1][0] == mapped_chapter and runs[-1][2] == mapped_verse - 1:
+                    runs[-1][2] = mapped_verse
+                else:
+                    runs.append([mapped_chapter, mapped_verse, mapped_verse])
+            
+            for mapped_chapter, first, last in runs:
+                additional_verses.append(VerseRange(
+                    chapter_num=mapped_chapter,
+                    start_verse=first,
+                    end_verse=last if verse_range.end_verse else None,
+                ))
+        
+        return BibleReference(
+            book_id=book_id,
+            chapter_num=chapter_num,
+            verse_num=verse_num,
+            end_chapter_num=end_chapter_num,
+            end_verse_num=end_verse_num,
+            additional_verses=additional_verses,
+        )
+    
     @staticmethod
     def get_verses_from_reference(
-        reference: str, bible_repository: "BibleRepository"
+        reference: str,
+        bible_repository: "BibleRepository",
+        versification: Optional[str] = None,
     ) -> List[Verse]:
         """Parse a reference and retrieve all matching verses in one call.
         
@@ -806,6 +899,8 @@ class BibleReferenceFormatter:
         Args:
             reference: Bible reference string (e.g., "John 3:16-18").
             bible_repository: Repository to fetch verses from.
+            versification: Scheme the reference is numbered in. When given, the
+                reference is mapped into the repository's scheme first.
             
         Returns:
             List of Verse objects matching the reference. Returns empty list if
@@ -828,6 +923,11 @@ class BibleReferenceFormatter:
         """
         ref = BibleReferenceFormatter.parse(reference, bible_repository)
         
+        if versification is not None:
+            ref = BibleReferenceFormatter.map_reference(
+                ref, versification, getattr(bible_repository, "versification", "KJV")
+            )
+        
         # Single verse
         if (not ref.end_verse_num and not ref.end_chapter_num and 
             not ref.additional_verses and ref.verse_num is not None):
@@ -0,0 +1,455 @@
+"""Lightweight HTTP query service over a BibleRepository database.
+
+Built on the standard library's threading HTTP server, so it needs no extra
+dependencies. Every worker thread borrows a read-only repository from a shared
+RepositoryPool instead of opening the database per request, and successful
+responses are kept in an LRU ResponseCache. The database is not modified while
+it is served, so each response's ETag is derived from the database digest and
+the request. A matching If-None-Match is answered with 304 Not Modified once the
+request is known to succeed; for a cached response that takes no SQLite query.
+
+Endpoints (all GET, JSON responses):
+
+=================================================  ===================================
+Path                                               Result
+=================================================  ===================================
+/books                                             Books in order
+/lookup?ref=John+3:16-18                           Verses of a reference, parsed by
+                                                   BibleReferenceFormatter (repeat
+                                                   ref for several)
+/range?book=gen&chapter=1&start=1&end=5            Verses of a range; end_chapter
+                                                   extends it across chapters (up to
+                                                   the book's last chapter)
+/bulk?refs=gen.1.1,jhn.3.16                        One verse (or null) per reference
+/search?q=grace&limit=10                           Full-text search
+=================================================  ===================================
+
+``server.request`` timings (tag: endpoint), ``server.not_modified`` counters and
+``cache.hit`` / ``cache.miss`` counters (tag: cache=server.response) are
+reported to the optional instrumentation.
+
+Example:
+    >>> with BibleServer('bible.db', port=8000) as server:
+    ...     server.serve_forever()
+
+    $ bible-parser serve bible.db --port 8000
+"""
+
+import hashlib
+import json
+import queue
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from bible_parser.bible_repository import BibleRepository
+from bible_parser.errors import BibleParserException
+from bible_parser.instrumentation import Instrumentation
+from bible_parser.reference_formatter import BibleReferenceFormatter
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_CACHE_SIZE = 1024
+
+# Largest number of references accepted by /bulk and results by /search
+MAX_BULK_REFERENCES = 1000
+MAX_SEARCH_LIMIT = 1000
+
+_CACHE_TAGS = {"cache": "server.response"}
+
+
+class RepositoryPool:
+    """Fixed set of read-only repositories shared by request threads.
+
+    Attributes:
+        database: Path of the database served.
+        size: Number of repositories (and SQLite connections).
+    """
+
+    def __init__(self, database: str, size: int = DEFAULT_POOL_SIZE):
+        """Open size read-only repositories on database.
+
+        Args:
+            database: Existing, populated database file.
+            size: Number of repositories; requests beyond it wait for one.
+
+        Raises:
+            BibleParserException: If the database needs migrating to this version.
+            Exception: If the database does not exist or is empty.
+        """
+        self.database = database
+        self.size = size
+        self._idle: "queue.LifoQueue[BibleRepository]" = queue.LifoQueue()
+        self._all: List[BibleRepository] = []
+        try:
+            for _ in range(size):
+                repository = BibleRepository()
+                repository.initialize(database, read_only=True)
+                self._all.append(repository)
+                self._idle.put(repository)
+        except Exception:
+            self.close()
+            raise
+
+    @contextmanager
+    def acquire(self) -> Iterator[BibleRepository]:
+        """Borrow a repository for the duration of a with block."""
+        repository = self._idle.get()
+        try:
+            yield repository
+        finally:
+            self._idle.put(repository)
+
+    def close(self) -> None:
+        """Close every repository in the pool."""
+        for repository in self._all:
+            repository.close()
+        self._all.clear()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of encoded responses by request key.
+
+    Attributes:
+        maxsize: Maximum number of responses kept (0 disables caching).
+    """
+
+    def __init__(
+        self, maxsize: int = DEFAULT_CACHE_SIZE, instrumentation: Optional[Instrumentation] = None
+    ):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of responses kept.
+            instrumentation: Optional receiver of cache.hit and cache.miss counters.
+        """
+        self.maxsize = maxsize
+        self.instrumentation = instrumentation
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached response, marking it most recently used."""
+        with self._lock:
+            body = self._entries.get(key)
+            if body is not None:
+                self._entries.move_to_end(key)
+        if self.instrumentation is not None:
+            self.instrumentation.increment(
+                "cache.hit" if body is not None else "cache.miss", tags=_CACHE_TAGS
+            )
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        """Store a response, evicting the least recently used beyond maxsize."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = body
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Number of cached responses."""
+        return len(self._entries)
+
+
+class _RequestError(Exception):
+    """Invalid request, answered with the given status."""
+
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(params: Dict[str, List[str]], name: str, default: Optional[str] = None) -> str:
+    """Get a single query parameter."""
+    values = params.get(name)
+    if not values:
+        if default is None:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, f"Missing parameter '{name}'")
+        return default
+    return values[-1]
+
+
+def _int_param(params: Dict[str, List[str]], name: str, default: Optional[int] = None) -> int:
+    """Get a positive integer query parameter."""
+    text = _param(params, name, None if default is None else str(default))
+    if not text.isdigit() or int(text) < 1:
+        raise _RequestError(
+            HTTPStatus.BAD_REQUEST, f"Parameter '{name}' must be a positive integer"
+        )
+    return int(text)
+
+
+def _verses(verses: List[Any]) -> List[Optional[Dict[str, Any]]]:
+    """Convert verses (or None for missing ones) to JSON objects."""
+    return [verse.to_dict() if verse is not None else None for verse in verses]
+
+
+class BibleServer:
+    """HTTP server answering verse queries from a pooled, read-only database.
+
+    Attributes:
+        database: Path of the database served.
+        pool: Read-only repositories shared by the request threads.
+        cache: Cache of encoded responses.
+        digest: Database digest the ETags are derived from.
+        instrumentation: Optional receiver of request and cache metrics.
+    """
+
+    def __init__(
+        self,
+        database: str,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        instrumentation: Optional[Instrumentation] = None,
+        log_requests: bool = False,
+    ):
+        """Open the database and bind the listening socket.
+
+        Args:
+            database: Existing database built by BibleRepository.
+            host: Interface to listen on.
+            port: Port to listen on (0 picks a free port; see url).
+            pool_size: Number of pooled read-only connections.
+            cache_size: Maximum number of cached responses (0 disables caching).
+            instrumentation: Optional receiver of request and cache metrics.
+            log_requests: Log each request to stderr.
+
+        Raises:
+            BibleParserException: If the database needs migrating to this version.
+            Exception: If the database does not exist or is empty.
+        """
+        self.database = database
+        self.instrumentation = instrumentation
+        self.pool = RepositoryPool(database, pool_size)
+        self.cache = ResponseCache(cache_size, instrumentation)
+        with self.pool.acquire() as repository:
+            self.digest = repository.get_database_digest()
+        self._routes = {
+            "/books": self._books,
+            "/lookup": self._lookup,
+            "/range": self._range,
+            "/bulk": self._bulk,
+            "/search": self._search,
+        }
+        try:
+            self._httpd = ThreadingHTTPServer((host, port), self._handler_class(log_requests))
+        except Exception:
+            self.pool.close()
+            raise
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """Base URL the server listens on."""
+        host, port = self._httpd.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self) -> None:
+        """Handle requests until shutdown() is called."""
+        self._httpd.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stop serve_forever(), which must be running in another thread."""
+        self._httpd.shutdown()
+
+    def close(self) -> None:
+        """Close the listening socket and the pooled connections."""
+        self._httpd.server_close()
+        self.pool.close()
+
+    def __enter__(self) -> "BibleServer":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def etag(self, key: str) -> str:
+        """Get the ETag of the response to a request.
+
+        Args:
+            key: Canonical request key from respond().
+
+        Returns:
+            Quoted entity tag, unique to the database content and request.
+        """
+        return '"' + hashlib.sha256(f"{self.digest}\n{key}".encode("utf-8")).hexdigest()[:32] + '"'
+
+    def respond(
+        self, target: str, if_none_match: Optional[str] = None
+    ) -> Tuple[HTTPStatus, Dict[str, str], bytes]:
+        """Answer a GET request.
+
+        Args:
+            target: Request target (path and query string).
+            if_none_match: Value of the If-None-Match header, if any; it is
+                only honoured for requests that succeed.
+
+        Returns:
+            Tuple of (status, headers, body).
+        """
+        url = urlsplit(target)
+        params = parse_qs(url.query)
+        handler = self._routes.get(url.path.rstrip("/") or "/")
+        if handler is None:
+            return self._error(HTTPStatus.NOT_FOUND, f"Unknown endpoint '{url.path}'")
+
+        # Parameter order does not change the answer, so it does not change the key
+        key = url.path + "?" + urlencode(sorted(params.items()), doseq=True)
+
+        # Only successful responses are cached, so a cached body needs no validation
+        body = self.cache.get(key)
+        if body is None:
+            try:
+                with self.pool.acquire() as repository:
+                    result = handler(repository, params)
+            except _RequestError as e:
+                return self._error(e.status, str(e))
+            except BibleParserException as e:
+                return self._error(HTTPStatus.BAD_REQUEST, str(e))
+            except Exception as e:
+                return self._error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+            body = json.dumps(result, ensure_ascii=False).encode("utf-8")
+            self.cache.put(key, body)
+
+        etag = self.etag(key)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        tags = [tag.strip() for tag in (if_none_match or "").split(",")]
+        if "*" in tags or etag in tags:
+            if self.instrumentation is not None:
+                self.instrumentation.increment("server.not_modified")
+            return HTTPStatus.NOT_MODIFIED, headers, b""
+        headers["Content-Type"] = "application/json; charset=utf-8"
+        return HTTPStatus.OK, headers, body
+
+    @staticmethod
+    def _error(status: HTTPStatus, message: str) -> Tuple[HTTPStatus, Dict[str, str], bytes]:
+        """Build a JSON error response."""
+        body = json.dumps({"error": message}).encode("utf-8")
+        return status, {"Content-Type": "application/json; charset=utf-8"}, body
+
+    def _books(self, repository: BibleRepository, params: Dict[str, List[str]]) -> Any:
+        return [book.to_dict() for book in repository.get_books()]
+
+    def _lookup(self, repository: BibleRepository, params: Dict[str, List[str]]) -> Any:
+        references = params.get("ref")
+        if not references:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, "Missing parameter 'ref'")
+        versification = params.get("versification", [None])[-1]
+        return [
+            {
+                "reference": reference,
+                "verses": _verses(
+                    BibleReferenceFormatter.get_verses_from_reference(
+                        reference, repository, versification=versification
+                    )
+                ),
+            }
+            for reference in references
+        ]
+
+    def _range(self, repository: BibleRepository, params: Dict[str, List[str]]) -> Any:
+        book_id = _param(params, "book")
+        chapter = _int_param(params, "chapter")
+        end_chapter = _int_param(params, "end_chapter", chapter)
+        start = _int_param(params, "start", 1)
+        end = _int_param(params, "end", 10 ** 6)
+        if (end_chapter, end) < (chapter, start):
+            raise _RequestError(HTTPStatus.BAD_REQUEST, "Range ends before it starts")
+        # One query per chapter, so never look past the book's last chapter; a
+        # range running past it takes that chapter whole
+        last_chapter = repository.get_chapter_count(book_id)
+        if end_chapter > last_chapter:
+            end_chapter, end = last_chapter, 10 ** 6
+        verses = []
+        for chapter_num in range(chapter, end_chapter + 1):
+            for verse in repository.get_verses(book_id, chapter_num):
+                if (chapter_num, verse.num) < (chapter, start):
+                    continue
+                if (chapter_num, verse.num) > (end_chapter, end):
+                    break
+                verses.append(verse)
+        return _verses(verses)
+
+    def _bulk(self, repository: BibleRepository, params: Dict[str, List[str]]) -> Any:
+        references = []
+        for text in ",".join(params.get("refs", [])).split(","):
+            if not text:
+                continue
+            parts = text.split(".")
+            if len(parts) != 3 or not parts[1].isdigit() or not parts[2].isdigit():
+                raise _RequestError(
+                    HTTPStatus.BAD_REQUEST,
+                    f"Invalid reference '{text}'; expected book.chapter.verse",
+                )
+            references.append((parts[0], int(parts[1]), int(parts[2])))
+        if not references:
+            raise _RequestError(HTTPStatus.BAD_REQUEST, "Missing parameter 'refs'")
+        if len(references) > MAX_BULK_REFERENCES:
+            raise _RequestError(
+                HTTPStatus.BAD_REQUEST, f"At most {MAX_BULK_REFERENCES} references per request"
+            )
+        return _verses(repository.get_verses_bulk(references))
+
+    def _search(self, repository: BibleRepository, params: Dict[str, List[str]]) -> Any:
+        query = _param(params, "q")
+        limit = min(_int_param(params, "limit", 100), MAX_SEARCH_LIMIT)
+        try:
+            return _verses(repository.search_verses(query, limit))
+        except sqlite3.OperationalError as e:
+            # FTS5 rejects malformed query syntax at execution time
+            raise _RequestError(HTTPStatus.BAD_REQUEST, f"Invalid search query: {e}")
+
+    def _handler_class(self, log_requests: bool) -> type:
+        """Build the request handler class bound to this server."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so clients can reuse connections
+            protocol_version = "HTTP/1.1"
+            # Headers and body are sent separately; with Nagle's algorithm the
+            # body would wait for the client's delayed ACK (~40 ms per request)
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                # Unknown paths share one tag, so they cannot create metric series
+                endpoint = urlsplit(self.path).path.rstrip("/") or "/"
+                if endpoint not in server._routes:
+                    endpoint = "other"
+                with _timed(server.instrumentation, endpoint):
+                    status, headers, body = server.respond(
+                        self.path, self.headers.get("If-None-Match")
+                    )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                if log_requests:
+                    super().log_message(format, *args)
+
+        return Handler
+
+
+@contextmanager
+def _timed(instrumentation: Optional[Instrumentation], endpoint: str) -> Iterator[None]:
+    """Report the time of a request as server.request when instrumented."""
+    if instrumentation is None:
+        yield
+    else:
+        with instrumentation.timer("server.request", {"endpoint": endpoint}):
+            yield
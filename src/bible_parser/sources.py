@@ -0,0 +1,391 @@
+"""Opening Bible sources as binary streams, with on-the-fly decompression.
+
+Sources can be plain or compressed files (gzip, bzip2, xz or a zip archive
+holding a single Bible), members of multi-Bible zip archives, binary file-like
+objects, in-memory buffers (bytes, bytearray, memoryview) or iterables of byte
+chunks such as an HTTP response body. Compression is recognized from the
+leading magic bytes, not the file extension, and data is decompressed
+incrementally as the XML parser reads it, so nothing is extracted to disk.
+
+Non-seekable sources (chunk iterables and pipe-like file objects) can only be
+read once.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import zipfile
+from pathlib import Path
+from itertools import chain
+from typing import Any, BinaryIO, Iterable, Iterator, List, Optional, Union, cast
+
+from bible_parser.errors import ParseError
+
+GZIP_MAGIC = b"\x1f\x8b"
+BZIP2_MAGIC = b"BZh"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+ZIP_MAGIC = b"PK\x03\x04"
+
+_MAGIC_LENGTH = 6
+
+# Read size used when replaying a partly consumed stream
+_CHUNK_SIZE = 64 * 1024
+
+
+class ArchiveMember:
+    """Reference to one Bible file inside a zip archive.
+
+    Attributes:
+        archive: Path to the zip archive.
+        name: Name of the member inside the archive.
+
+    Example:
+        >>> parser = BibleParser(ArchiveMember('bibles.zip', 'kjv.xml'))
+    """
+
+    def __init__(self, archive: Union[str, Path], name: str):
+        """Initialize the archive member reference.
+
+        Args:
+            archive: Path to the zip archive.
+            name: Name of the member inside the archive.
+        """
+        self.archive = archive
+        self.name = name
+
+    def __repr__(self) -> str:
+        """Return a debug representation."""
+        return f"ArchiveMember({str(self.archive)!r}, {self.name!r})"
+
+
+# In-memory buffers accepted as sources
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Anything open_source() accepts
+Source = Union[str, Path, ArchiveMember, BinaryIO, Buffer, Iterable[bytes]]
+
+
+class _BorrowedStream(io.RawIOBase):
+    """Raw stream over a caller-owned file object that never closes it."""
+
+    def __init__(self, fileobj: Any):
+        self._fileobj = fileobj
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._fileobj.read(len(buffer))
+        size = len(data)
+        buffer[:size] = data
+        return size
+
+    def seekable(self) -> bool:
+        return bool(getattr(self._fileobj, "seekable", lambda: False)())
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return int(self._fileobj.seek(offset, whence))
+
+    def tell(self) -> int:
+        return int(self._fileobj.tell())
+
+
+class _ChunkStream(io.RawIOBase):
+    """Raw stream over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[Any], on_close: Any = None):
+        self._chunks = chunks
+        self._pending = memoryview(b"")
+        self._on_close = on_close
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            if not isinstance(chunk, (bytes, bytearray, memoryview)):
+                raise ParseError(f"Chunk sources must yield bytes, not {type(chunk).__name__}")
+            self._pending = memoryview(chunk).cast("B")
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed and self._on_close is not None:
+            self._on_close()
+        super().close()
+
+
+def is_file_like(source: Any) -> bool:
+    """Check whether a source is a readable file-like object.
+
+    Args:
+        source: The source to check.
+
+    Returns:
+        True if the source has a read() method.
+    """
+    return callable(getattr(source, "read", None))
+
+
+def is_buffer(source: Any) -> bool:
+    """Check whether a source is an in-memory byte buffer.
+
+    Args:
+        source: The source to check.
+
+    Returns:
+        True for bytes, bytearray and memoryview objects.
+    """
+    return isinstance(source, (bytes, bytearray, memoryview))
+
+
+def is_chunk_iterable(source: Any) -> bool:
+    """Check whether a source is an iterable of byte chunks.
+
+    Args:
+        source: The source to check.
+
+    Returns:
+        True for iterables that are not strings, buffers, paths or files.
+    """
+    return (
+        hasattr(source, "__iter__")
+        and not isinstance(source, (str, Path, ArchiveMember))
+        and not is_buffer(source)
+        and not is_file_like(source)
+    )
+
+
+def is_rewindable(source: Any) -> bool:
+    """Check whether a stream opened on a source can be rewound and re-read.
+
+    Args:
+        source: The source to check.
+
+    Returns:
+        False for chunk iterables and non-seekable file objects.
+    """
+    if is_chunk_iterable(source):
+        return False
+    if is_file_like(source):
+        return bool(getattr(source, "seekable", lambda: False)())
+    return True
+
+
+def describe_source(source: Any) -> str:
+    """Describe a source briefly, e.g. for metadata or log messages.
+
+    Args:
+        source: The source to describe.
+
+    Returns:
+        The path for path sources, otherwise a short placeholder.
+    """
+    if isinstance(source, ArchiveMember):
+        return repr(source)
+    if isinstance(source, (str, Path)):
+        return str(source)
+    if is_buffer(source):
+        return "<bytes>"
+    if is_file_like(source):
+        return str(getattr(source, "name", "<stream>"))
+    return "<iterator>"
+
+
+def replay_prefix(prefix: bytes, stream: BinaryIO) -> BinaryIO:
+    """Chain already consumed bytes back in front of a non-seekable stream.
+
+    Args:
+        prefix: Bytes read from the start of the stream.
+        stream: The stream, positioned just after prefix. It is closed when
+            the returned stream is closed.
+
+    Returns:
+        A binary stream yielding prefix followed by the rest of stream.
+    """
+    rest = iter(lambda: stream.read(_CHUNK_SIZE), b"")
+    return io.BufferedReader(_ChunkStream(chain([prefix], rest), on_close=stream.close))
+
+
+def is_bible_member(name: str) -> bool:
+    """Check whether a zip member name looks like a Bible XML file.
+
+    Args:
+        name: Member name inside an archive.
+
+    Returns:
+        True for '.xml' files outside macOS resource fork folders.
+    """
+    return (
+        name.lower().endswith(".xml")
+        and not name.endswith("/")
+        and not name.startswith("__MACOSX/")
+    )
+
+
+def list_archive_members(archive: Union[str, Path, BinaryIO]) -> List[str]:
+    """List the Bible XML files inside a zip archive.
+
+    Args:
+        archive: Path to, or seekable binary file object of, a zip archive.
+
+    Returns:
+        Member names in archive order.
+
+    Raises:
+        ParseError: If the archive cannot be read.
+    """
+    try:
+        with zipfile.ZipFile(archive) as zf:
+            return [name for name in zf.namelist() if is_bible_member(name)]
+    except (OSError, zipfile.BadZipFile) as e:
+        raise ParseError(f"Failed to read archive {archive}: {e}")
+
+
+def open_source(source: Source) -> BinaryIO:
+    """Open a source as a binary stream of (decompressed) XML.
+
+    Args:
+        source: Path to a plain or compressed file, an ArchiveMember, a
+            binary file-like object, a bytes-like buffer or an iterable of
+            byte chunks. Seekable file objects are read from the start; file
+            objects are not closed when the returned stream is closed.
+
+    Returns:
+        A binary stream; the caller is responsible for closing it.
+
+    Raises:
+        ParseError: If the source cannot be opened or decompressed.
+    """
+    try:
+        if isinstance(source, ArchiveMember):
+            with zipfile.ZipFile(source.archive) as zf:
+                # The member keeps the archive file open until it is closed
+                return cast(BinaryIO, zf.open(source.name))
+
+        if is_file_like(source):
+            raw: io.RawIOBase = _BorrowedStream(source)
+            if raw.seekable():
+                raw.seek(0)
+            return _decompress(io.BufferedReader(raw), owned=False)
+
+        if is_buffer(source):
+            return _decompress(io.BufferedReader(io.BytesIO(cast(bytes, source))), owned=True)
+
+        if isinstance(source, (str, Path)):
+            if not Path(source).is_file():
+                raise ParseError(f"Source is not a valid file: {source}")
+            return _decompress(open(source, "rb"), owned=True)
+
+        if is_chunk_iterable(source):
+            chunks = iter(source)
+            raw = _ChunkStream(chunks, on_close=getattr(chunks, "close", None))
+            return _decompress(io.BufferedReader(raw), owned=True)
+
+        raise ParseError(f"Unsupported source type: {type(source)}")
+
+    except ParseError:
+        raise
+    except Exception as e:
+        raise ParseError(f"Failed to open source: {e}")
+
+
+def _decompress(stream: io.BufferedReader, owned: bool) -> BinaryIO:
+    """Wrap a buffered binary stream in a decompressor chosen by magic bytes.
+
+    Args:
+        stream: Buffered binary stream supporting peek().
+        owned: Whether closing the result should close the stream.
+
+    Returns:
+        The stream itself for plain XML, or a decompressing stream.
+    """
+    magic = stream.peek(_MAGIC_LENGTH)[:_MAGIC_LENGTH]
+
+    try:
+        if magic.startswith(GZIP_MAGIC):
+            return _owning(gzip.GzipFile(fileobj=stream, mode="rb"), stream, owned)
+        if magic.startswith(BZIP2_MAGIC):
+            return _owning(bz2.BZ2File(stream, mode="rb"), stream, owned)
+        if magic.startswith(XZ_MAGIC):
+            return _owning(lzma.LZMAFile(stream, mode="rb"), stream, owned)
+        if magic.startswith(ZIP_MAGIC):
+            return _owning(_open_single_member(stream), stream, owned)
+    except BaseException:
+        if owned:
+            stream.close()
+        raise
+
+    return stream
+
+
+def _open_single_member(stream: Any) -> BinaryIO:
+    """Open the only Bible XML member of a zip archive.
+
+    Args:
+        stream: Seekable binary stream of the archive.
+
+    Returns:
+        A stream of the member's content.
+
+    Raises:
+        ParseError: If the archive holds no Bible file or more than one.
+    """
+    zf = zipfile.ZipFile(stream)
+    members = [name for name in zf.namelist() if is_bible_member(name)]
+    if len(members) != 1:
+        zf.close()
+        raise ParseError(
+            f"Zip archive contains {len(members)} Bible XML files; "
+            "use BibleParser.iter_archive() or ArchiveMember to select one"
+        )
+    member = zf.open(members[0])
+    zf.close()
+    return cast(BinaryIO, member)
+
+
+class _ClosingStream(io.BufferedIOBase):
+    """Decompressing stream that also closes the underlying file."""
+
+    def __init__(self, stream: io.BufferedIOBase, underlying: Any):
+        self._stream = stream
+        self._underlying = underlying
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._stream.read(size)
+
+    def read1(self, size: int = -1) -> bytes:
+        return self._stream.read1(size) if hasattr(self._stream, "read1") else self._stream.read(size)
+
+    def readinto(self, buffer: Any) -> int:
+        return self._stream.readinto(buffer)
+
+    def seekable(self) -> bool:
+        return self._stream.seekable()
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._underlying.close()
+            super().close()
+
+
+def _owning(stream: Any, underlying: Any, owned: bool) -> BinaryIO:
+    """Make closing a decompressing stream close the file it reads from."""
+    return cast(BinaryIO, _ClosingStream(stream, underlying)) if owned else stream
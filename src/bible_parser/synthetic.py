@@ -0,0 +1,490 @@
+"""Deterministic synthetic Bibles for benchmarks and scale tests.
+
+The generated documents follow the layout of real USFX, OSIS and Zefania
+files. By default they have the 66 canonical books with their real chapter
+counts and about 31,000 verses. Output depends only on the options and the
+seed, so two runs produce byte-identical files.
+
+Size (books, chapters, verses, words per verse), footnote and
+cross-reference density, namespaces and milestone markup (OSIS sID/eID,
+USFX <v/>...<ve/>) are configurable. Documents are produced as a stream of
+chunks and written incrementally (optionally compressed), so multi-GB files
+can be generated in constant memory::
+
+    python -m bible_parser.synthetic OSIS big.xml.gz --size 2G --milestones --notes 0.2
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import math
+import random
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, List, Optional, Union
+from xml.sax.saxutils import escape, quoteattr
+
+# Python 3.9+ uses collections.abc, Python 3.8 uses typing
+if sys.version_info >= (3, 9):
+    from collections.abc import Iterator
+else:
+    from typing import Iterator
+
+from bible_parser.errors import ParserUnavailableError
+from bible_parser.parsers.usfx_parser import UsfxParser
+from bible_parser.versification import CANONICAL_BOOK_IDS
+
+FORMATS = ("USFX", "OSIS", "ZEFANIA")
+
+# Chapters per canonical book, in CANONICAL_BOOK_IDS order (1,189 in total)
+CHAPTER_COUNTS = (
+    50, 40, 27, 36, 34, 24, 21, 4, 31, 24, 22, 25, 29, 36, 10, 13, 10, 42, 150, 31,
+    12, 8, 66, 52, 5, 48, 12, 14, 3, 9, 1, 4, 7, 3, 3, 3, 2, 14, 4, 28,
+    16, 24, 21, 28, 16, 16, 13, 6, 6, 4, 4, 5, 3, 6, 4, 3, 1, 13, 5, 5,
+    3, 5, 1, 1, 1, 22,
+)
+
+# OSIS book names, in CANONICAL_BOOK_IDS order
+OSIS_BOOK_IDS = (
+    "Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam", "2Sam",
+    "1Kgs", "2Kgs", "1Chr", "2Chr", "Ezra", "Neh", "Esth", "Job", "Ps", "Prov",
+    "Eccl", "Song", "Isa", "Jer", "Lam", "Ezek", "Dan", "Hos", "Joel", "Amos",
+    "Obad", "Jonah", "Mic", "Nah", "Hab", "Zeph", "Hag", "Zech", "Mal", "Matt",
+    "Mark", "Luke", "John", "Acts", "Rom", "1Cor", "2Cor", "Gal", "Eph", "Phil",
+    "Col", "1Thess", "2Thess", "1Tim", "2Tim", "Titus", "Phlm", "Heb", "Jas", "1Pet",
+    "2Pet", "1John", "2John", "3John", "Jude", "Rev",
+)
+
+# Verses per chapter are drawn uniformly from this range (26 on average,
+# close to the 31,102 verses of the KJV over 1,189 chapters)
+DEFAULT_VERSE_RANGE = (10, 42)
+
+_WORDS = (
+    "and", "the", "of", "unto", "he", "lord", "god", "said", "that", "his",
+    "in", "them", "they", "shall", "all", "for", "which", "was", "him", "with",
+    "people", "land", "house", "king", "israel", "son", "day", "hand", "earth",
+    "heaven", "light", "word", "spirit", "water", "came", "went", "before",
+    "upon", "out", "from", "children", "father", "city", "great", "behold",
+    "mercy", "truth", "peace", "glory", "life", "love", "faith", "grace",
+)
+
+# Characters of XML written per chunk
+_CHUNK_SIZE = 64 * 1024
+
+# Chapters of books beyond the canon (close to the canonical average)
+_EXTRA_BOOK_CHAPTERS = 18
+
+_NAMESPACES = {
+    "USFX": ' xmlns="http://www.bibletechnologies.net/2003/USFX/namespace"',
+    "OSIS": ' xmlns="http://www.bibletechnologies.net/2003/OSIS/namespace"',
+    "ZEFANIA": (
+        ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+        ' xsi:noNamespaceSchemaLocation="zef2005.xsd"'
+    ),
+}
+
+# Suffixes accepted by parse_size()
+_SIZE_UNITS = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+
+
+@dataclass
+class _Spec:
+    """Options of one generated document."""
+
+    books: int
+    chapters: Optional[int]
+    verses: Optional[int]
+    words: int
+    notes: float
+    xrefs: float
+    namespaces: bool
+    milestones: bool
+
+
+class _Book:
+    """Identifiers of one generated book."""
+
+    def __init__(self, index: int):
+        if index < len(CANONICAL_BOOK_IDS):
+            self.usfx_id = CANONICAL_BOOK_IDS[index].upper()
+            self.osis_id = OSIS_BOOK_IDS[index]
+            self.title = UsfxParser.BOOK_NAMES[self.usfx_id]
+            self.chapters = CHAPTER_COUNTS[index]
+        else:
+            # Beyond the canon: synthetic ids that no parser table knows
+            self.usfx_id = f"X{index + 1:02d}"
+            self.osis_id = f"Extra{index + 1}"
+            self.title = f"Extra Book {index + 1}"
+            self.chapters = _EXTRA_BOOK_CHAPTERS
+        self.num = index + 1
+
+
+def generate_bible(
+    format: str = "USFX",
+    books: int = 66,
+    chapters: Optional[int] = None,
+    verses: Optional[int] = None,
+    words: int = 20,
+    notes: float = 0.0,
+    xrefs: float = 0.0,
+    namespaces: bool = True,
+    milestones: bool = False,
+    seed: int = 0,
+) -> Iterator[str]:
+    """Generate a synthetic Bible document as a stream of XML text chunks.
+
+    Verse text only depends on the size options and the seed, so documents
+    that differ in markup options (notes, namespaces, milestones, format)
+    contain the same verses.
+
+    Args:
+        format: 'USFX', 'OSIS' or 'ZEFANIA'.
+        books: Number of books; the first 66 follow the canon.
+        chapters: Chapters per book (defaults to the canonical counts, or
+            18 for books beyond the canon).
+        verses: Verses per chapter (defaults to a seeded value in
+            DEFAULT_VERSE_RANGE for each chapter).
+        words: Words per verse.
+        notes: Probability that a verse carries a footnote (0.0-1.0).
+        xrefs: Probability that a verse carries a cross-reference (0.0-1.0).
+        namespaces: Declare the format's XML namespace on the root element.
+        milestones: Use milestone markup: OSIS verses and chapters with
+            sID/eID, USFX <c/> and <v/>...<ve/>. Zefania has no milestone
+            form and ignores this.
+        seed: Seed for verse lengths, text and note placement.
+
+    Yields:
+        Chunks of the XML document, in order.
+
+    Raises:
+        ParserUnavailableError: If the format is not supported.
+    """
+    format = format.upper()
+    if format not in FORMATS:
+        raise ParserUnavailableError(
+            f"Unsupported format '{format}'. Supported formats: {', '.join(FORMATS)}"
+        )
+
+    spec = _Spec(books, chapters, verses, words, notes, xrefs, namespaces, milestones)
+    writer = {"USFX": _usfx, "OSIS": _osis, "ZEFANIA": _zefania}[format]
+
+    # Separate streams keep the verse text independent of the markup options
+    text_rng = random.Random(seed)
+    markup_rng = random.Random(seed + 1)
+
+    buffer: List[str] = []
+    size = 0
+    for part in writer(spec, text_rng, markup_rng):
+        buffer.append(part)
+        size += len(part)
+        if size >= _CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def bible_string(format: str = "USFX", **options: Any) -> str:
+    """Generate a synthetic Bible document as one string.
+
+    Args:
+        format: 'USFX', 'OSIS' or 'ZEFANIA'.
+        **options: Options of generate_bible().
+
+    Returns:
+        The XML document.
+    """
+    return "".join(generate_bible(format, **options))
+
+
+def write_bible(path: Union[str, Path], format: str = "USFX", **options: Any) -> Path:
+    """Write a synthetic Bible document to a file, streaming.
+
+    Files ending in '.gz', '.bz2' or '.xz' are compressed while writing.
+
+    Args:
+        path: Output file path.
+        format: 'USFX', 'OSIS' or 'ZEFANIA'.
+        **options: Options of generate_bible().
+
+    Returns:
+        The output path.
+    """
+    path = Path(path)
+    opener = _OPENERS.get(path.suffix.lower(), open)
+    with opener(path, "wt", encoding="utf-8") as f:
+        for chunk in generate_bible(format, **options):
+            f.write(chunk)
+    return path
+
+
+def books_for_size(size: int, format: str = "USFX", **options: Any) -> int:
+    """Estimate how many books make a document of roughly the given size.
+
+    The estimate scales the size of a generated sample, so it accounts for
+    the format, words per verse, note density and markup options.
+
+    Args:
+        size: Target size in bytes (uncompressed).
+        format: 'USFX', 'OSIS' or 'ZEFANIA'.
+        **options: Options of generate_bible() other than books.
+
+    Returns:
+        Number of books (at least 1).
+    """
+    options.pop("books", None)
+    sample_books = 66
+    sample = sum(
+        len(chunk.encode("utf-8"))
+        for chunk in generate_bible(format, books=sample_books, **options)
+    )
+    return max(1, math.ceil(size / (sample / sample_books)))
+
+
+def parse_size(text: str) -> int:
+    """Parse a size such as '512K', '20M' or '2G' into bytes.
+
+    Args:
+        text: Number of bytes, optionally followed by K, M or G (powers of 1024).
+
+    Returns:
+        Size in bytes.
+
+    Raises:
+        ValueError: If the size cannot be parsed.
+    """
+    value = text.strip().upper().rstrip("B")
+    multiplier = 1
+    if value and value[-1] in _SIZE_UNITS:
+        multiplier = _SIZE_UNITS[value[-1]]
+        value = value[:-1]
+    try:
+        size = int(float(value) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid size: {text!r}") from None
+    if size <= 0:
+        raise ValueError(f"Invalid size: {text!r}")
+    return size
+
+
+def _shape(rng: random.Random, book: _Book, spec: _Spec) -> Iterator[int]:
+    """Yield the verse count of each chapter of a book."""
+    for _ in range(spec.chapters or book.chapters):
+        yield spec.verses or rng.randint(*DEFAULT_VERSE_RANGE)
+
+
+def _words(rng: random.Random, count: int) -> List[str]:
+    """Draw the words of one verse, capitalized and with a final period."""
+    words = [rng.choice(_WORDS) for _ in range(count)]
+    if words:
+        words[0] = words[0].capitalize()
+        words[-1] += "."
+    return words
+
+
+def _annotated(
+    text_rng: random.Random,
+    markup_rng: random.Random,
+    spec: _Spec,
+    note: Any,
+    xref: Any,
+) -> str:
+    """Build verse text with footnote and cross-reference markup.
+
+    Args:
+        text_rng: Generator for the verse words.
+        markup_rng: Generator for note placement.
+        spec: Document options.
+        note: Function returning the markup of a footnote.
+        xref: Function returning the markup of a cross-reference.
+
+    Returns:
+        The escaped verse content.
+    """
+    words = [escape(word) for word in _words(text_rng, spec.words)]
+    for density, markup in ((spec.notes, note), (spec.xrefs, xref)):
+        if density and markup_rng.random() < density:
+            # Anywhere after the first word, so text often follows the markup
+            position = markup_rng.randint(1, len(words)) if words else 0
+            words.insert(position, markup(markup_rng))
+    return " ".join(words)
+
+
+def _note_text(rng: random.Random) -> str:
+    """Build the text of a footnote."""
+    return escape("Or, " + " ".join(rng.choice(_WORDS) for _ in range(4)))
+
+
+def _target(rng: random.Random, spec: _Spec) -> _Book:
+    """Pick the book a cross-reference points to."""
+    return _Book(rng.randrange(min(spec.books, len(CANONICAL_BOOK_IDS))))
+
+
+def _usfx(spec: _Spec, text_rng: random.Random, markup_rng: random.Random) -> Iterator[str]:
+    """Yield the parts of a USFX document."""
+    def note(rng: random.Random) -> str:
+        return f'<f caller="+"><ft>{_note_text(rng)}</ft></f>'
+
+    def xref(rng: random.Random) -> str:
+        return f'<x caller="-"><xt>{escape(_target(rng, spec).title)} 1:1</xt></x>'
+
+    namespace = _NAMESPACES["USFX"] if spec.namespaces else ""
+    yield f'<?xml version="1.0" encoding="utf-8"?>\n<usfx{namespace}>\n'
+    for index in range(spec.books):
+        book = _Book(index)
+        yield f"  <book id={quoteattr(book.usfx_id)}>\n"
+        for chapter_num, verse_count in enumerate(_shape(text_rng, book, spec), 1):
+            if spec.milestones:
+                yield f'    <c id="{chapter_num}"/>\n'
+            else:
+                yield f'    <c id="{chapter_num}">\n'
+            for verse_num in range(1, verse_count + 1):
+                text = _annotated(text_rng, markup_rng, spec, note, xref)
+                if spec.milestones:
+                    yield f'      <v id="{verse_num}"/>{text}<ve/>\n'
+                else:
+                    yield f'      <v id="{verse_num}">{text}</v>\n'
+            if not spec.milestones:
+                yield "    </c>\n"
+        yield "  </book>\n"
+    yield "</usfx>\n"
+
+
+def _osis(spec: _Spec, text_rng: random.Random, markup_rng: random.Random) -> Iterator[str]:
+    """Yield the parts of an OSIS document."""
+    def note(rng: random.Random) -> str:
+        return f'<note type="x-footnote">{_note_text(rng)}</note>'
+
+    def xref(rng: random.Random) -> str:
+        target = _target(rng, spec)
+        return (
+            f'<note type="crossReference"><reference osisRef="{target.osis_id}.1.1">'
+            f"{escape(target.title)} 1:1</reference></note>"
+        )
+
+    namespace = _NAMESPACES["OSIS"] if spec.namespaces else ""
+    yield (
+        f'<?xml version="1.0" encoding="utf-8"?>\n<osis{namespace}>\n'
+        '  <osisText osisIDWork="Synthetic">\n'
+    )
+    for index in range(spec.books):
+        book = _Book(index)
+        yield f'    <div type="book" osisID={quoteattr(book.osis_id)}>\n'
+        yield f"      <title>{escape(book.title)}</title>\n"
+        for chapter_num, verse_count in enumerate(_shape(text_rng, book, spec), 1):
+            chapter_id = f"{book.osis_id}.{chapter_num}"
+            if spec.milestones:
+                yield f'      <chapter sID="{chapter_id}" osisID="{chapter_id}"/>\n'
+            else:
+                yield f'      <chapter osisID="{chapter_id}">\n'
+            for verse_num in range(1, verse_count + 1):
+                verse_id = f"{chapter_id}.{verse_num}"
+                text = _annotated(text_rng, markup_rng, spec, note, xref)
+                if spec.milestones:
+                    yield (
+                        f'        <verse sID="{verse_id}" osisID="{verse_id}"/>'
+                        f'{text}<verse eID="{verse_id}"/>\n'
+                    )
+                else:
+                    yield f'        <verse osisID="{verse_id}">{text}</verse>\n'
+            if spec.milestones:
+                yield f'      <chapter eID="{chapter_id}"/>\n'
+            else:
+                yield "      </chapter>\n"
+        yield "    </div>\n"
+    yield "  </osisText>\n</osis>\n"
+
+
+def _zefania(spec: _Spec, text_rng: random.Random, markup_rng: random.Random) -> Iterator[str]:
+    """Yield the parts of a Zefania document."""
+    def note(rng: random.Random) -> str:
+        return f'<NOTE type="x-studynote">{_note_text(rng)}</NOTE>'
+
+    def xref(rng: random.Random) -> str:
+        target = _target(rng, spec)
+        return f'<XREF fscope="{target.num};1;1"/>'
+
+    namespace = _NAMESPACES["ZEFANIA"] if spec.namespaces else ""
+    yield (
+        f'<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<XMLBIBLE biblename="Synthetic"{namespace}>\n'
+    )
+    for index in range(spec.books):
+        book = _Book(index)
+        yield (
+            f'  <BIBLEBOOK bnumber="{book.num}" bname={quoteattr(book.title)} '
+            f"bsname={quoteattr(book.osis_id)}>\n"
+        )
+        for chapter_num, verse_count in enumerate(_shape(text_rng, book, spec), 1):
+            yield f'    <CHAPTER cnumber="{chapter_num}">\n'
+            for verse_num in range(1, verse_count + 1):
+                text = _annotated(text_rng, markup_rng, spec, note, xref)
+                yield f'      <VERS vnumber="{verse_num}">{text}</VERS>\n'
+            yield "    </CHAPTER>\n"
+        yield "  </BIBLEBOOK>\n"
+    yield "</XMLBIBLE>\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Write a synthetic Bible from the command line.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]).
+
+    Returns:
+        Exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m bible_parser.synthetic",
+        description="Write a deterministic synthetic Bible.",
+    )
+    parser.add_argument("format", type=str.upper, choices=FORMATS, help="document format")
+    parser.add_argument("output", help="output file ('.gz', '.bz2' and '.xz' are compressed)")
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument("--books", type=int, default=66, help="number of books (default: 66)")
+    size.add_argument(
+        "--size", type=parse_size,
+        help="approximate uncompressed size such as 500M or 2G (sets the number of books)",
+    )
+    parser.add_argument("--chapters", type=int, help="chapters per book (default: canonical)")
+    parser.add_argument("--verses", type=int, help="verses per chapter (default: varied)")
+    parser.add_argument("--words", type=int, default=20, help="words per verse (default: 20)")
+    parser.add_argument("--notes", type=float, default=0.0, help="footnotes per verse")
+    parser.add_argument("--xrefs", type=float, default=0.0, help="cross-references per verse")
+    parser.add_argument(
+        "--no-namespaces", dest="namespaces", action="store_false",
+        help="omit the XML namespace declarations",
+    )
+    parser.add_argument(
+        "--milestones", action="store_true",
+        help="use milestone markup (OSIS sID/eID, USFX <v/>...<ve/>)",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    args = parser.parse_args(argv)
+
+    options = {
+        "chapters": args.chapters,
+        "verses": args.verses,
+        "words": args.words,
+        "notes": args.notes,
+        "xrefs": args.xrefs,
+        "namespaces": args.namespaces,
+        "milestones": args.milestones,
+        "seed": args.seed,
+    }
+    books = args.books
+    if args.size is not None:
+        books = books_for_size(args.size, args.format, **options)
+
+    path = write_bible(args.output, args.format, books=books, **options)
+    print(f"Wrote {path} ({books} books, {path.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
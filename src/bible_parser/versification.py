@@ -0,0 +1,264 @@
+"""Versification schemes and fast reference mapping between them.
+
+Bible sources number some passages differently. The best known cases are:
+
+- Psalms 9-147: the Greek (LXX) and Latin (Vulgate) traditions join Psalms 9/10
+  and 114/115 and split Psalms 116 and 147, shifting most Psalm numbers by one.
+- Joel 2:28-3:21 (KJV) is Joel 3:1-4:21 in Hebrew and Greek Bibles.
+- Malachi 4:1-6 (KJV) is Malachi 3:19-24 in Hebrew and Greek Bibles.
+
+Mapping rules are declared relative to the KJV scheme and compiled once into
+dictionaries, so mapping any verse between two schemes takes at most two
+constant-time lookups. Psalm superscriptions that some traditions count as
+verse 1 are not modelled; verse numbers inside a Psalm follow KJV counting.
+
+Book identifiers from different formats ('ps', 'psa', 'Ps', 'psalms') can be
+normalized with normalize_book_id() before comparing references.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bible_parser.errors import VersificationError
+
+# A reference as (book_id, chapter_num, verse_num)
+Reference = Tuple[str, int, int]
+
+KJV = "KJV"
+HEBREW = "HEBREW"
+LXX = "LXX"
+VULGATE = "VULGATE"
+
+SCHEMES = (KJV, HEBREW, LXX, VULGATE)
+
+# Canonical (USFX-style) book ids in canon order
+CANONICAL_BOOK_IDS = (
+    "gen", "exo", "lev", "num", "deu", "jos", "jdg", "rut", "1sa", "2sa",
+    "1ki", "2ki", "1ch", "2ch", "ezr", "neh", "est", "job", "psa", "pro",
+    "ecc", "sng", "isa", "jer", "lam", "ezk", "dan", "hos", "jol", "amo",
+    "oba", "jon", "mic", "nam", "hab", "zep", "hag", "zec", "mal", "mat",
+    "mrk", "luk", "jhn", "act", "rom", "1co", "2co", "gal", "eph", "php",
+    "col", "1th", "2th", "1ti", "2ti", "tit", "phm", "heb", "jas", "1pe",
+    "2pe", "1jn", "2jn", "3jn", "jud", "rev",
+)
+
+# OSIS and common Zefania short names that differ from the canonical ids
+BOOK_ID_ALIASES: Dict[str, str] = {
+    "exod": "exo", "deut": "deu", "josh": "jos", "judg": "jdg", "ruth": "rut",
+    "1sam": "1sa", "2sam": "2sa", "1kgs": "1ki", "2kgs": "2ki", "1chr": "1ch",
+    "2chr": "2ch", "ezra": "ezr", "esth": "est", "ps": "psa", "psalm": "psa",
+    "psalms": "psa", "prov": "pro", "eccl": "ecc", "song": "sng", "ezek": "ezk",
+    "joel": "jol", "amos": "amo", "obad": "oba", "jonah": "jon", "nah": "nam",
+    "zeph": "zep", "zech": "zec", "matt": "mat", "mark": "mrk", "luke": "luk",
+    "john": "jhn", "acts": "act", "1cor": "1co", "2cor": "2co", "phil": "php",
+    "1thess": "1th", "2thess": "2th", "1tim": "1ti", "2tim": "2ti",
+    "titus": "tit", "phlm": "phm", "1pet": "1pe", "2pet": "2pe", "1john": "1jn",
+    "2john": "2jn", "3john": "3jn", "jude": "jud",
+}
+
+# Bounded rules KJV -> scheme: (book, chapter, first verse, last verse,
+# target chapter, target first verse)
+_VerseRule = Tuple[str, int, int, int, int, int]
+# Whole-chapter rules KJV -> scheme: (book, chapter, target chapter)
+_ChapterRule = Tuple[str, int, int]
+
+_JOEL_MALACHI_RULES: List[_VerseRule] = [
+    ("jol", 2, 28, 32, 3, 1),
+    ("jol", 3, 1, 21, 4, 1),
+    ("mal", 4, 1, 6, 3, 19),
+]
+
+_GREEK_PSALM_RULES: List[_VerseRule] = [
+    ("psa", 10, 1, 18, 9, 21),
+    ("psa", 114, 1, 8, 113, 1),
+    ("psa", 115, 1, 18, 113, 9),
+    ("psa", 116, 1, 9, 114, 1),
+    ("psa", 116, 10, 19, 115, 1),
+    ("psa", 147, 1, 11, 146, 1),
+    ("psa", 147, 12, 20, 147, 1),
+]
+
+_GREEK_PSALM_CHAPTERS: List[_ChapterRule] = [
+    ("psa", chapter, chapter - 1)
+    for chapter in list(range(11, 114)) + list(range(117, 147))
+]
+
+_RULES: Dict[str, Tuple[List[_VerseRule], List[_ChapterRule]]] = {
+    KJV: ([], []),
+    HEBREW: (_JOEL_MALACHI_RULES, []),
+    LXX: (_GREEK_PSALM_RULES + _JOEL_MALACHI_RULES, _GREEK_PSALM_CHAPTERS),
+    VULGATE: (_GREEK_PSALM_RULES, _GREEK_PSALM_CHAPTERS),
+}
+
+
+def normalize_book_id(book_id: str) -> str:
+    """Normalize a book identifier from any supported format to a canonical id.
+
+    Args:
+        book_id: Book identifier (e.g., 'Ps', 'psa', 'Matt', '1sam').
+
+    Returns:
+        Canonical lowercase id (e.g., 'psa', 'mat', '1sa'), or the lowercased
+        input if the book is not recognized.
+    """
+    key = book_id.lower().replace(" ", "")
+    return BOOK_ID_ALIASES.get(key, key)
+
+
+def normalize_scheme(scheme: Optional[str]) -> str:
+    """Validate a versification scheme name.
+
+    Args:
+        scheme: Scheme name (case-insensitive), or None for KJV.
+
+    Returns:
+        The upper-case scheme name.
+
+    Raises:
+        VersificationError: If the scheme is not supported.
+    """
+    name = (scheme or KJV).upper()
+    if name not in _RULES:
+        raise VersificationError(
+            f"Unknown versification scheme '{scheme}'. "
+            f"Supported schemes: {', '.join(SCHEMES)}"
+        )
+    return name
+
+
+class _CompiledScheme:
+    """Lookup tables between KJV and one scheme, in both directions."""
+
+    def __init__(self, scheme: str):
+        verse_rules, chapter_rules = _RULES[scheme]
+
+        self.to_scheme_verses: Dict[Tuple[str, int, int], Tuple[int, int]] = {}
+        self.from_scheme_verses: Dict[Tuple[str, int, int], Tuple[int, int]] = {}
+        self.to_scheme_chapters: Dict[Tuple[str, int], int] = {}
+        self.from_scheme_chapters: Dict[Tuple[str, int], int] = {}
+
+        for book, chapter, first, last, target_chapter, target_first in verse_rules:
+            for offset in range(last - first + 1):
+                source = (chapter, first + offset)
+                target = (target_chapter, target_first + offset)
+                self.to_scheme_verses[(book, *source)] = target
+                self.from_scheme_verses[(book, *target)] = source
+
+        for book, chapter, target_chapter in chapter_rules:
+            self.to_scheme_chapters[(book, chapter)] = target_chapter
+            self.from_scheme_chapters[(book, target_chapter)] = chapter
+
+    @staticmethod
+    def _lookup(
+        verses: Dict[Tuple[str, int, int], Tuple[int, int]],
+        chapters: Dict[Tuple[str, int], int],
+        book: str,
+        chapter_num: int,
+        verse_num: int,
+    ) -> Tuple[int, int]:
+        """Resolve a verse through the verse table, then the chapter table."""
+        mapped = verses.get((book, chapter_num, verse_num))
+        if mapped is not None:
+            return mapped
+        target_chapter = chapters.get((book, chapter_num))
+        if target_chapter is not None:
+            return target_chapter, verse_num
+        return chapter_num, verse_num
+
+    def to_scheme(self, book: str, chapter_num: int, verse_num: int) -> Tuple[int, int]:
+        """Map a KJV chapter/verse into this scheme."""
+        return self._lookup(
+            self.to_scheme_verses, self.to_scheme_chapters, book, chapter_num, verse_num
+        )
+
+    def from_scheme(self, book: str, chapter_num: int, verse_num: int) -> Tuple[int, int]:
+        """Map a chapter/verse in this scheme back to KJV."""
+        return self._lookup(
+            self.from_scheme_verses, self.from_scheme_chapters, book, chapter_num, verse_num
+        )
+
+
+@lru_cache(maxsize=None)
+def _compiled(scheme: str) -> _CompiledScheme:
+    """Compile (once) the lookup tables for a scheme."""
+    return _CompiledScheme(scheme)
+
+
+class VersificationMapper:
+    """Maps verse references from one versification scheme to another.
+
+    Example:
+        >>> mapper = VersificationMapper('KJV', 'LXX')
+        >>> mapper.map('psa', 23, 1)
+        ('psa', 22, 1)
+        >>> VersificationMapper('KJV', 'HEBREW').map('mal', 4, 5)
+        ('mal', 3, 23)
+    """
+
+    def __init__(self, source: str, target: str):
+        """Initialize the mapper.
+
+        Args:
+            source: Scheme references are given in (e.g., 'KJV').
+            target: Scheme references are mapped into (e.g., 'LXX').
+
+        Raises:
+            VersificationError: If either scheme is not supported.
+        """
+        self.source = normalize_scheme(source)
+        self.target = normalize_scheme(target)
+        self._source_tables = _compiled(self.source)
+        self._target_tables = _compiled(self.target)
+        self.is_identity = self.source == self.target
+
+    def map(self, book_id: str, chapter_num: int, verse_num: int) -> Reference:
+        """Map one reference.
+
+        Args:
+            book_id: Book identifier in any supported format; it is returned
+                unchanged.
+            chapter_num: Chapter number in the source scheme.
+            verse_num: Verse number in the source scheme.
+
+        Returns:
+            Tuple of (book_id, chapter_num, verse_num) in the target scheme.
+        """
+        if self.is_identity:
+            return book_id, chapter_num, verse_num
+
+        book = normalize_book_id(book_id)
+        chapter_num, verse_num = self._source_tables.from_scheme(book, chapter_num, verse_num)
+        chapter_num, verse_num = self._target_tables.to_scheme(book, chapter_num, verse_num)
+        return book_id, chapter_num, verse_num
+
+    def map_many(self, references: Iterable[Reference]) -> List[Reference]:
+        """Map a batch of references.
+
+        Args:
+            references: Iterable of (book_id, chapter_num, verse_num) tuples.
+
+        Returns:
+            List of mapped references, in input order.
+        """
+        if self.is_identity:
+            return list(references)
+        return [self.map(*reference) for reference in references]
+
+
+def get_mapper(source: Optional[str], target: Optional[str]) -> VersificationMapper:
+    """Get a shared mapper between two schemes.
+
+    Args:
+        source: Source scheme name, or None for KJV.
+        target: Target scheme name, or None for KJV.
+
+    Returns:
+        A cached VersificationMapper instance.
+    """
+    return _get_mapper(normalize_scheme(source), normalize_scheme(target))
+
+
+@lru_cache(maxsize=None)
+def _get_mapper(source: str, target: str) -> VersificationMapper:
+    """Build and cache a mapper for normalized scheme names."""
+    return VersificationMapper(source, target)
@@ -0,0 +1,97 @@
+"""Tests for the benchmark suite."""
+
+import json
+
+from bible_parser.benchmarks import (
+    BenchmarkResult,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from bible_parser.benchmarks.__main__ import main
+
+
+SMALL = {"books": 2, "chapters": 2, "verses": 3, "repeat": 1, "lookups": 5, "overhead_calls": 10}
+
+
+class TestBenchmarks:
+    """Tests for running and comparing benchmarks."""
+
+    def test_run_covers_every_benchmark(self, tmp_path) -> None:
+        """Test parser benchmarks run per format and lookups once."""
+        data = run_benchmarks(formats=["USFX", "OSIS"], workdir=tmp_path, **SMALL)
+
+        keys = [BenchmarkResult.from_dict(result).key for result in data["results"]]
+
+        assert keys == [
+            "parse_books[USFX]", "parse_verses[USFX]", "initialize[USFX]",
+            "parse_books[OSIS]", "parse_verses[OSIS]", "initialize[OSIS]",
+            "get_verse", "get_verse_overhead", "get_verses", "search_verses",
+            "reference_parse", "initialize[USFX,clustered]", "get_verse[clustered]",
+            "get_verse_overhead[clustered]", "get_verses[clustered]",
+            "search_verses[clustered]", "reference_parse[clustered]",
+        ]
+        assert data["results"][0]["operations"] == 12
+        assert data["meta"]["options"]["books"] == 2
+
+    def test_lookup_pages(self, tmp_path) -> None:
+        """Test page reads per lookup are measured for each schema."""
+        data = run_benchmarks(formats=["USFX"], workdir=tmp_path, **SMALL)
+
+        pages = {
+            result.key: result.pages
+            for result in map(BenchmarkResult.from_dict, data["results"])
+            if result.name == "get_verse"
+        }
+
+        if pages["get_verse"] is not None:  # /proc/self/io is available
+            assert 0 < pages["get_verse[clustered]"] < pages["get_verse"]
+
+    def test_results_round_trip(self, tmp_path) -> None:
+        """Test results survive a save/load cycle."""
+        data = {"version": 1, "meta": {}, "results": [
+            BenchmarkResult("get_verse", None, 10, [0.5, 0.25]).to_dict()
+        ]}
+        save_results(data, tmp_path / "results.json")
+
+        loaded = load_results(tmp_path / "results.json")
+
+        assert loaded[0].key == "get_verse"
+        assert loaded[0].median == 0.375
+        assert BenchmarkResult("get_verse", None, 1, [1.0], variant="clustered").key == (
+            "get_verse[clustered]"
+        )
+
+    def test_compare_flags_regressions(self) -> None:
+        """Test slowdowns beyond the threshold are regressions, per operation."""
+        baseline = [BenchmarkResult("get_verse", None, 100, [1.0]),
+                    BenchmarkResult("parse_books", "USFX", 10, [1.0])]
+        current = [BenchmarkResult("get_verse", None, 200, [2.1]),
+                   BenchmarkResult("parse_books", "USFX", 10, [1.05]),
+                   BenchmarkResult("search_verses", None, 10, [1.0])]
+
+        comparisons = compare_results(baseline, current, threshold=0.10)
+
+        assert [(c.key, c.regressed) for c in comparisons] == [
+            ("get_verse", False), ("parse_books[USFX]", False)
+        ]
+        assert compare_results(baseline, current, threshold=0.01)[1].regressed
+
+    def test_cli_run_and_compare(self, tmp_path, capsys) -> None:
+        """Test the CLI writes JSON and exits non-zero on regressions."""
+        output = tmp_path / "run.json"
+        assert main([
+            "run", "--formats", "zefania", "--books", "1", "--chapters", "1",
+            "--verses", "2", "--repeat", "1", "--lookups", "2", "--schemas", "standard",
+            "--output", str(output),
+        ]) == 0
+        assert "initialize[ZEFANIA]" in capsys.readouterr().out
+
+        slower = json.loads(output.read_text())
+        for result in slower["results"]:
+            result["timings"] = [t * 10 for t in result["timings"]]
+        (tmp_path / "slower.json").write_text(json.dumps(slower))
+
+        assert main(["compare", str(output), str(output)]) == 0
+        assert main(["compare", str(output), str(tmp_path / "slower.json")]) == 1
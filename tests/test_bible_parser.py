@@ -78,3 +78,71 @@ class TestBibleParser:
         assert len(verses) == 2
         assert verses[0].text == "Verse 1"
         assert verses[1].text == "Verse 2"
+
+    def test_format_detection_skips_long_prologue(self) -> None:
+        """Test detection looks past long comments in the prologue."""
+        comment = "<!-- " + "<osis> " * 2000 + "-->"
+        xml = f'<?xml version="1.0"?>{comment}<XMLBIBLE><BIBLEBOOK bnumber="1"/></XMLBIBLE>'
+        parser = BibleParser.from_string(xml)
+
+        assert parser.format == "ZEFANIA"
+
+    def test_format_detection_unknown_root(self) -> None:
+        """Test unknown documents raise FormatDetectionError."""
+        with pytest.raises(FormatDetectionError):
+            BibleParser.from_string("<test><item/></test>")
+
+    def test_format_detection_utf16_file(self, tmp_path) -> None:
+        """Test BOM-marked UTF-16 files are detected and parsed."""
+        xml = '<?xml version="1.0" encoding="UTF-16"?><usfx><book id="GEN"><c id="1"/><v id="1">Ἐν ἀρχῇ</v></book></usfx>'
+        path = tmp_path / "bible.xml"
+        path.write_bytes(xml.encode("utf-16"))
+
+        parser = BibleParser(str(path))
+        verses = list(parser.verses)
+
+        assert parser.format == "USFX"
+        assert verses[0].text == "Ἐν ἀρχῇ"
+
+    def test_format_detection_utf8_bom_file(self, tmp_path) -> None:
+        """Test UTF-8 files with a BOM are detected."""
+        path = tmp_path / "bible.xml"
+        path.write_bytes(b"\xef\xbb\xbf<osis><osisText/></osis>")
+
+        with BibleParser(path) as parser:
+            assert parser.format == "OSIS"
+
+    def test_context_manager_closes_detection_handle(self, tmp_path) -> None:
+        """Test leaving the with block closes an unparsed detection handle."""
+        path = tmp_path / "bible.xml"
+        path.write_text("<usfx><book id='gen'><c id='1'/><v id='1'>Verse 1</v></book></usfx>")
+
+        with BibleParser(path) as parser:
+            handle = parser._parser._stream
+            assert not handle.closed
+
+        assert handle.closed
+        assert len(list(parser.verses)) == 1
+
+    def test_format_detection_rejects_entity_declarations(self) -> None:
+        """Test entity declarations are refused before they can be expanded."""
+        xml = (
+            '<?xml version="1.0"?><!DOCTYPE XMLBIBLE [<!ENTITY a "aaaaaaaaaa">'
+            '<!ENTITY b "&a;&a;&a;&a;&a;&a;&a;&a;&a;&a;">]><XMLBIBLE>&b;</XMLBIBLE>'
+        )
+
+        with pytest.raises(FormatDetectionError):
+            BibleParser.from_string(xml)
+
+    def test_detection_handle_reused_for_parsing(self, tmp_path) -> None:
+        """Test the detection handle is handed to the first parse and closed."""
+        path = tmp_path / "bible.xml"
+        path.write_text("<usfx><book id='gen'><c id='1'/><v id='1'>Verse 1</v></book></usfx>")
+
+        parser = BibleParser(path)
+        handle = parser._parser._stream
+
+        assert handle is not None and not handle.closed
+        assert len(list(parser.verses)) == 1
+        assert handle.closed
+        assert len(list(parser.verses)) == 1
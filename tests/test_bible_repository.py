@@ -0,0 +1,483 @@
+"""Tests for BibleRepository."""
+
+import sqlite3
+
+import pytest
+from bible_parser import BibleParserException, BibleRepository
+from bible_parser.concordance import tokenize
+
+
+SAMPLE_USFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<usfx>
+  <book id="GEN">
+    <c id="1">
+      <v id="1">In the beginning God created the heaven and the earth.</v>
+      <v id="2">And the earth was without form, and void.</v>
+      <v id="3">And God said, Let there be light: and there was light.</v>
+    </c>
+    <c id="2">
+      <v id="1">Thus the heavens and the earth were finished.</v>
+    </c>
+  </book>
+  <book id="EXO">
+    <c id="1">
+      <v id="1">Now these are the names of the children of Israel.</v>
+    </c>
+  </book>
+</usfx>
+"""
+
+UPDATED_USFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<usfx>
+  <book id="GEN">
+    <c id="1">
+      <v id="1">In the beginning God created the heaven and the earth.</v>
+      <v id="2">And the earth was formless and empty.</v>
+      <v id="4">And God saw the light, that it was good.</v>
+    </c>
+    <c id="2">
+      <v id="1">Thus the heavens and the earth were finished.</v>
+    </c>
+  </book>
+  <book id="LEV">
+    <c id="1">
+      <v id="1">And the LORD called unto Moses.</v>
+    </c>
+  </book>
+</usfx>
+"""
+
+
+@pytest.fixture(params=BibleRepository.SCHEMAS)
+def repo(request, tmp_path):
+    """Repository initialized from the sample USFX document, in each schema."""
+    with BibleRepository(xml_string=SAMPLE_USFX_XML, schema=request.param) as repository:
+        repository.initialize(str(tmp_path / "bible.db"))
+        yield repository
+
+
+def create_text_keyed_database(path) -> None:
+    """Write the sample document in the layout that stored text book ids in verses."""
+    db = sqlite3.connect(str(path))
+    db.executescript("""
+        CREATE TABLE books (id TEXT PRIMARY KEY, num INTEGER, title TEXT, digest TEXT);
+        CREATE TABLE verses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, book_id TEXT, chapter_num INTEGER,
+            verse_num INTEGER, text TEXT, FOREIGN KEY (book_id) REFERENCES books (id)
+        );
+        CREATE INDEX idx_verses_lookup ON verses (book_id, chapter_num, verse_num);
+        CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+        CREATE VIRTUAL TABLE verses_fts USING fts5(
+            book_id, chapter_num, verse_num, text, content=verses, content_rowid=id
+        );
+        CREATE TRIGGER verses_ai AFTER INSERT ON verses BEGIN
+            INSERT INTO verses_fts(rowid, book_id, chapter_num, verse_num, text)
+            VALUES (new.id, new.book_id, new.chapter_num, new.verse_num, new.text);
+        END;
+        INSERT INTO books (id, num, title) VALUES ('gen', 1, 'Genesis'), ('exo', 2, 'Exodus');
+        INSERT INTO verses (book_id, chapter_num, verse_num, text) VALUES
+            ('gen', 1, 1, 'In the beginning God created the heaven and the earth.'),
+            ('gen', 1, 2, 'And the earth was without form, and void.'),
+            ('gen', 1, 3, 'And God said, Let there be light: and there was light.'),
+            ('gen', 2, 1, 'Thus the heavens and the earth were finished.'),
+            ('exo', 1, 1, 'Now these are the names of the children of Israel.');
+    """)
+    db.commit()
+    db.close()
+
+
+def fts_is_consistent(repository: BibleRepository) -> bool:
+    """Run the FTS5 integrity check against the content table."""
+    try:
+        repository._db.execute(
+            "INSERT INTO verses_fts(verses_fts, rank) VALUES ('integrity-check', 1)"
+        )
+    except Exception:
+        return False
+    return True
+
+
+class TestBibleRepository:
+    """Tests for BibleRepository queries."""
+
+    def test_get_books(self, repo) -> None:
+        """Test books are returned in order."""
+        assert [book.id for book in repo.get_books()] == ["gen", "exo"]
+
+    def test_get_verses_and_verse(self, repo) -> None:
+        """Test chapter and single-verse lookups."""
+        assert [verse.num for verse in repo.get_verses("gen", 1)] == [1, 2, 3]
+        assert repo.get_verse("gen", 2, 1).text.startswith("Thus the heavens")
+        assert repo.get_verse("gen", 9, 9) is None
+
+    def test_get_verses_bulk(self, repo) -> None:
+        """Test scattered references across books come back in input order."""
+        references = [("exo", 1, 1), ("gen", 9, 9), ("gen", 1, 3), ("lev", 1, 1), ("exo", 1, 1)]
+
+        verses = repo.get_verses_bulk(references)
+
+        assert verses == [repo.get_verse(*reference) for reference in references]
+        assert [verse and (verse.book_id, verse.num) for verse in verses] == [
+            ("exo", 1), None, ("gen", 3), None, ("exo", 1)
+        ]
+        assert repo.get_verses_bulk([]) == []
+
+    def test_get_verses_bulk_in_chunks(self, repo) -> None:
+        """Test references beyond one query's chunk are fetched by further queries."""
+        repo.BULK_CHUNK_SIZE = 2
+        references = [("gen", 1, 1), ("gen", 1, 2), ("gen", 1, 3), ("gen", 2, 1), ("gen", 3, 1)]
+
+        verses = repo.get_verses_bulk(references)
+
+        assert [verse and (verse.chapter_num, verse.num) for verse in verses] == [
+            (1, 1), (1, 2), (1, 3), (2, 1), None
+        ]
+
+    def test_get_chapter_count(self, repo) -> None:
+        """Test chapter counting."""
+        assert repo.get_chapter_count("gen") == 2
+        assert repo.get_chapter_count("rev") == 0
+
+    def test_navigation_metadata(self, repo) -> None:
+        """Test verse counts, outlines and reading-order spans."""
+        assert repo.get_verse_count("gen", 1) == 3
+        assert repo.get_verse_count("gen") == 4
+        assert repo.get_verse_count("gen", 9) == 0
+        assert repo.get_verse_count("rev") == 0
+        assert repo.get_book_outline("gen") == {1: 3, 2: 1}
+        assert repo.get_book_outline("rev") == {}
+        assert repo.get_chapter_span("gen", 2) == (4, 4)
+        assert repo.get_chapter_span("exo", 1) == (5, 5)
+        assert repo.get_chapter_span("exo", 2) is None
+
+    def test_search_verses(self, repo) -> None:
+        """Test full-text search."""
+        results = repo.search_verses("light")
+
+        assert [(verse.chapter_num, verse.num) for verse in results] == [(1, 3)]
+
+    def test_pipelined_load_matches_serial(self, repo, tmp_path) -> None:
+        """Test the background parser produces the same database as serial loading."""
+        with BibleRepository(xml_string=SAMPLE_USFX_XML, pipeline=False) as serial:
+            serial.initialize(str(tmp_path / "serial.db"))
+
+            assert serial.get_book_digests() == repo.get_book_digests()
+            assert [book.id for book in serial.get_books()] == ["gen", "exo"]
+
+    def test_parse_error_rolls_back(self, tmp_path) -> None:
+        """Test a parse error in the background thread aborts the load."""
+        broken = SAMPLE_USFX_XML.replace("</usfx>", "<book id='LEV'><c id='1'>")
+
+        with BibleRepository(xml_string=broken) as repository:
+            with pytest.raises(Exception, match="Failed to populate database"):
+                repository.initialize(str(tmp_path / "broken.db"))
+
+            assert repository._db.execute("SELECT COUNT(*) FROM verses").fetchone()[0] == 0
+
+    def test_reopen_existing_database(self, repo, tmp_path) -> None:
+        """Test an existing database is reused without a source."""
+        repo.close()
+
+        with BibleRepository() as reopened:
+            reopened.initialize(str(tmp_path / "bible.db"))
+
+            assert reopened.get_verse("exo", 1, 1) is not None
+            assert reopened.get_metadata()["format"] == "USFX"
+            assert reopened.schema == repo.schema
+
+    def test_database_without_chapters_is_migrated(self, repo, tmp_path) -> None:
+        """Test the chapters table is built when an older database is opened."""
+        repo._db.execute("DROP TABLE chapters")
+        repo._db.commit()
+        repo.close()
+
+        with BibleRepository() as reopened:
+            reopened.initialize(str(tmp_path / "bible.db"))
+
+            assert reopened.get_chapter_count("gen") == 2
+            assert reopened.get_book_outline("gen") == {1: 3, 2: 1}
+
+
+    def test_text_keyed_database_is_migrated(self, tmp_path) -> None:
+        """Test databases storing text book ids in verses are rebuilt with integer keys."""
+        create_text_keyed_database(tmp_path / "legacy.db")
+
+        with BibleRepository(xml_string=SAMPLE_USFX_XML) as fresh:
+            fresh.initialize(str(tmp_path / "fresh.db"))
+            expected = fresh.get_book_digests()
+
+        with BibleRepository() as reopened:
+            reopened.initialize(str(tmp_path / "legacy.db"))
+
+            columns = [row[1] for row in reopened._db.execute("PRAGMA table_info(verses)")]
+            assert columns == ["id", "book_key", "chapter_num", "verse_num", "text"]
+            assert reopened.get_book_digests() == expected
+            assert reopened.get_verse("exo", 1, 1).book_id == "exo"
+            assert reopened.get_book_outline("gen") == {1: 3, 2: 1}
+            assert [v.book_id for v in reopened.search_verses("light")] == ["gen"]
+            assert fts_is_consistent(reopened)
+
+    def test_verses_store_integer_book_keys(self, repo) -> None:
+        """Test verse rows reference books by key while the API returns text ids."""
+        keys = dict(repo._db.execute("SELECT id, key FROM books").fetchall())
+        stored = {row[0] for row in repo._db.execute("SELECT DISTINCT book_key FROM verses")}
+
+        assert stored == set(keys.values())
+        assert all(isinstance(key, int) for key in stored)
+        assert {verse.book_id for verse in repo.search_verses("earth")} == {"gen"}
+
+    def test_clustered_lookup_plan(self, tmp_path) -> None:
+        """Test the clustered layout answers verse lookups from its primary key."""
+        with BibleRepository(xml_string=SAMPLE_USFX_XML, schema="clustered") as repository:
+            repository.initialize(str(tmp_path / "clustered.db"))
+
+            plan = repository._db.execute(
+                "EXPLAIN QUERY PLAN SELECT text FROM verses "
+                "WHERE book_key = ? AND chapter_num = ? AND verse_num = ?",
+                (repository._book_key("gen"), 1, 1),
+            ).fetchall()
+
+            assert [row[3] for row in plan] == [
+                "SEARCH verses USING PRIMARY KEY (book_key=? AND chapter_num=? AND verse_num=?)"
+            ]
+            assert repository.get_metadata()["schema"] == "clustered"
+            assert fts_is_consistent(repository)
+
+    def test_unknown_schema(self) -> None:
+        """Test unsupported layouts are rejected."""
+        with pytest.raises(Exception, match="Unknown schema"):
+            BibleRepository(schema="columnar")
+
+
+    def test_read_only(self, repo, tmp_path) -> None:
+        """Test a read-only repository queries an existing database and cannot write."""
+        with BibleRepository() as reader:
+            reader.initialize(str(tmp_path / "bible.db"), read_only=True)
+
+            assert reader.get_verses("gen", 1) == repo.get_verses("gen", 1)
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                reader._db.execute("DELETE FROM verses")
+
+        with pytest.raises(Exception, match="does not exist"):
+            BibleRepository().initialize(str(tmp_path / "missing.db"), read_only=True)
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_read_only_rejects_old_layout(self, tmp_path) -> None:
+        """Test a database awaiting migration is reported instead of failing on queries."""
+        create_text_keyed_database(tmp_path / "legacy.db")
+
+        with pytest.raises(BibleParserException, match="open it once read-write"):
+            BibleRepository().initialize(str(tmp_path / "legacy.db"), read_only=True)
+
+        with BibleRepository() as writer:
+            writer.initialize(str(tmp_path / "legacy.db"))
+        with BibleRepository() as reader:
+            reader.initialize(str(tmp_path / "legacy.db"), read_only=True)
+
+            assert reader.get_database_digest()
+
+
+class TestBibleRepositoryConcordance:
+    """Tests for the positional word index."""
+
+    @pytest.fixture
+    def indexed(self, tmp_path):
+        """Sample repository loaded with the concordance index."""
+        with BibleRepository(xml_string=SAMPLE_USFX_XML, concordance=True) as repository:
+            repository.initialize(str(tmp_path / "indexed.db"))
+            yield repository
+
+    def test_concordance_positions(self, indexed) -> None:
+        """Test every occurrence is returned with its word position and offset."""
+        occurrences = indexed.get_concordance("Earth")
+
+        assert [(o.reference, o.position) for o in occurrences] == [
+            ("gen.1.1", 9), ("gen.1.2", 2), ("gen.2.1", 5)
+        ]
+        assert all(o.word == "earth" for o in occurrences)
+        assert occurrences[0].snippet(width=8) == "...and the [earth]."
+        assert len(indexed.get_concordance("the", limit=2)) == 2
+        assert indexed.get_concordance("nowhere") == []
+        with pytest.raises(ValueError, match="single word"):
+            indexed.get_concordance("the earth")
+
+    def test_word_frequencies(self, indexed) -> None:
+        """Test occurrences and verse counts per term, most frequent first."""
+        frequencies = indexed.get_word_frequencies(limit=3)
+
+        assert frequencies[0] == ("the", 8, 4)
+        assert [count for _, count, _ in frequencies] == sorted(
+            (count for _, count, _ in frequencies), reverse=True
+        )
+        assert indexed.get_word_frequency("LIGHT") == (2, 1)
+        assert indexed.get_word_frequency("darkness") == (0, 0)
+
+    def test_matches_retokenized_search(self, indexed) -> None:
+        """Test the index agrees with tokenizing full-text search results."""
+        for word in ("god", "and", "israel"):
+            expected = sum(
+                term == word
+                for verse in indexed.search_verses(word)
+                for _, _, term in tokenize(verse.text)
+            )
+            assert indexed.get_word_frequency(word)[0] == expected
+
+    def test_build_on_existing_database_and_sync(self, repo) -> None:
+        """Test the index can be added later and follows sync()."""
+        assert not repo.has_concordance()
+        with pytest.raises(Exception, match="build_concordance"):
+            repo.get_word_frequencies()
+
+        assert repo.build_concordance() == 47
+        repo.sync(xml_string=UPDATED_USFX_XML)
+
+        assert repo.get_word_frequency("void") == (0, 0)
+        assert [o.reference for o in repo.get_concordance("moses")] == ["lev.1.1"]
+
+    def test_sync_matches_full_rebuild(self, indexed, tmp_path) -> None:
+        """Test sync re-indexes changed verses to the same index a fresh load builds."""
+        def index(repository):
+            terms = repository._db.execute(
+                "SELECT term, verse_count, occurrences FROM terms ORDER BY term"
+            ).fetchall()
+            positions = repository._db.execute(
+                "SELECT t.term, b.id, v.chapter_num, v.verse_num, p.position, p.char_offset "
+                "FROM term_positions p JOIN terms t ON t.key = p.term_key "
+                "JOIN verses v ON v.id = p.verse_id JOIN books b ON b.key = v.book_key "
+                "ORDER BY 1, 2, 3, 4, 5"
+            ).fetchall()
+            return [tuple(row) for row in terms], [tuple(row) for row in positions]
+
+        indexed.sync(xml_string=UPDATED_USFX_XML)
+
+        with BibleRepository(xml_string=UPDATED_USFX_XML, concordance=True) as fresh:
+            fresh.initialize(str(tmp_path / "fresh.db"))
+
+            assert index(indexed) == index(fresh)
+        assert indexed.get_word_frequency("void") == (0, 0)
+        assert indexed._db.execute("SELECT 1 FROM terms WHERE term = 'void'").fetchone() is None
+
+    def test_concordance_plan(self, indexed) -> None:
+        """Test a word's occurrences are read without a sort."""
+        plan = [
+            row[3] for row in indexed._db.execute(
+                "EXPLAIN QUERY PLAN SELECT p.position FROM terms t "
+                "JOIN term_positions p ON p.term_key = t.key "
+                "WHERE t.term = 'earth' ORDER BY p.verse_id, p.position"
+            )
+        ]
+
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+
+class TestBibleRepositorySync:
+    """Tests for BibleRepository.sync."""
+
+    def test_sync_unchanged_source(self, repo) -> None:
+        """Test syncing the same source changes nothing."""
+        report = repo.sync(xml_string=SAMPLE_USFX_XML)
+
+        assert not report.changed
+        assert report.books_unchanged == 2
+
+    def test_sync_applies_verse_diff(self, repo) -> None:
+        """Test only changed verses and books are touched."""
+        report = repo.sync(xml_string=UPDATED_USFX_XML)
+
+        assert report.books_added == ["lev"]
+        assert report.books_removed == ["exo"]
+        assert report.books_changed == ["gen"]
+        assert report.books_unchanged == 0
+        assert (report.verses_inserted, report.verses_updated, report.verses_deleted) == (2, 1, 2)
+
+        assert [verse.num for verse in repo.get_verses("gen", 1)] == [1, 2, 4]
+        assert repo.get_verse("gen", 1, 2).text == "And the earth was formless and empty."
+        assert [book.id for book in repo.get_books()] == ["gen", "lev"]
+        assert "last_synced" in repo.get_metadata()
+        assert repo.get_book_outline("gen") == {1: 3, 2: 1}
+        assert repo.get_chapter_count("exo") == 0
+        assert repo.get_chapter_span("lev", 1) == (5, 5)
+
+    def test_sync_keeps_search_index_consistent(self, repo) -> None:
+        """Test updates and deletes flow through the FTS triggers."""
+        repo.sync(xml_string=UPDATED_USFX_XML)
+
+        assert repo.search_verses("void") == []
+        assert repo.search_verses("Israel") == []
+        assert len(repo.search_verses("formless")) == 1
+        assert len(repo.search_verses("Moses")) == 1
+        assert fts_is_consistent(repo)
+
+    def test_sync_split_book(self, tmp_path) -> None:
+        """Test a book split across several elements is diffed as one book."""
+        split = SAMPLE_USFX_XML.replace(
+            '    <c id="2">', '  </book>\n  <book id="GEN">\n    <c id="2">'
+        )
+        assert split.count('<book id="GEN">') == 2
+
+        with BibleRepository(xml_string=split) as repository:
+            repository.initialize(str(tmp_path / "split.db"))
+            report = repository.sync()
+
+            assert not report.changed
+            assert report.books_unchanged == 2
+            assert repository.get_verse_count("gen") == 4
+
+            report = repository.sync(xml_string=SAMPLE_USFX_XML)
+
+            assert not report.changed
+            assert repository.get_verse("gen", 1, 3).text.startswith("And God said")
+
+    def test_failed_sync_keeps_source(self, repo) -> None:
+        """Test a rolled back sync leaves the repository on its old source."""
+        with pytest.raises(Exception, match="Failed to sync"):
+            repo.sync(xml_string=UPDATED_USFX_XML[:-40])
+
+        assert repo.xml_string == SAMPLE_USFX_XML
+        assert not repo.sync().changed
+        assert [book.id for book in repo.get_books()] == ["gen", "exo"]
+
+
+class TestBibleRepositoryDigests:
+    """Tests for book-level content digests."""
+
+    def test_digests_match_for_identical_sources(self, repo, tmp_path) -> None:
+        """Test identical databases have identical digests."""
+        with BibleRepository(xml_string=SAMPLE_USFX_XML) as other:
+            other.initialize(str(tmp_path / "other.db"))
+
+            assert repo.compare_digests(other) == []
+            assert repo.get_database_digest() == other.get_database_digest()
+
+    def test_digests_identify_changed_books(self, repo, tmp_path) -> None:
+        """Test changed, added and removed books are reported."""
+        with BibleRepository(xml_string=UPDATED_USFX_XML) as other:
+            other.initialize(str(tmp_path / "other.db"))
+
+            assert repo.compare_digests(other) == ["gen", "exo", "lev"]
+            assert repo.get_book_digest("gen") != other.get_book_digest("gen")
+
+    def test_sync_updates_digests(self, repo, tmp_path) -> None:
+        """Test sync leaves digests equal to a fresh build of the new source."""
+        repo.sync(xml_string=UPDATED_USFX_XML)
+
+        with BibleRepository(xml_string=UPDATED_USFX_XML) as fresh:
+            fresh.initialize(str(tmp_path / "fresh.db"))
+
+            assert repo.get_book_digests() == fresh.get_book_digests()
+
+    @pytest.mark.skipif(
+        sqlite3.sqlite_version_info < (3, 35, 0), reason="DROP COLUMN needs SQLite 3.35+"
+    )
+    def test_legacy_database_is_migrated(self, repo, tmp_path) -> None:
+        """Test databases without a digest column are backfilled on open."""
+        expected = repo.get_book_digests()
+        repo._db.execute("ALTER TABLE books DROP COLUMN digest")
+        repo._db.execute("DROP TABLE metadata")
+        repo._db.commit()
+        repo.close()
+
+        with BibleRepository() as reopened:
+            reopened.initialize(str(tmp_path / "bible.db"))
+
+            assert reopened.get_book_digests() == expected
@@ -0,0 +1,145 @@
+"""Tests for the bible-parser command-line interface."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from bible_parser.cli import main
+from bible_parser.synthetic import bible_string, write_bible
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Synthetic USFX file with two books."""
+    path = tmp_path / "bible.xml"
+    path.write_text(bible_string("USFX", books=2, chapters=2, verses=3), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def database(source, tmp_path, capsys):
+    """Database built from the synthetic source through the CLI."""
+    path = tmp_path / "bible.db"
+    assert main(["build", str(source), str(path)]) == 0
+    capsys.readouterr()
+    return str(path)
+
+
+def run(capsys, *argv: str):
+    """Run the CLI and parse its JSON output."""
+    assert main(list(argv)) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+class TestCli:
+    """Tests for the build, lookup, search, export and bench subcommands."""
+
+    def test_build_then_sync(self, source, tmp_path, capsys) -> None:
+        """Test build loads a new database and syncs an existing one."""
+        database = str(tmp_path / "bible.db")
+
+        built = run(capsys, "build", str(source), database, "--schema", "clustered")
+        synced = run(capsys, "build", str(source), database)
+
+        assert built["books"] == 2 and built["verses"] == 12
+        assert synced["sync"]["books_unchanged"] == 2
+        assert synced["sync"]["verses_inserted"] == 0
+
+    def test_build_fills_empty_database(self, source, tmp_path, capsys) -> None:
+        """Test an existing but empty database is loaded once, not loaded and synced."""
+        database = tmp_path / "bible.db"
+        database.touch()
+
+        built = run(capsys, "build", str(source), str(database))
+
+        assert built["verses"] == 12
+        assert "sync" not in built
+
+    def test_build_directory(self, tmp_path, capsys) -> None:
+        """Test a directory of files is loaded into one multi-translation database."""
+        corpus = tmp_path / "corpus"
+        corpus.mkdir()
+        write_bible(corpus / "kjv.xml", "USFX", books=1, verses=2)
+        write_bible(corpus / "web.xml", "OSIS", books=1, verses=2)
+
+        result = run(capsys, "build", str(corpus), str(tmp_path / "all.db"), "--workers", "0")
+
+        assert [t["translation_id"] for t in result["translations"]] == ["kjv", "web"]
+        assert result["failed"] == 0
+
+    def test_lookup(self, database, capsys) -> None:
+        """Test references resolve to verses through BibleReferenceFormatter."""
+        result = run(capsys, "lookup", database, "Genesis 1:2-3", "Exodus 2:1")
+
+        assert [r["reference"] for r in result] == ["Genesis 1:2-3", "Exodus 2:1"]
+        assert [v["verse_num"] for v in result[0]["verses"]] == [2, 3]
+        assert result[1]["verses"][0]["book_id"] == "exo"
+
+    def test_search(self, database, capsys) -> None:
+        """Test search prints matching verses, honoring --limit."""
+        result = run(capsys, "--pretty", "search", database, "the", "--limit", "2")
+
+        assert len(result) == 2
+        assert set(result[0]) == {"book_id", "chapter_num", "verse_num", "text"}
+
+    def test_export(self, database, tmp_path, capsys) -> None:
+        """Test export writes a file and reports the count, or streams to stdout."""
+        result = run(capsys, "export", database, str(tmp_path / "gen.csv"), "--end-book", "gen")
+        assert result["verses"] == 6
+
+        assert main(["export", database, "-"]) == 0
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 12
+        assert json.loads(lines[0])["book_id"] == "gen"
+
+    def test_errors_exit_with_status_1(self, database, tmp_path, capsys) -> None:
+        """Test failures are reported on stderr instead of raising."""
+        assert main(["lookup", str(tmp_path / "missing.db"), "Genesis 1:1"]) == 1
+        assert "does not exist" in capsys.readouterr().err
+
+        assert main(["lookup", database, "Nowhere 1:1"]) == 1
+        assert "error" in capsys.readouterr().err
+
+    def test_bench_forwards_arguments(self, tmp_path) -> None:
+        """Test bench hands its arguments to the benchmark runner."""
+        output = tmp_path / "results.json"
+
+        status = main([
+            "bench", "run", "--formats", "USFX", "--schemas", "standard", "--books", "1",
+            "--chapters", "1", "--verses", "2", "--repeat", "1", "--lookups", "2",
+            "--overhead-calls", "2", "--workdir", str(tmp_path), "--output", str(output),
+        ])
+
+        assert status == 0
+        assert json.loads(output.read_text())["results"]
+
+    @pytest.mark.parametrize("argv", [["bench", "--help"], ["--pretty", "bench", "--help"]])
+    def test_bench_help_reaches_runner(self, capsys, argv) -> None:
+        """Test options after bench go to the benchmark runner, not to this parser."""
+        with pytest.raises(SystemExit) as exit_info:
+            main(argv)
+
+        assert exit_info.value.code == 0
+        assert "python -m bible_parser.benchmarks" in capsys.readouterr().out
+
+    @pytest.mark.parametrize("command", ["lookup", "export"])
+    def test_closed_stdout_is_quiet(self, tmp_path, command) -> None:
+        """Test a reader that stops early (e.g. head) causes no traceback."""
+        # Output well beyond a pipe buffer, so writing outlasts the reader
+        database = str(tmp_path / "large.db")
+        source = write_bible(tmp_path / "large.xml", "USFX", books=2)
+        assert main(["build", str(source), database]) == 0
+        argv = [database, "-"] if command == "export" else [database] + ["Genesis 1"] * 200
+        process = subprocess.Popen(
+            [sys.executable, "-m", "bible_parser", command, *argv],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        process.stdout.read(10)
+        process.stdout.close()
+        stderr = process.stderr.read().decode()
+        process.stderr.close()
+
+        assert process.wait() == 0
+        assert stderr == ""
@@ -0,0 +1,127 @@
+"""Tests for bulk corpus ingestion."""
+
+import gzip
+import zipfile
+
+import pytest
+from bible_parser import BibleRepository, MultiTranslationRepository
+from bible_parser.corpus import find_bible_files, ingest_corpus, translation_id_for
+
+
+KJV_USFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<usfx>
+  <book id="GEN">
+    <c id="1">
+      <v id="1">In the beginning God created the heaven and the earth.</v>
+      <v id="2">And the earth was without form, and void.</v>
+    </c>
+  </book>
+</usfx>
+"""
+
+LUT_ZEFANIA_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<XMLBIBLE>
+  <BIBLEBOOK bnumber="1" bname="Genesis" bsname="Gen">
+    <CHAPTER cnumber="1">
+      <VERS vnumber="1">Im Anfang schuf Gott Himmel und Erde.</VERS>
+    </CHAPTER>
+  </BIBLEBOOK>
+</XMLBIBLE>
+"""
+
+
+@pytest.fixture
+def corpus_dir(tmp_path):
+    """Directory with two good translations, one broken file and a multi-Bible zip."""
+    corpus = tmp_path / "corpus"
+    (corpus / "de").mkdir(parents=True)
+    (corpus / "kjv.xml").write_text(KJV_USFX_XML, encoding="utf-8")
+    (corpus / "de" / "LUT.xml.gz").write_bytes(gzip.compress(LUT_ZEFANIA_XML.encode("utf-8")))
+    (corpus / "broken.xml").write_text("<usfx><book id='GEN'>", encoding="utf-8")
+    (corpus / "notes.txt").write_text("not a Bible", encoding="utf-8")
+    with zipfile.ZipFile(corpus / "bundle.zip", "w") as archive:
+        archive.writestr("kjv.xml", KJV_USFX_XML)
+        archive.writestr("lut.xml", LUT_ZEFANIA_XML)
+    return corpus
+
+
+class TestCorpusDiscovery:
+    """Tests for finding corpus files."""
+
+    def test_find_bible_files(self, corpus_dir) -> None:
+        """Test plain and compressed XML files are found recursively, zip archives are not."""
+        names = [path.name for path in find_bible_files(corpus_dir)]
+
+        assert names == ["broken.xml", "LUT.xml.gz", "kjv.xml"]
+
+    def test_translation_id_for(self) -> None:
+        """Test translation keys drop extensions and case."""
+        assert translation_id_for("bibles/KJV.xml.gz") == "kjv"
+        assert translation_id_for("web.zip") == "web"
+
+
+class TestIngestCorpus:
+    """Tests for ingest_corpus."""
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_shared_database(self, corpus_dir, tmp_path, workers) -> None:
+        """Test translations stream into one database and failures are isolated."""
+        database = str(tmp_path / "bibles.db")
+
+        report = ingest_corpus(corpus_dir, database_name=database, workers=workers, batch_size=1)
+
+        assert [result.translation_id for result in report.succeeded] == ["lut", "kjv"]
+        assert [result.translation_id for result in report.failed] == ["broken"]
+        assert report.total_verses == 3
+
+        with MultiTranslationRepository() as repo:
+            repo.initialize(database)
+
+            assert sorted(repo.get_translations()) == ["kjv", "lut"]
+            assert repo.get_parallel("gen", 1, 1)["lut"].text.startswith("Im Anfang")
+            assert not repo.has_translation("broken")
+
+    def test_existing_translation_requires_replace(self, corpus_dir, tmp_path) -> None:
+        """Test a second run skips loaded translations unless replace=True."""
+        database = str(tmp_path / "bibles.db")
+        paths = [corpus_dir / "kjv.xml"]
+        ingest_corpus(paths, database_name=database, workers=0)
+
+        assert len(ingest_corpus(paths, database_name=database, workers=0).failed) == 1
+        assert ingest_corpus(paths, database_name=database, workers=0, replace=True).total_verses == 2
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_database_per_translation(self, corpus_dir, tmp_path, workers) -> None:
+        """Test one database is built per translation."""
+        output_dir = tmp_path / "dbs"
+
+        report = ingest_corpus(corpus_dir, output_dir=output_dir, workers=workers)
+
+        assert len(report.succeeded) == 2
+        assert sorted(path.name for path in output_dir.iterdir()) == ["kjv.db", "lut.db"]
+        with BibleRepository() as repo:
+            repo.initialize(str(output_dir / "lut.db"))
+
+            assert repo.get_metadata()["format"] == "ZEFANIA"
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_failed_replacement_keeps_database(self, corpus_dir, tmp_path, workers) -> None:
+        """Test a translation whose replacement fails keeps its previous database."""
+        output_dir = tmp_path / "dbs"
+        source = corpus_dir / "kjv.xml"
+        ingest_corpus([source], output_dir=output_dir, workers=workers)
+        source.write_text("<usfx><book id='GEN'>", encoding="utf-8")
+
+        report = ingest_corpus([source], output_dir=output_dir, workers=workers, replace=True)
+
+        assert len(report.failed) == 1
+        assert sorted(path.name for path in output_dir.iterdir()) == ["kjv.db"]
+        with BibleRepository() as repo:
+            repo.initialize(str(output_dir / "kjv.db"))
+
+            assert repo.get_verse_count("gen") == 2
+
+    def test_requires_one_destination(self, corpus_dir) -> None:
+        """Test the destination must be unambiguous."""
+        with pytest.raises(Exception):
+            ingest_corpus(corpus_dir)
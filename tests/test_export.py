@@ -0,0 +1,157 @@
+"""Tests for streaming verse export and Arrow/pandas conversion."""
+
+import csv
+import io
+import json
+import sys
+
+import pytest
+from bible_parser import BibleParser, BibleRepository, MultiTranslationRepository
+from bible_parser.export import VERSE_COLUMNS, export_format, rows_to_arrow
+from bible_parser.synthetic import bible_string
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with three small synthetic books."""
+    xml = bible_string("USFX", books=3, chapters=2, verses=3)
+    with BibleRepository(xml_string=xml) as repository:
+        repository.initialize(str(tmp_path / "bible.db"))
+        yield repository
+
+
+def all_verses(repository: BibleRepository):
+    """Every verse as a row tuple, read through the query API."""
+    return [
+        (verse.book_id, verse.chapter_num, verse.num, verse.text)
+        for book in repository.get_books()
+        for chapter in range(1, repository.get_chapter_count(book.id) + 1)
+        for verse in repository.get_verses(book.id, chapter)
+    ]
+
+
+class TestExport:
+    """Tests for BibleRepository.export and MultiTranslationRepository.export."""
+
+    def test_jsonl(self, repo, tmp_path) -> None:
+        """Test every verse is written as one JSON object per line, in reading order."""
+        count = repo.export(tmp_path / "verses.jsonl")
+
+        with open(tmp_path / "verses.jsonl", encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+
+        assert count == len(records) == 18
+        assert [tuple(record.values()) for record in records] == all_verses(repo)
+        assert list(records[0]) == ["book_id", "chapter_num", "verse_num", "text"]
+
+    def test_csv_to_file_object(self, repo) -> None:
+        """Test CSV export writes a header and round-trips through the csv module."""
+        buffer = io.StringIO()
+
+        repo.export(buffer, format="csv")
+
+        rows = list(csv.reader(io.StringIO(buffer.getvalue())))
+        assert rows[0] == ["book_id", "chapter_num", "verse_num", "text"]
+        assert [(b, int(c), int(v), t) for b, c, v, t in rows[1:]] == all_verses(repo)
+
+    def test_book_range(self, repo) -> None:
+        """Test start_book and end_book limit the export to a range of books."""
+        rows = list(repo.iter_verse_rows(start_book="exo", end_book="lev"))
+
+        assert {row[0] for row in rows} == {"exo", "lev"}
+        assert len(list(repo.iter_verse_rows(end_book="gen"))) == 6
+        with pytest.raises(Exception, match="Unknown book 'xyz'"):
+            list(repo.iter_verse_rows(start_book="xyz"))
+
+    def test_format_inference(self, tmp_path) -> None:
+        """Test formats are inferred from extensions and unknown ones rejected."""
+        assert export_format(tmp_path / "a.ndjson") == "jsonl"
+        assert export_format("verses.PARQUET") == "parquet"
+        with pytest.raises(ValueError, match="Cannot infer"):
+            export_format("verses.txt")
+
+    def test_multi_translation_export(self, tmp_path) -> None:
+        """Test translations are exported one after another with their id."""
+        with MultiTranslationRepository() as multi:
+            multi.initialize(str(tmp_path / "bibles.db"))
+            multi.add_translation("kjv", xml_string=bible_string("USFX", books=2, verses=2))
+            multi.add_translation("web", xml_string=bible_string("OSIS", books=1, verses=2))
+            buffer = io.StringIO()
+
+            count = multi.export(buffer, format="jsonl", translation_ids=["web", "kjv"])
+
+        records = [json.loads(line) for line in buffer.getvalue().splitlines()]
+        assert count == len(records)
+        assert records[0]["translation_id"] == "web"
+        assert records[-1]["translation_id"] == "kjv"
+        assert {record["book_id"] for record in records} == {"gen", "exo"}
+
+    def test_parquet_row_group_per_book(self, repo, tmp_path) -> None:
+        """Test Parquet output has one row group per book and the expected rows."""
+        parquet = pytest.importorskip("pyarrow.parquet")
+
+        repo.export(tmp_path / "verses.parquet")
+
+        file = parquet.ParquetFile(tmp_path / "verses.parquet")
+        assert file.metadata.num_row_groups == 3
+        table = file.read()
+        assert table.column_names == ["book_id", "chapter_num", "verse_num", "text"]
+        assert [tuple(row.values()) for row in table.to_pylist()] == all_verses(repo)
+
+    def test_parquet_without_pyarrow(self, repo, tmp_path, monkeypatch) -> None:
+        """Test Parquet export explains how to install the optional dependency."""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        with pytest.raises(ImportError, match=r"bible-xml-parser\[arrow\]"):
+            repo.export(tmp_path / "verses.parquet")
+
+
+class TestArrow:
+    """Tests for to_arrow() and to_pandas() on BibleParser and BibleRepository."""
+
+    def test_repository_to_arrow_in_batches(self, repo) -> None:
+        """Test the table matches the stored verses with one chunk per batch."""
+        pyarrow = pytest.importorskip("pyarrow")
+
+        table = repo.to_arrow(batch_size=5)
+
+        assert table.column_names == ["book_id", "chapter_num", "verse_num", "text"]
+        assert table.schema.field("verse_num").type == pyarrow.int32()
+        assert table.column("text").num_chunks == 4
+        assert [tuple(row.values()) for row in table.to_pylist()] == all_verses(repo)
+        assert repo.to_arrow(start_book="lev").num_rows == 6
+
+    def test_parser_to_arrow(self, repo) -> None:
+        """Test a table built from the parse stream matches the repository's."""
+        pytest.importorskip("pyarrow")
+        parser = BibleParser(bible_string("USFX", books=3, chapters=2, verses=3))
+
+        assert parser.to_arrow(batch_size=4).equals(repo.to_arrow())
+
+    def test_empty_stream(self) -> None:
+        """Test an empty row stream gives an empty table with the full schema."""
+        pytest.importorskip("pyarrow")
+
+        table = rows_to_arrow(iter(()), VERSE_COLUMNS)
+
+        assert table.num_rows == 0
+        assert table.column_names == list(VERSE_COLUMNS)
+
+    def test_to_pandas(self, repo) -> None:
+        """Test DataFrames are built from the Arrow table."""
+        pytest.importorskip("pyarrow")
+        pytest.importorskip("pandas")
+
+        frame = repo.to_pandas(end_book="gen")
+
+        assert list(frame.columns) == ["book_id", "chapter_num", "verse_num", "text"]
+        assert len(frame) == 6
+        assert frame["chapter_num"].max() == 2
+
+    def test_to_pandas_without_pandas(self, repo, monkeypatch) -> None:
+        """Test DataFrame conversion explains how to install the optional dependency."""
+        pytest.importorskip("pyarrow")
+        monkeypatch.setitem(sys.modules, "pandas", None)
+
+        with pytest.raises(ImportError, match=r"bible-xml-parser\[pandas\]"):
+            repo.to_pandas()
@@ -0,0 +1,54 @@
+"""Tests for lazy imports of the bible_parser package."""
+
+import subprocess
+import sys
+from typing import List
+
+import bible_parser
+
+
+def imported_modules(code: str) -> List[str]:
+    """Run code in a fresh interpreter and list the modules -X importtime reports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ]
+
+
+class TestLazyImports:
+    """Tests that public names load only the modules they need."""
+
+    def test_package_import_loads_nothing_else(self) -> None:
+        """Test importing the package imports none of its submodules or sqlite3."""
+        modules = imported_modules("import bible_parser")
+
+        assert "bible_parser" in modules
+        assert [m for m in modules if m.startswith("bible_parser.")] == []
+        assert "sqlite3" not in modules
+
+    def test_reference_formatter_only(self) -> None:
+        """Test BibleReferenceFormatter.is_valid_book needs no parser, XML or SQLite module."""
+        modules = imported_modules(
+            "from bible_parser import BibleReferenceFormatter\n"
+            "assert BibleReferenceFormatter.is_valid_book('John')"
+        )
+
+        assert "bible_parser.reference_formatter" in modules
+        for heavy in ("bible_parser.parsers", "bible_parser.bible_repository", "defusedxml",
+                      "sqlite3", "xml.etree.ElementTree"):
+            assert heavy not in modules
+
+    def test_public_names_resolve(self) -> None:
+        """Test every name in __all__ resolves and is listed by dir()."""
+        for name in bible_parser.__all__:
+            assert getattr(bible_parser, name).__name__ == name
+        assert set(bible_parser.__all__) <= set(dir(bible_parser))
+
+    def test_unknown_name(self) -> None:
+        """Test unknown attributes still raise AttributeError."""
+        assert not hasattr(bible_parser, "NoSuchThing")
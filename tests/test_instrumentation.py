@@ -0,0 +1,158 @@
+"""Tests for instrumentation hooks."""
+
+import pytest
+from bible_parser import BibleParser, BibleRepository, Instrumentation, MetricsRecorder
+from bible_parser.instrumentation import Histogram
+from bible_parser.synthetic import bible_string
+
+
+class CallLog(Instrumentation):
+    """Instrumentation that remembers every call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def timing(self, name, seconds, tags=None):
+        self.calls.append(("timing", name, tags))
+
+    def increment(self, name, value=1, tags=None):
+        self.calls.append(("increment", name, value))
+
+    def gauge(self, name, value, tags=None):
+        self.calls.append(("gauge", name, tags))
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_percentiles(self) -> None:
+        """Test percentiles land in the right bucket and stay within min/max."""
+        histogram = Histogram(bounds=(1.0, 2.0, 4.0, 8.0))
+        for value in (0.5, 1.5, 1.5, 3.0, 7.0):
+            histogram.record(value)
+
+        assert histogram.count == 5
+        assert histogram.min == 0.5
+        assert histogram.max == 7.0
+        assert histogram.mean == pytest.approx(2.7)
+        assert histogram.percentile(20) == 1.0
+        assert histogram.percentile(50) == 2.0
+        assert histogram.percentile(100) == 7.0
+
+    def test_overflow_and_empty(self) -> None:
+        """Test samples above the last bound and empty histograms."""
+        histogram = Histogram(bounds=(1.0,))
+        assert histogram.percentile(99) == 0.0
+
+        histogram.record(10.0)
+
+        assert histogram.counts == [0, 1]
+        assert histogram.percentile(99) == 10.0
+
+
+class TestMetricsRecorder:
+    """Tests for MetricsRecorder."""
+
+    def test_aggregates(self) -> None:
+        """Test timings, counters, gauges and per-tag breakdowns."""
+        metrics = MetricsRecorder()
+        metrics.timing("parse.book", 0.25, {"book": "gen"})
+        metrics.timing("parse.book", 0.5, {"book": "exo"})
+        metrics.timing("parse.book", 0.25, {"book": "gen"})
+        metrics.increment("load.verses", 10)
+        metrics.increment("load.verses", 5)
+        metrics.gauge("load.verses_per_second", 1.0)
+        metrics.gauge("load.verses_per_second", 2.0)
+        with metrics.timer("load.commit"):
+            pass
+
+        summary = metrics.summary()
+
+        assert summary["timings"]["parse.book"]["count"] == 3
+        assert summary["timings"]["load.commit"]["count"] == 1
+        assert summary["counters"] == {"load.verses": 15}
+        assert summary["gauges"] == {"load.verses_per_second": 2.0}
+        assert metrics.breakdown("parse.book", "book") == {"gen": 0.5, "exo": 0.5}
+        assert "parse.book" in metrics.report()
+
+        metrics.reset()
+        assert metrics.summary() == {"counters": {}, "gauges": {}, "timings": {}}
+
+
+class TestInstrumentedParsing:
+    """Tests for metrics emitted while parsing, loading and querying."""
+
+    @pytest.mark.parametrize("format", ["USFX", "OSIS", "ZEFANIA"])
+    def test_parser_metrics(self, format) -> None:
+        """Test per-book timings, counts and bytes read are reported."""
+        xml = bible_string(format, books=3, chapters=2, verses=5)
+        metrics = MetricsRecorder()
+
+        books = list(BibleParser(xml, instrumentation=metrics).books)
+
+        assert len(books) == 3
+        assert metrics.counters["parse.books"] == 3
+        assert metrics.counters["parse.verses"] == 30
+        assert metrics.counters["parse.bytes"] == len(xml.encode("utf-8"))
+        assert list(metrics.breakdown("parse.book", "book")) == [book.id for book in books]
+        assert metrics.histograms["parse.total"].count == 1
+        assert metrics.gauges["parse.verses_per_second"] > 0
+
+    def test_verse_stream_metrics(self) -> None:
+        """Test parse_verses reports totals without per-book timings."""
+        metrics = MetricsRecorder()
+
+        parser = BibleParser(bible_string("USFX", books=2, verses=3), instrumentation=metrics)
+
+        verses = list(parser.verses)
+
+        assert metrics.counters["parse.verses"] == len(verses)
+        assert "parse.book" not in metrics.histograms
+        assert "parse.books" not in metrics.counters
+
+    @pytest.mark.parametrize("pipeline", [True, False])
+    def test_repository_metrics(self, tmp_path, pipeline) -> None:
+        """Test load phases and query latencies are reported."""
+        metrics = MetricsRecorder()
+        xml = bible_string("USFX", books=2, chapters=3, verses=4)
+
+        with BibleRepository(xml_string=xml, pipeline=pipeline, instrumentation=metrics) as repo:
+            repo.initialize(str(tmp_path / "bible.db"))
+            repo.get_verse("gen", 1, 1)
+            repo.get_verse("gen", 99, 1)
+            repo.get_verses("gen", 2)
+            repo.get_verses_bulk([("gen", 1, 1), ("gen", 99, 1)])
+            repo.search_verses("light")
+
+        for name in ("load.wait", "load.digest", "load.insert"):
+            assert metrics.histograms[name].count == 2
+        for name in ("load.commit", "load.total", "repository.initialize", "parse.total"):
+            assert metrics.histograms[name].count == 1
+        assert metrics.counters["load.books"] == 2
+        assert metrics.counters["load.verses"] == 24
+        assert metrics.histograms["query.get_verse"].count == 2
+        assert metrics.histograms["query.get_verses"].count == 1
+        assert metrics.histograms["query.get_verses_bulk"].count == 1
+        assert metrics.histograms["query.search_verses"].count == 1
+        assert metrics.counters["query.rows"] >= 5
+
+    def test_custom_instrumentation(self, tmp_path) -> None:
+        """Test a subclass receives hooks, including from the parsing thread."""
+        log = CallLog()
+
+        xml = bible_string("OSIS", books=1, verses=2)
+
+        with BibleRepository(xml_string=xml, instrumentation=log) as repo:
+            repo.initialize(str(tmp_path / "bible.db"))
+
+        names = {name for _, name, _ in log.calls}
+        assert {"parse.book", "parse.read", "load.digest", "load.insert", "load.total"} <= names
+        assert ("timing", "parse.book", {"format": "OSIS", "book": "gen"}) in log.calls
+
+    def test_disabled_by_default(self, tmp_path) -> None:
+        """Test no instrumentation is attached unless requested."""
+        parser = BibleParser(bible_string("USFX", books=1, verses=2))
+
+        assert parser.instrumentation is None
+        assert parser._parser.instrumentation is None
+        assert BibleRepository().instrumentation is None
@@ -0,0 +1,281 @@
+"""Tests for MultiTranslationRepository."""
+
+import sqlite3
+
+import pytest
+from bible_parser import MultiTranslationRepository, BibleReferenceFormatter
+
+
+KJV_USFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<usfx>
+  <book id="GEN">
+    <c id="1">
+      <v id="1">In the beginning God created the heaven and the earth.</v>
+      <v id="2">And the earth was without form, and void.</v>
+    </c>
+  </book>
+  <book id="JHN">
+    <c id="3">
+      <v id="16">For God so loved the world, that he gave his only begotten Son.</v>
+    </c>
+  </book>
+</usfx>
+"""
+
+WEB_USFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<usfx>
+  <book id="GEN">
+    <c id="1">
+      <v id="1">In the beginning, God created the heavens and the earth.</v>
+    </c>
+  </book>
+</usfx>
+"""
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository with two translations loaded."""
+    with MultiTranslationRepository() as repository:
+        repository.initialize(str(tmp_path / "bibles.db"))
+        repository.add_translation("kjv", xml_string=KJV_USFX_XML)
+        repository.add_translation("web", xml_string=WEB_USFX_XML)
+        yield repository
+
+
+class TestMultiTranslationRepository:
+    """Tests for MultiTranslationRepository class."""
+
+    def test_translations_listed_in_load_order(self, repo) -> None:
+        """Test loaded translations are listed."""
+        assert repo.get_translations() == ["kjv", "web"]
+
+    def test_per_translation_lookup(self, repo) -> None:
+        """Test verses are scoped to their translation."""
+        verse = repo.get_verse("web", "gen", 1, 1)
+
+        assert verse is not None
+        assert verse.text.startswith("In the beginning, God")
+        assert len(repo.get_verses("kjv", "gen", 1)) == 2
+        assert repo.get_chapter_count("kjv", "jhn") == 1
+
+    def test_get_parallel(self, repo) -> None:
+        """Test a verse is fetched across translations."""
+        parallel = repo.get_parallel("gen", 1, 2)
+
+        assert list(parallel) == ["kjv", "web"]
+        assert parallel["kjv"].text == "And the earth was without form, and void."
+        assert parallel["web"] is None
+
+    def test_search_scoped_to_translation(self, repo) -> None:
+        """Test FTS search honours the translation filter."""
+        all_results = repo.search_verses("beginning")
+        web_results = repo.search_verses("beginning", translation_ids=["web"])
+
+        assert len(all_results["kjv"]) == 1
+        assert len(all_results["web"]) == 1
+        assert list(web_results) == ["web"]
+
+    def test_search_limit_per_translation(self, repo) -> None:
+        """Test the limit applies to each translation, not to all of them."""
+        results = repo.search_verses("earth", limit=1)
+
+        assert [len(verses) for verses in results.values()] == [1, 1]
+        assert results["web"][0].text.startswith("In the beginning, God")
+
+    def test_failed_replacement_keeps_translation(self, repo) -> None:
+        """Test a replace that fails to load leaves the existing translation intact."""
+        with pytest.raises(Exception, match="Failed to load"):
+            repo.add_translation("web", xml_string="<usfx><book id='GEN'>", replace=True)
+
+        assert repo.get_translations() == ["kjv", "web"]
+        assert repo.get_verse("web", "gen", 1, 1).text.startswith("In the beginning, God")
+        assert len(repo.search_verses("heavens", translation_ids=["web"])["web"]) == 1
+
+    def test_duplicate_translation_rejected(self, repo) -> None:
+        """Test loading an existing translation requires replace=True."""
+        with pytest.raises(Exception):
+            repo.add_translation("web", xml_string=WEB_USFX_XML)
+
+        repo.add_translation("web", xml_string=KJV_USFX_XML, replace=True)
+
+        assert len(repo.get_verses("web", "gen", 1)) == 2
+        assert len(repo.search_verses("beginning", translation_ids=["web"])["web"]) == 1
+
+    def test_remove_translation(self, repo) -> None:
+        """Test removing a translation clears its rows and search entries."""
+        repo.remove_translation("kjv")
+
+        assert repo.get_translations() == ["web"]
+        assert repo.get_verse("kjv", "gen", 1, 1) is None
+        assert repo.search_verses("loved") == {"web": []}
+
+    def test_staged_translations_commit_separately(self, repo, tmp_path) -> None:
+        """Test committing one staged translation writes nothing of another."""
+        repo.stage_translation("asv", "USFX")
+        repo.stage_translation("ylt", "USFX")
+        repo.stage_books("asv", [("gen", 1, "Genesis")])
+        repo.stage_books("ylt", [("gen", 1, "Genesis")])
+        repo.stage_verses("ylt", [("gen", 1, 1, "In the beginning of God's preparing")])
+        repo.stage_verses("asv", [("gen", 1, 1, "In the beginning God created")])
+
+        assert repo.commit_translation("asv") == 1
+        repo.stage_verses("ylt", [("gen", 1, 2, "and the earth hath existed waste")])
+        repo.close()
+
+        # Closing with ylt still staged leaves no trace of it in the file
+        with MultiTranslationRepository() as reopened:
+            reopened.initialize(str(tmp_path / "bibles.db"))
+
+            assert reopened.get_translations() == ["kjv", "web", "asv"]
+            assert reopened.get_parallel("gen", 1, 1)["asv"].text == "In the beginning God created"
+
+    def test_commit_staged_replacement(self, repo) -> None:
+        """Test a staged translation replaces a loaded one only with replace=True."""
+        repo.stage_translation("web", "USFX")
+        repo.stage_books("web", [("gen", 1, "Genesis")])
+        repo.stage_verses("web", [("gen", 1, 1, "Replacement")])
+
+        with pytest.raises(Exception, match="already loaded"):
+            repo.commit_translation("web")
+        assert repo.get_verse("web", "gen", 1, 1).text.startswith("In the beginning, God")
+
+        repo.stage_translation("web", "USFX")
+        repo.stage_books("web", [("gen", 1, "Genesis")])
+        repo.stage_verses("web", [("gen", 1, 1, "Replacement")])
+        repo.commit_translation("web", replace=True)
+
+        assert repo.get_verse("web", "gen", 1, 1).text == "Replacement"
+        assert repo.search_verses("Replacement")["web"][0].num == 1
+
+    def test_discard_staged_translation(self, repo) -> None:
+        """Test a discarded translation cannot be committed."""
+        repo.stage_translation("asv", "USFX")
+        repo.stage_verses("asv", [("gen", 1, 1, "In the beginning")])
+        repo.discard_translation("asv")
+
+        with pytest.raises(Exception, match="not staged"):
+            repo.commit_translation("asv")
+        assert not repo.has_translation("asv")
+
+    def test_translation_view_with_formatter(self, repo) -> None:
+        """Test a translation view works with BibleReferenceFormatter."""
+        verses = BibleReferenceFormatter.get_verses_from_reference(
+            "John 3:16", repo.translation("kjv")
+        )
+
+        assert len(verses) == 1
+        assert verses[0].book_id == "jhn"
+
+    def test_aligned_chapter_fills_gaps(self, repo) -> None:
+        """Test aligned grid rows contain explicit gaps."""
+        grid = repo.get_aligned_verses("gen", 1, translation_ids=["web", "kjv"])
+
+        assert [(row.chapter_num, row.verse_num) for row in grid] == [(1, 1), (1, 2)]
+        assert list(grid[0].verses) == ["web", "kjv"]
+        assert grid[0].verses["web"].text.startswith("In the beginning, God")
+        assert grid[1].verses["web"] is None
+        assert grid[1].verses["kjv"].num == 2
+
+    def test_aligned_whole_book_streams(self, repo) -> None:
+        """Test whole-book alignment without a chapter filter."""
+        rows = list(repo.iter_aligned_verses("jhn"))
+
+        assert len(rows) == 1
+        assert rows[0].verses == {"kjv": rows[0].verses["kjv"], "web": None}
+        assert rows[0].verses["kjv"].num == 16
+
+    def test_aligned_end_chapter_without_start(self, repo) -> None:
+        """Test an end chapter alone reads from the first chapter up to it."""
+        repo.stage_translation("asv", "USFX")
+        repo.stage_books("asv", [("gen", 1, "Genesis")])
+        repo.stage_verses("asv", [("gen", 1, 1, "In the beginning"), ("gen", 2, 1, "Thus")])
+        repo.commit_translation("asv")
+
+        grid = repo.get_aligned_verses("gen", translation_ids=["asv"], end_chapter_num=1)
+
+        assert [(row.chapter_num, row.verse_num) for row in grid] == [(1, 1)]
+
+    def test_aligned_collisions_are_merged(self, repo) -> None:
+        """Test two verses of a translation at one reference keep both texts."""
+        repo.add_translation("dup", xml_string="""<usfx><book id="GEN"><c id="1">
+            <v id="1">First half.</v><v id="1">Second half.</v>
+        </c></book></usfx>""")
+
+        row = repo.get_aligned_verses("gen", 1, translation_ids=["dup"])[0]
+
+        assert row.verses["dup"].text == "First half. Second half."
+        assert row.verses["dup"].num == 1
+        assert repo.get_parallel("gen", 1, 1)["dup"].text == "First half. Second half."
+
+    def test_chapter_counts_follow_translations(self, repo) -> None:
+        """Test chapter rows are written per translation and removed with it."""
+        repo.add_translation("web", xml_string=KJV_USFX_XML, replace=True)
+        repo.stage_translation("asv", "USFX")
+        repo.stage_books("asv", [("gen", 1, "Genesis")])
+        repo.stage_verses("asv", [("gen", 1, 1, "In the beginning"), ("gen", 2, 1, "Thus")])
+        repo.commit_translation("asv")
+        repo.remove_translation("kjv")
+
+        rows = repo._db.execute(
+            "SELECT b.translation_id, b.id, c.chapter_num, c.verse_count "
+            "FROM chapters c JOIN books b ON b.key = c.book_key ORDER BY c.book_key, c.chapter_num"
+        ).fetchall()
+        assert [tuple(row) for row in rows] == [
+            ("web", "gen", 1, 2), ("web", "jhn", 3, 1), ("asv", "gen", 1, 1), ("asv", "gen", 2, 1)
+        ]
+        assert repo.get_chapter_count("asv", "gen") == 2
+        assert repo.get_chapter_count("kjv", "gen") == 0
+
+    def test_aligned_grid_reads_index_order(self, repo) -> None:
+        """Test each translation's alignment rows are read without a sort."""
+        plan = [
+            row[3] for row in repo._db.execute(
+                "EXPLAIN QUERY PLAN SELECT a.verse_id FROM verse_alignment a "
+                "WHERE a.book_key = 1 AND a.chapter_num BETWEEN 1 AND 2 "
+                "ORDER BY a.chapter_num, a.verse_num, a.verse_id"
+            )
+        ]
+
+        assert not any("TEMP B-TREE" in step for step in plan)
+
+    def test_text_keyed_database_is_migrated(self, repo, tmp_path) -> None:
+        """Test databases keying verses by text ids are rebuilt with integer book keys."""
+        expected = repo.get_parallel("gen", 1, 1)
+        repo.close()
+
+        # Rewrite the database in the layout that stored both ids in every verse
+        # and alignment row
+        db = sqlite3.connect(str(tmp_path / "bibles.db"))
+        db.executescript("""
+            DROP TRIGGER verses_ai;
+            DROP TABLE verses_fts;
+            CREATE TABLE old_books AS SELECT translation_id, id, num, title FROM books;
+            CREATE TABLE old_verses AS
+                SELECT v.id, b.translation_id, b.id AS book_id, v.chapter_num, v.verse_num, v.text
+                FROM verses v JOIN books b ON b.key = v.book_key;
+            CREATE TABLE old_alignment AS
+                SELECT a.verse_id, b.translation_id, b.id AS book_id, a.chapter_num, a.verse_num
+                FROM verse_alignment a JOIN books b ON b.key = a.book_key;
+            DROP TABLE verse_alignment;
+            DROP TABLE chapters;
+            DROP TABLE verses;
+            DROP TABLE books;
+            ALTER TABLE old_books RENAME TO books;
+            ALTER TABLE old_verses RENAME TO verses;
+            ALTER TABLE old_alignment RENAME TO verse_alignment;
+            CREATE INDEX idx_alignment_lookup
+            ON verse_alignment (book_id, chapter_num, verse_num, translation_id);
+        """)
+        db.close()
+
+        with MultiTranslationRepository() as reopened:
+            reopened.initialize(str(tmp_path / "bibles.db"))
+
+            columns = [row[1] for row in reopened._db.execute("PRAGMA table_info(verses)")]
+            assert columns == ["id", "book_key", "chapter_num", "verse_num", "text"]
+            columns = [row[1] for row in reopened._db.execute("PRAGMA table_info(verse_alignment)")]
+            assert columns == ["verse_id", "book_key", "chapter_num", "verse_num"]
+            assert reopened.get_parallel("gen", 1, 1) == expected
+            assert reopened.get_chapter_count("kjv", "jhn") == 1
+            assert list(reopened.search_verses("loved", translation_ids=["kjv"])["kjv"])
@@ -135,6 +135,28 @@ class TestOsisParser:
         assert verses[0].book_id == "gen"
         assert "In the beginning" in verses[0].text
 
+    def test_notes_excluded_from_verse_text(self) -> None:
+        """Test text around notes is kept and note content is dropped."""
+        xml = """<osis><osisText>
+  <div type="book" osisID="Gen">
+    <verse osisID="Gen.1.1">In the <note>a footnote</note>beginning God</verse>
+    <verse sID="Gen.1.2" osisID="Gen.1.2"/>And the <note>another</note>earth<verse eID="Gen.1.2"/>
+  </div>
+</osisText></osis>"""
+
+        verses = list(OsisParser(xml).parse_verses())
+
+        assert [verse.text for verse in verses] == ["In the beginning God", "And the earth"]
+
+    def test_text_split_across_read_chunks(self) -> None:
+        """Test verses spanning the parser's read boundaries keep all their text."""
+        text = " ".join(f"word{i}" for i in range(20000))
+        xml = f'<osis><div type="book" osisID="Gen"><verse osisID="Gen.1.1">{text}</verse></div></osis>'
+
+        verses = list(OsisParser(xml).parse_verses())
+
+        assert verses[0].text == text
+
 
 class TestUsfxParser:
     """Tests for USFX parser."""
@@ -203,6 +225,17 @@ class TestUsfxParser:
         assert verses[0].book_id == "gen"
         assert "In the beginning" in verses[0].text
 
+    def test_text_after_notes_kept(self) -> None:
+        """Test text following footnotes and cross-references stays in the verse."""
+        xml = """<usfx><book id="GEN"><c id="1"/>
+  <v id="1"/>In the <f>a footnote</f>beginning <x>Joh 1:1</x>God<ve/>
+  <v id="2"/>And the earth
+</book></usfx>"""
+
+        verses = list(UsfxParser(xml).parse_verses())
+
+        assert [verse.text for verse in verses] == ["In the beginning God", "And the earth"]
+
 
 class TestZefaniaParser:
     """Tests for Zefania parser."""
@@ -234,3 +267,23 @@ class TestZefaniaParser:
         assert verses[0].chapter_num == 1
         assert verses[0].book_id.lower() == "gen"
         assert "In the beginning" in verses[0].text
+
+    def test_text_after_notes_kept(self) -> None:
+        """Test text following mid-verse notes and inside styles stays in the verse."""
+        xml = """<XMLBIBLE><BIBLEBOOK bnumber="1" bname="Genesis" bsname="Gen"><CHAPTER cnumber="1">
+  <VERS vnumber="1">In the <NOTE type="x-studynote">a note</NOTE>beginning <STYLE css="x">God</STYLE></VERS>
+  <VERS vnumber="2">And the <XREF fscope="43;1;1"/>earth <gr str="776">was</gr> void</VERS>
+</CHAPTER></BIBLEBOOK></XMLBIBLE>"""
+
+        verses = list(ZefaniaParser(xml).parse_verses())
+
+        assert [verse.text for verse in verses] == ["In the beginning God", "And the earth was void"]
+
+    def test_text_split_across_read_chunks(self) -> None:
+        """Test verses spanning the parser's read boundaries keep all their text."""
+        text = " ".join(f"word{i}" for i in range(20000))
+        xml = f'<XMLBIBLE><BIBLEBOOK bnumber="1"><CHAPTER cnumber="1"><VERS vnumber="1">{text}</VERS></CHAPTER></BIBLEBOOK></XMLBIBLE>'
+
+        verses = list(ZefaniaParser(xml).parse_verses())
+
+        assert verses[0].text == text
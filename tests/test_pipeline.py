@@ -0,0 +1,43 @@
+"""Tests for the background prefetch pipeline."""
+
+import threading
+
+import pytest
+from bible_parser.pipeline import prefetch
+
+
+class TestPrefetch:
+    """Tests for prefetch."""
+
+    def test_items_in_order(self) -> None:
+        """Test items pass through unchanged and in order."""
+        assert list(prefetch(range(100), maxsize=2)) == list(range(100))
+
+    def test_producer_error_reraised(self) -> None:
+        """Test an exception in the producer reaches the consumer."""
+        def produce():
+            yield 1
+            raise ValueError("bad book")
+
+        results = prefetch(produce())
+
+        assert next(results) == 1
+        with pytest.raises(ValueError, match="bad book"):
+            next(results)
+
+    def test_early_close_stops_producer(self) -> None:
+        """Test closing the consumer stops and closes the producer."""
+        closed = threading.Event()
+
+        def produce():
+            try:
+                for number in range(1000):
+                    yield number
+            finally:
+                closed.set()
+
+        results = prefetch(produce(), maxsize=1)
+        assert next(results) == 0
+        results.close()
+
+        assert closed.is_set()
@@ -0,0 +1,174 @@
+"""Tests for SQL profiling."""
+
+import threading
+
+import pytest
+from bible_parser import BibleRepository
+from bible_parser.profiling import QueryProfiler, normalize_sql, plan_warning
+from bible_parser.synthetic import bible_string
+
+
+class TestPlanWarning:
+    """Tests for plan step classification."""
+
+    @pytest.mark.parametrize("step, expected", [
+        ("SCAN books", "full table scan"),
+        ("SCAN verses USING COVERING INDEX idx_verses_lookup", "full index scan"),
+        ("USE TEMP B-TREE FOR ORDER BY", "temporary b-tree"),
+        ("SEARCH verses USING INDEX idx_verses_lookup (book_id=?)", None),
+        ("SCAN fts VIRTUAL TABLE INDEX 0:M4", None),
+        ("SCAN sqlite_master", None),
+    ])
+    def test_classification(self, step, expected) -> None:
+        """Test which plan steps are flagged."""
+        assert plan_warning(step) == expected
+
+    def test_normalize_sql(self) -> None:
+        """Test whitespace differences map to one statement."""
+        assert normalize_sql("\n  SELECT *\n  FROM t\n") == "SELECT * FROM t"
+
+
+class TestQueryProfiler:
+    """Tests for QueryProfiler."""
+
+    def test_records_calls_rows_and_plans(self) -> None:
+        """Test statements are timed, counted and explained once."""
+        profiler = QueryProfiler()
+        connection = profiler.connect(":memory:")
+        connection.execute("CREATE TABLE t (a INTEGER, b INTEGER)")
+        connection.executemany("INSERT INTO t VALUES (?, ?)", [(i, i % 5) for i in range(50)])
+        connection.commit()
+
+        for _ in range(3):
+            connection.execute("SELECT a FROM t WHERE b = ?", (1,)).fetchall()
+        cursor = connection.cursor()
+        cursor.execute("SELECT a FROM   t WHERE b = ?", (2,))
+        rows = list(cursor)
+
+        insert = profiler.statements["INSERT INTO t VALUES (?, ?)"]
+        select = profiler.statements["SELECT a FROM t WHERE b = ?"]
+        assert insert.calls == 50
+        assert insert.rows == 50
+        assert select.calls == 4
+        assert select.rows == 3 * 10 + len(rows)
+        assert select.total_time > 0
+        assert select.plan == ["SCAN t"]
+        assert profiler.full_scans() == [select]
+        assert "<-- full table scan" in profiler.report()
+
+        profiler.reset()
+        assert profiler.statements == {}
+
+    def test_trigger_runs(self) -> None:
+        """Test trigger programs are attributed to the statement that fired them."""
+        profiler = QueryProfiler()
+        connection = profiler.connect(":memory:")
+        connection.execute("CREATE TABLE t (a)")
+        connection.execute("CREATE TABLE log (a)")
+        connection.execute(
+            "CREATE TRIGGER t_ai AFTER INSERT ON t BEGIN INSERT INTO log VALUES (new.a); END"
+        )
+
+        connection.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+
+        insert = profiler.statements["INSERT INTO t VALUES (?)"]
+        assert insert.calls == 2
+        assert insert.runs > insert.calls
+
+    def test_executemany_streams_parameters(self) -> None:
+        """Test parameter sets are read as the statement runs, and still explained and counted."""
+        profiler = QueryProfiler()
+        connection = profiler.connect(":memory:")
+        connection.execute("CREATE TABLE t (a)")
+        events = []
+        connection.create_function("note", 1, lambda a: events.append(("run", a)) or a)
+
+        def rows():
+            for i in range(3):
+                events.append(("read", i))
+                yield (i,)
+
+        connection.executemany("INSERT INTO t SELECT note(?)", rows())
+        connection.executemany("INSERT INTO t SELECT note(?)", iter([]))
+
+        insert = profiler.statements["INSERT INTO t SELECT note(?)"]
+        assert events == [(step, i) for i in range(3) for step in ("read", "run")]
+        assert insert.calls == 3
+        assert insert.plan == ["SCAN CONSTANT ROW"]
+
+    def test_threads_keep_their_own_statement(self) -> None:
+        """Test statements running in other threads do not take each other's trace runs."""
+        paused, resume = threading.Event(), threading.Event()
+
+        def pause():
+            paused.set()
+            resume.wait(5)
+
+        def insert(profiler, wait):
+            connection = profiler.connect(":memory:", check_same_thread=False)
+            connection.execute("CREATE TABLE t (a)")
+            connection.execute("CREATE TABLE log (a)")
+            connection.execute(
+                "CREATE TRIGGER t_ai AFTER INSERT ON t BEGIN INSERT INTO log VALUES (new.a); END"
+            )
+            connection.create_function("pause", 0, pause if wait else lambda: None)
+            connection.execute("INSERT INTO t SELECT pause()")
+            return profiler.statements["INSERT INTO t SELECT pause()"].runs
+
+        expected = insert(QueryProfiler(), False)
+
+        profiler = QueryProfiler()
+        runs = []
+        thread = threading.Thread(target=lambda: runs.append(insert(profiler, True)))
+        thread.start()
+        assert paused.wait(5)
+        # Runs while the insert above is paused before its trigger fires
+        other = profiler.connect(":memory:")
+        other.execute("SELECT 1").fetchall()
+        resume.set()
+        thread.join(5)
+
+        assert runs == [expected]
+        assert profiler.statements["SELECT 1"].runs == 1
+
+
+class TestRepositoryProfiling:
+    """Tests for BibleRepository(profile=True)."""
+
+    def test_profile_report(self, tmp_path) -> None:
+        """Test repository statements are profiled with their plans."""
+        xml = bible_string("USFX", books=2, chapters=2, verses=3)
+
+        with BibleRepository(xml_string=xml, profile=True) as repo:
+            repo.initialize(str(tmp_path / "bible.db"))
+            repo.get_chapter_count("gen")
+            repo.get_verse("gen", 1, 1)
+            repo.get_books()
+            repo.search_verses("light")
+            report = repo.profile_report()
+            profiler = repo.profiler
+
+        statements = {stats.sql: stats for stats in profiler.statements.values()}
+        lookup = next(s for sql, s in statements.items() if "verse_num = ?" in sql)
+        assert lookup.calls == 1
+        assert lookup.rows == 1
+        assert all(step.startswith("SEARCH") for step in lookup.plan)
+        search = next(s for sql, s in statements.items() if "MATCH" in sql)
+        assert not search.warnings
+        assert any("FROM books ORDER BY num" in s.sql for s in profiler.full_scans())
+        chapter_count = statements[
+            "SELECT COUNT(*) as count FROM chapters "
+            "WHERE book_key = (SELECT key FROM books WHERE id = ?)"
+        ]
+        assert chapter_count.plan and not chapter_count.warnings
+        assert "FROM chapters WHERE book_key = (SELECT key FROM books WHERE id = ?)" in report
+        assert "COMMIT" in statements
+
+    def test_profiling_disabled(self, tmp_path) -> None:
+        """Test repositories are not profiled by default."""
+        with BibleRepository(xml_string=bible_string("USFX", books=1, verses=2)) as repo:
+            repo.initialize(str(tmp_path / "bible.db"))
+
+            assert repo.profiler is None
+            with pytest.raises(Exception, match="profile=True"):
+                repo.profile_report()
@@ -0,0 +1,146 @@
+"""Tests for the HTTP query service."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+from bible_parser import BibleRepository, MetricsRecorder
+from bible_parser.benchmarks.loadtest import request_mix, run_load_test
+from bible_parser.server import BibleServer, ResponseCache
+from bible_parser.synthetic import bible_string
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Database with three small synthetic books."""
+    path = str(tmp_path / "bible.db")
+    with BibleRepository(xml_string=bible_string("USFX", books=3, chapters=3, verses=4)) as repo:
+        repo.initialize(path)
+    return path
+
+
+@pytest.fixture
+def server(database):
+    """Instrumented server on a free port, running in a background thread."""
+    with BibleServer(database, port=0, pool_size=2, instrumentation=MetricsRecorder()) as server:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        thread.join()
+
+
+def get(server: BibleServer, path: str, **headers: str):
+    """GET a path and return (status, headers, decoded JSON body or None)."""
+    request = urllib.request.Request(server.url + path, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, response.headers, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        return e.code, e.headers, json.loads(body) if body else None
+
+
+class TestBibleServer:
+    """Tests for the endpoints, ETags and caching of BibleServer."""
+
+    def test_endpoints(self, server) -> None:
+        """Test books, lookup, range, bulk and search answers."""
+        assert [book["id"] for book in get(server, "/books")[2]] == ["gen", "exo", "lev"]
+
+        lookup = get(server, "/lookup?ref=Genesis+1:2-3&ref=Exodus+2:1")[2]
+        assert [v["verse_num"] for v in lookup[0]["verses"]] == [2, 3]
+        assert lookup[1]["verses"][0]["book_id"] == "exo"
+
+        verses = get(server, "/range?book=gen&chapter=1&start=3&end_chapter=2&end=2")[2]
+        assert [(v["chapter_num"], v["verse_num"]) for v in verses] == [
+            (1, 3), (1, 4), (2, 1), (2, 2)
+        ]
+
+        bulk = get(server, "/bulk?refs=lev.3.4,gen.9.9,exo.1.1")[2]
+        assert [v and (v["book_id"], v["chapter_num"]) for v in bulk] == [
+            ("lev", 3), None, ("exo", 1)
+        ]
+
+        assert len(get(server, "/search?q=the&limit=2")[2]) == 2
+
+    def test_etag_revalidation(self, server) -> None:
+        """Test a matching If-None-Match is answered 304 and parameter order is ignored."""
+        status, headers, _ = get(server, "/range?book=gen&chapter=1")
+        etag = headers["ETag"]
+
+        assert status == 200
+        assert get(server, "/range?chapter=1&book=gen", **{"If-None-Match": etag})[0] == 304
+        assert get(server, "/range?book=gen&chapter=2", **{"If-None-Match": etag})[0] == 200
+        assert server.instrumentation.counters["server.not_modified"] == 1
+
+    def test_responses_are_cached(self, server) -> None:
+        """Test repeated requests are served from the response cache."""
+        first = get(server, "/bulk?refs=gen.1.1")[2]
+        second = get(server, "/bulk?refs=gen.1.1")[2]
+
+        assert first == second
+        assert server.instrumentation.counters["cache.miss"] == 1
+        assert server.instrumentation.counters["cache.hit"] == 1
+        assert "/bulk" in server.instrumentation.breakdown("server.request", "endpoint")
+
+    def test_errors(self, server) -> None:
+        """Test invalid requests get JSON errors without being cached."""
+        assert get(server, "/nope")[0] == 404
+        status, _, body = get(server, "/bulk?refs=gen.1")
+        assert status == 400 and "book.chapter.verse" in body["error"]
+        assert get(server, "/range?book=gen&chapter=zero")[0] == 400
+        assert get(server, "/lookup?ref=Nowhere+1:1")[0] == 400
+        assert get(server, "/range?book=gen&chapter=2&end_chapter=1")[0] == 400
+        status, _, body = get(server, "/search?q=AND")
+        assert status == 400 and "Invalid search query" in body["error"]
+        assert get(server, "/bulk?refs=gen.1", **{"If-None-Match": "*"})[0] == 400
+        assert len(server.cache) == 0
+        get(server, "/nope/again")
+        endpoints = server.instrumentation.breakdown("server.request", "endpoint")
+        assert {"other", "/bulk", "/range"} <= set(endpoints)
+        assert not any(endpoint.startswith("/nope") for endpoint in endpoints)
+
+    def test_range_clamped_to_book(self, server) -> None:
+        """Test end_chapter beyond the book stops at its last chapter."""
+        verses = get(server, "/range?book=gen&chapter=3&end_chapter=100000000")[2]
+
+        assert [(v["chapter_num"], v["verse_num"]) for v in verses] == [
+            (3, 1), (3, 2), (3, 3), (3, 4)
+        ]
+        # The verse bound belongs to the requested end chapter, not the clamped one
+        assert get(server, "/range?book=gen&chapter=3&end_chapter=60&end=2")[2] == verses
+        assert get(server, "/range?book=gen&chapter=1", **{"If-None-Match": "*"})[0] == 304
+
+    def test_missing_database(self, tmp_path) -> None:
+        """Test the server refuses to serve a database that does not exist."""
+        with pytest.raises(Exception, match="does not exist"):
+            BibleServer(str(tmp_path / "missing.db"), port=0)
+
+    def test_load_test(self, server, database) -> None:
+        """Test the load test script drives every endpoint successfully."""
+        paths = request_mix(database, count=20)
+
+        result = run_load_test(server.url, paths, requests=60, concurrency=3, revalidate=True)
+
+        assert result.requests == result.latency.count == 60
+        assert set(result.statuses) <= {200, 304}
+        assert {path.split("?")[0] for path in paths} == {
+            "/range", "/bulk", "/lookup", "/search", "/books"
+        }
+
+
+class TestResponseCache:
+    """Tests for the LRU response cache."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the oldest unused entry is evicted beyond maxsize."""
+        cache = ResponseCache(maxsize=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")
+        cache.put("c", b"3")
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == (b"1", None, b"3")
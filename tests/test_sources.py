@@ -0,0 +1,184 @@
+"""Tests for compressed, archived and in-memory Bible sources."""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zipfile
+
+import pytest
+from bible_parser import BibleParser, BibleRepository
+from bible_parser.errors import FormatDetectionError, ParseError
+from bible_parser.sources import ArchiveMember, open_source
+
+
+SAMPLE_USFX_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<usfx>
+  <book id="GEN">
+    <c id="1">
+      <v id="1">In the beginning God created the heaven and the earth.</v>
+      <v id="2">And the earth was without form, and void.</v>
+    </c>
+  </book>
+</usfx>
+"""
+
+SAMPLE_ZEFANIA_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<XMLBIBLE>
+  <BIBLEBOOK bnumber="1" bname="Genesis" bsname="Gen">
+    <CHAPTER cnumber="1">
+      <VERS vnumber="1">Im Anfang schuf Gott Himmel und Erde.</VERS>
+    </CHAPTER>
+  </BIBLEBOOK>
+</XMLBIBLE>
+"""
+
+COMPRESSORS = {
+    "gz": gzip.compress,
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+
+
+def write_zip(path, members):
+    """Write a zip archive with the given {name: content} members."""
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for name, content in members.items():
+            zf.writestr(name, content)
+
+
+class TestCompressedSources:
+    """Tests for on-the-fly decompression."""
+
+    @pytest.mark.parametrize("suffix", sorted(COMPRESSORS))
+    def test_compressed_file(self, tmp_path, suffix) -> None:
+        """Test gzip, bzip2 and xz files are detected and parsed."""
+        path = tmp_path / f"bible.xml.{suffix}"
+        path.write_bytes(COMPRESSORS[suffix](SAMPLE_USFX_XML.encode("utf-8")))
+
+        parser = BibleParser(str(path))
+
+        assert parser.format == "USFX"
+        assert len(list(parser.verses)) == 2
+        assert len(list(parser.verses)) == 2
+
+    def test_single_bible_zip(self, tmp_path) -> None:
+        """Test a zip holding one Bible is read like a plain file."""
+        path = tmp_path / "bible.zip"
+        write_zip(path, {"readme.txt": "notes", "bible.xml": SAMPLE_ZEFANIA_XML})
+
+        parser = BibleParser(path)
+
+        assert parser.format == "ZEFANIA"
+        assert list(parser.verses)[0].text.startswith("Im Anfang")
+
+    def test_multi_bible_zip_requires_selection(self, tmp_path) -> None:
+        """Test a zip with several Bibles must be iterated or addressed."""
+        path = tmp_path / "bibles.zip"
+        write_zip(path, {"kjv.xml": SAMPLE_USFX_XML, "lut.xml": SAMPLE_ZEFANIA_XML})
+
+        with pytest.raises(ParseError):
+            open_source(str(path))
+
+        parsers = dict(BibleParser.iter_archive(path))
+
+        assert list(parsers) == ["kjv.xml", "lut.xml"]
+        assert parsers["kjv.xml"].format == "USFX"
+        assert parsers["lut.xml"].format == "ZEFANIA"
+        assert len(list(parsers["kjv.xml"].verses)) == 2
+
+    def test_iter_archive_releases_skipped_members(self, tmp_path) -> None:
+        """Test members the caller does not parse are closed as iteration moves on."""
+        path = tmp_path / "bibles.zip"
+        write_zip(path, {"kjv.xml": SAMPLE_USFX_XML, "lut.xml": SAMPLE_ZEFANIA_XML})
+
+        handles = [parser._parser._stream for _, parser in BibleParser.iter_archive(path)]
+
+        assert all(handle.closed for handle in handles)
+
+    def test_gzip_file_object_not_closed(self) -> None:
+        """Test compressed file objects are parsed and left open."""
+        fileobj = io.BytesIO(gzip.compress(SAMPLE_USFX_XML.encode("utf-8")))
+
+        parser = BibleParser(fileobj)
+        verses = list(parser.verses)
+
+        assert len(verses) == 2
+        assert not fileobj.closed
+
+    def test_repository_from_compressed_archive_member(self, tmp_path) -> None:
+        """Test BibleRepository loads from an archive member."""
+        path = tmp_path / "bibles.zip"
+        write_zip(path, {"kjv.xml": SAMPLE_USFX_XML, "lut.xml": SAMPLE_ZEFANIA_XML})
+
+        with BibleRepository(xml_path=ArchiveMember(path, "lut.xml")) as repo:
+            repo.initialize(str(tmp_path / "lut.db"))
+
+            assert repo.get_verse("gen", 1, 1) is not None
+
+
+def iter_chunks(data: bytes, size: int = 7):
+    """Yield data in small chunks, like an HTTP response body."""
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+class TestStreamingSources:
+    """Tests for buffer, file object and chunk iterator sources."""
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_buffer_source(self, wrap) -> None:
+        """Test bytes-like buffers are parsed without decoding to str."""
+        parser = BibleParser(wrap(SAMPLE_USFX_XML.encode("utf-8")))
+
+        assert parser.format == "USFX"
+        assert len(list(parser.verses)) == 2
+
+    def test_compressed_buffer(self) -> None:
+        """Test compressed buffers are decompressed."""
+        parser = BibleParser(bz2.compress(SAMPLE_ZEFANIA_XML.encode("utf-8")))
+
+        assert parser.format == "ZEFANIA"
+
+    def test_chunk_iterator_detected_and_parsed(self) -> None:
+        """Test the sniffed prefix is replayed for one-shot iterators."""
+        parser = BibleParser(iter_chunks(SAMPLE_USFX_XML.encode("utf-8")))
+
+        assert parser.format == "USFX"
+        assert [verse.num for verse in parser.verses] == [1, 2]
+
+    def test_compressed_chunk_iterator_with_explicit_format(self) -> None:
+        """Test a gzip body streamed in chunks with a known format."""
+        body = gzip.compress(SAMPLE_ZEFANIA_XML.encode("utf-8"))
+
+        parser = BibleParser(iter_chunks(body, size=5), format="ZEFANIA")
+
+        assert list(parser.verses)[0].text.startswith("Im Anfang")
+
+    def test_non_seekable_file_object(self) -> None:
+        """Test pipe-like file objects are parsed in a single pass."""
+        read_fd, write_fd = os.pipe()
+        with os.fdopen(write_fd, "wb") as writer:
+            writer.write(SAMPLE_USFX_XML.encode("utf-8"))
+
+        with os.fdopen(read_fd, "rb", buffering=0) as reader:
+            parser = BibleParser(reader)
+
+            assert parser.format == "USFX"
+            assert len(list(parser.verses)) == 2
+
+    def test_non_xml_string_is_a_path(self, tmp_path) -> None:
+        """Test a str that is not XML is never parsed as content."""
+        with pytest.raises(FormatDetectionError, match="not a valid file"):
+            BibleParser(str(tmp_path / "missing.xml"))
+
+    def test_repository_from_chunk_iterator(self, tmp_path) -> None:
+        """Test BibleRepository loads from an iterator and records a placeholder source."""
+        chunks = iter_chunks(SAMPLE_USFX_XML.encode("utf-8"), size=64)
+
+        with BibleRepository(xml_path=chunks) as repo:
+            repo.initialize(str(tmp_path / "bible.db"))
+
+            assert len(repo.get_verses("gen", 1)) == 2
+            assert repo.get_metadata()["source"] == "<iterator>"
@@ -0,0 +1,118 @@
+"""Tests for the synthetic Bible generator."""
+
+import re
+
+import pytest
+from bible_parser import BibleParser
+from bible_parser.errors import ParserUnavailableError
+from bible_parser.synthetic import (
+    FORMATS,
+    bible_string,
+    books_for_size,
+    main,
+    parse_size,
+    write_bible,
+)
+
+
+def _texts(source, format=None):
+    """Return (chapter, verse, text) for every parsed verse."""
+    return [
+        (verse.chapter_num, verse.num, verse.text)
+        for verse in BibleParser(source, format=format).verses
+    ]
+
+
+class TestSyntheticBible:
+    """Tests for generate_bible and its helpers."""
+
+    @pytest.mark.parametrize("format", FORMATS)
+    def test_generated_bible_parses(self, format) -> None:
+        """Test every format is detected and parsed with the requested shape."""
+        parser = BibleParser(bible_string(format, books=3, chapters=2, verses=4, words=5))
+
+        books = list(parser.books)
+
+        assert parser.format == format
+        assert [book.title for book in books] == ["Genesis", "Exodus", "Leviticus"]
+        assert all(len(book.verses) == 8 for book in books)
+        assert len(books[0].verses[0].text.split()) == 5
+
+    def test_full_size_defaults(self) -> None:
+        """Test the default shape follows the canon."""
+        books = list(BibleParser(bible_string("USFX", words=1)).books)
+
+        assert len(books) == 66
+        assert len(books[18].chapters) == 150
+        assert 25_000 < sum(len(book.verses) for book in books) < 40_000
+
+    def test_deterministic(self, tmp_path) -> None:
+        """Test the same options give the same bytes and the seed changes them."""
+        first = write_bible(tmp_path / "a.xml", "OSIS", books=2, seed=7).read_bytes()
+        second = write_bible(tmp_path / "b.xml", "OSIS", books=2, seed=7).read_bytes()
+
+        assert first == second
+        assert bible_string("OSIS", books=2, seed=8).encode("utf-8") != first
+
+    def test_unknown_format(self) -> None:
+        """Test unsupported formats are rejected."""
+        with pytest.raises(ParserUnavailableError):
+            bible_string("USFM")
+
+    @pytest.mark.parametrize("format", FORMATS)
+    @pytest.mark.parametrize("milestones", [False, True])
+    def test_markup_does_not_change_text(self, format, milestones) -> None:
+        """Test notes, cross-references, namespaces and milestones leave verse text intact."""
+        plain = _texts(bible_string("ZEFANIA", books=2))
+        marked = _texts(bible_string(
+            format, books=2, notes=0.5, xrefs=0.5, namespaces=False, milestones=milestones,
+        ))
+
+        assert marked == plain
+
+    @pytest.mark.parametrize("format, end_tag", [
+        ("USFX", "</f>"), ("OSIS", "</note>"), ("ZEFANIA", "</NOTE>"),
+    ])
+    def test_notes_placed_mid_verse(self, format, end_tag) -> None:
+        """Test every format places notes where verse text follows them."""
+        xml = bible_string(format, books=1, notes=1.0)
+
+        assert re.search(re.escape(end_tag) + r" \w", xml)
+
+    @pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+    def test_compressed_output(self, tmp_path, suffix) -> None:
+        """Test files are compressed by suffix and read back transparently."""
+        path = write_bible(tmp_path / f"bible.xml{suffix}", "USFX", books=1, verses=3)
+
+        assert path.read_bytes()[:1] != b"<"
+        assert _texts(path) == _texts(bible_string("USFX", books=1, verses=3))
+
+    def test_books_for_size(self) -> None:
+        """Test the book estimate lands near the requested size."""
+        target = 2 * len(bible_string("OSIS", words=5).encode("utf-8"))
+
+        books = books_for_size(target, "OSIS", words=5)
+        size = len(bible_string("OSIS", books=books, words=5).encode("utf-8"))
+
+        assert books > 66
+        assert 0.8 * target < size < 1.2 * target
+
+    def test_parse_size(self) -> None:
+        """Test human-readable sizes."""
+        assert parse_size("512") == 512
+        assert parse_size("2K") == 2048
+        assert parse_size("1.5M") == 1536 * 1024
+        assert parse_size("2gb") == 2 * 1024 ** 3
+        with pytest.raises(ValueError):
+            parse_size("big")
+
+    def test_command_line(self, tmp_path, capsys) -> None:
+        """Test the command-line entry point writes the requested document."""
+        output = tmp_path / "bible.xml.gz"
+
+        assert main(["osis", str(output), "--books", "2", "--milestones", "--notes", "0.2"]) == 0
+
+        assert "2 books" in capsys.readouterr().out
+        parser = BibleParser(output)
+        assert [book.title for book in parser.books] == ["Genesis", "Exodus"]
+        assert parser.format == "OSIS"
@@ -0,0 +1,138 @@
+"""Tests for versification mapping."""
+
+import pytest
+from bible_parser import BibleReferenceFormatter, MultiTranslationRepository
+from bible_parser.errors import VersificationError
+from bible_parser.models import BibleReference, VerseRange
+from bible_parser.versification import (
+    VersificationMapper,
+    get_mapper,
+    normalize_book_id,
+    CANONICAL_BOOK_IDS,
+)
+
+
+class TestVersificationMapper:
+    """Tests for VersificationMapper class."""
+
+    def test_greek_psalm_numbering(self) -> None:
+        """Test KJV Psalms map to Greek numbering."""
+        mapper = VersificationMapper("KJV", "LXX")
+
+        assert mapper.map("psa", 8, 3) == ("psa", 8, 3)
+        assert mapper.map("psa", 10, 1) == ("psa", 9, 21)
+        assert mapper.map("psa", 23, 1) == ("psa", 22, 1)
+        assert mapper.map("psa", 115, 1) == ("psa", 113, 9)
+        assert mapper.map("psa", 116, 10) == ("psa", 115, 1)
+        assert mapper.map("psa", 147, 12) == ("psa", 147, 1)
+        assert mapper.map("psa", 150, 6) == ("psa", 150, 6)
+
+    def test_joel_and_malachi_chapter_splits(self) -> None:
+        """Test Joel and Malachi map to Hebrew chapter divisions."""
+        mapper = VersificationMapper("KJV", "HEBREW")
+
+        assert mapper.map("jol", 2, 27) == ("jol", 2, 27)
+        assert mapper.map("jol", 2, 28) == ("jol", 3, 1)
+        assert mapper.map("jol", 3, 21) == ("jol", 4, 21)
+        assert mapper.map("mal", 4, 6) == ("mal", 3, 24)
+
+    def test_round_trip(self) -> None:
+        """Test mapping there and back returns the original reference."""
+        forward = VersificationMapper("KJV", "LXX")
+        backward = VersificationMapper("LXX", "KJV")
+
+        for reference in [("psa", 10, 18), ("psa", 116, 19), ("jol", 2, 32), ("mal", 4, 1)]:
+            assert backward.map(*forward.map(*reference)) == reference
+
+    def test_between_non_pivot_schemes(self) -> None:
+        """Test mapping between two non-KJV schemes."""
+        assert VersificationMapper("VULGATE", "HEBREW").map("psa", 22, 1) == ("psa", 23, 1)
+        assert VersificationMapper("VULGATE", "LXX").map("mal", 4, 1) == ("mal", 3, 19)
+
+    def test_book_id_is_preserved(self) -> None:
+        """Test OSIS book ids are recognized and returned unchanged."""
+        assert get_mapper("kjv", "lxx").map("ps", 23, 1) == ("ps", 22, 1)
+
+    def test_map_many(self) -> None:
+        """Test batch mapping keeps input order."""
+        mapper = VersificationMapper("KJV", "LXX")
+
+        assert mapper.map_many([("psa", 23, 1), ("gen", 1, 1)]) == [
+            ("psa", 22, 1),
+            ("gen", 1, 1),
+        ]
+
+    def test_unknown_scheme(self) -> None:
+        """Test unknown schemes raise VersificationError."""
+        with pytest.raises(VersificationError):
+            VersificationMapper("KJV", "NRSV")
+
+
+class TestNormalizeBookId:
+    """Tests for normalize_book_id function."""
+
+    def test_osis_ids(self) -> None:
+        """Test OSIS ids normalize to canonical ids."""
+        assert normalize_book_id("Ps") == "psa"
+        assert normalize_book_id("1Sam") == "1sa"
+        assert normalize_book_id("Matt") == "mat"
+
+    def test_canonical_ids_unchanged(self) -> None:
+        """Test canonical ids are already normalized."""
+        assert all(normalize_book_id(book_id) == book_id for book_id in CANONICAL_BOOK_IDS)
+
+
+class TestMapReference:
+    """Tests for BibleReferenceFormatter.map_reference."""
+
+    def test_chapter_only(self) -> None:
+        """Test chapter-only references map by chapter."""
+        ref = BibleReference(book_id="psa", chapter_num=23, is_chapter_only=True)
+
+        assert BibleReferenceFormatter.map_reference(ref, "KJV", "LXX").chapter_num == 22
+
+    def test_range_crossing_chapter_split(self) -> None:
+        """Test a range spanning a chapter split becomes multi-chapter."""
+        ref = BibleReference(book_id="jol", chapter_num=2, verse_num=27, end_verse_num=29)
+
+        mapped = BibleReferenceFormatter.map_reference(ref, "KJV", "HEBREW")
+
+        assert (mapped.chapter_num, mapped.verse_num) == (2, 27)
+        assert (mapped.end_chapter_num, mapped.end_verse_num) == (3, 2)
+
+    def test_additional_verses_split(self) -> None:
+        """Test additional ranges are split at chapter boundaries."""
+        ref = BibleReference(
+            book_id="jol",
+            chapter_num=1,
+            verse_num=1,
+            additional_verses=[VerseRange(chapter_num=2, start_verse=31, end_verse=32)],
+        )
+
+        mapped = BibleReferenceFormatter.map_reference(ref, "KJV", "HEBREW")
+
+        assert mapped.additional_verses == [
+            VerseRange(chapter_num=3, start_verse=4, end_verse=5)
+        ]
+
+
+class TestCrossSchemeAlignment:
+    """Tests for versification-aware loading in MultiTranslationRepository."""
+
+    def test_parallel_across_schemes(self, tmp_path) -> None:
+        """Test translations with different numbering align on the same passage."""
+        kjv = """<usfx><book id="PSA"><c id="23"><v id="1">The LORD is my shepherd</v></c></book></usfx>"""
+        lxx = """<osis><osisText><div type="book" osisID="Ps">
+            <chapter osisID="Ps.22"><verse osisID="Ps.22.1">Kyrios poimainei me</verse></chapter>
+            </div></osisText></osis>"""
+
+        with MultiTranslationRepository() as repo:
+            repo.initialize(str(tmp_path / "bibles.db"))
+            repo.add_translation("kjv", xml_string=kjv)
+            repo.add_translation("lxx", xml_string=lxx, versification="LXX")
+
+            parallel = repo.get_parallel("psa", 23, 1)
+
+        assert parallel["kjv"].text == "The LORD is my shepherd"
+        assert parallel["lxx"].chapter_num == 22
+        assert parallel["lxx"].book_id == "ps"